@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+wxPomodoro - Simple pomodoro timer based on wxPython Phoenix GUI
+
+The MIT License (MIT)
+Copyright (C) 2017 Georgy Komarov <jubnzv@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import mmap
+import os
+import struct
+import time
+import zlib
+
+from Engine import NS, TIMER_STATUS
+
+
+class Checkpoint:
+    """Live state of PomodoroCycle kept in a small fixed-size file
+
+    The file is mapped to memory and rewritten in place on state
+    transitions only: the running phase is stored with its absolute
+    deadline, so no periodic writes are needed to restore the correct
+    remain time. It accepts the same events as HistoryLog.
+
+    A running phase whose deadline has passed while the app was down is
+    stale: it isn't resumed, nobody has seen it finishing.
+    """
+
+    MAGIC = b'WXPD'
+    # Magic, running flag, phase index, durations, count, deadline or remain,
+    # start time of the phase, crc32
+    FORMAT = struct.Struct('<4sBxxxIIIIIdd')
+    CRC = struct.Struct('<I')
+    SIZE = FORMAT.size + CRC.size
+
+    def __init__(self, path, cycle):
+        """
+        :param path: Path of the checkpoint file, created if doesn't exist
+        :param cycle: Engine.PomodoroCycle to save
+        """
+        self.cycle = cycle
+        self.started = None  # Unix time the current phase was started
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if os.fstat(fd).st_size != self.SIZE:
+                os.ftruncate(fd, self.SIZE)
+            self.mm = mmap.mmap(fd, self.SIZE)
+        finally:
+            os.close(fd)
+
+    def load(self):
+        """Returns saved state as a dict or None if there is nothing to resume
+
+        Dict keys: durations (arguments of PomodoroCycle.load), index,
+        remain and running (arguments of PomodoroCycle.restore) and started
+        (unix time the phase was started).
+        """
+        data = self.mm[:self.FORMAT.size]
+        crc, = self.CRC.unpack(self.mm[self.FORMAT.size:])
+        if zlib.crc32(data) != crc:
+            return None  # Empty or torn write
+        magic, running, index, p_dur, sb_dur, lb_dur, count, value, started = \
+            self.FORMAT.unpack(data)
+        if magic != self.MAGIC or not index:
+            return None
+        remain = value - time.time() if running else value
+        if remain <= 0:  # Expired while the app was down
+            self.clear()
+            return None
+        self.started = started
+        return {'durations': (p_dur, sb_dur, lb_dur, count), 'index': index,
+                'remain': remain, 'running': bool(running), 'started': started}
+
+    def save(self):
+        """Save current state of the cycle"""
+        status = self.cycle.get_status()
+        if status not in (TIMER_STATUS['T_RUN'], TIMER_STATUS['T_PAUSE']) or not self.cycle.index:
+            self.clear()
+            return
+        running = status == TIMER_STATUS['T_RUN']
+        remain = self.cycle.get_remain() / NS
+        value = time.time() + remain if running else remain
+        data = self.FORMAT.pack(self.MAGIC, running, self.cycle.index,
+                                *(self.cycle.durations + (value, self.started or time.time())))
+        self.mm[:] = data + self.CRC.pack(zlib.crc32(data))
+
+    def clear(self):
+        """Forget saved state"""
+        self.mm[:] = bytes(self.SIZE)
+
+    def record(self, event, phase, seconds, started=None):
+        """Handle timer event. See HistoryLog.record for parameters."""
+        if event == 'start':
+            self.started = time.time()
+        if event in ('start', 'pause', 'resume'):
+            self.save()
+        elif event == 'stop' or (event == 'finish' and not self.cycle.has_next()):
+            self.clear()
+
+    def close(self):
+        """Unmap the file, the state is kept for the next launch"""
+        self.mm.close()
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+"""
+wxPomodoro - Simple pomodoro timer based on wxPython Phoenix GUI
+
+The MIT License (MIT)
+Copyright (C) 2017 Georgy Komarov <jubnzv@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import errno
+import fcntl
+import json
+import os
+import selectors
+import socket
+import tempfile
+import threading
+from collections import deque
+
+from Engine import TIMER_STATUS, ceil_seconds, clock
+
+COMMANDS = ('start', 'pause', 'stop', 'skip', 'show', 'status', 'subscribe', 'debug')
+
+
+def socket_path(app_name):
+    """Returns path of the control socket for current user"""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, app_name + '.sock')
+    return os.path.join(tempfile.gettempdir(), '{}-{}.sock'.format(app_name, os.getuid()))
+
+
+def instance_lock(path):
+    """Try to become the only running instance of application
+
+    The lock file isn't truncated and symlinks aren't followed, so a link
+    placed in shared /tmp can't redirect it to another file.
+
+    :param path: Path of the control socket, lock file is placed next to it
+    :returns: Lock file that should be kept open while application is
+        running or None if another instance holds the lock
+    :raises OSError: Lock file can't be opened
+    """
+    fd = os.open(path + '.lock', os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+    lock = os.fdopen(fd, 'rb', buffering=0)
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock.close()
+        return None
+    return lock
+
+
+def send_command(path, command, timeout=1.0):
+    """Send a command to running application and returns decoded reply
+
+    :raises OSError: Application is not running (socket.timeout: it doesn't
+        reply in time)
+    :raises ValueError: Connection closed without a valid reply
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall(command.encode() + b'\n')
+        reply = b''
+        while not reply.endswith(b'\n'):
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            reply += chunk
+    return json.loads(reply.decode())
+
+
+def subscribe(path):
+    """Yields status events of running application as dicts
+
+    :raises OSError: Application is not running
+    :raises ValueError: Malformed event
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        sock.sendall(b'subscribe\n')
+        for line in sock.makefile('rb'):
+            yield json.loads(line.decode())
+
+
+class ControlServer:
+    """Serves control commands on a local unix socket
+
+    Clients send newline-terminated commands (see COMMANDS) and get one JSON
+    line per command in reply. Sockets are handled by a background thread,
+    so GUI main loop is never blocked:
+
+    * `status` is answered right away from the last published snapshot;
+    * `subscribe` turns the connection into a stream of status events;
+    * `debug` returns timer accuracy counters (see Engine.TickStats);
+    * other commands are passed to `dispatch` callable, which is responsible
+      to run them in the thread of the timer (e.g. via wx.CallAfter).
+    """
+
+    MAX_LINE = 1024  # Maximum command length, longer lines drop the client
+    MAX_PENDING = 64 * 1024  # Unsent output limit, slower clients are dropped
+
+    def __init__(self, path, dispatch, tick_stats=None, clock=clock):
+        """
+        :param path: Path of unix socket
+        :param dispatch: Callable that gets a command name
+        :param tick_stats: Engine.TickStats of the timer
+        :param clock: Clock of the timer, see Engine.clock
+        """
+        self.path = path
+        self.dispatch = dispatch
+        self.tick_stats = tick_stats
+        self.clock = clock
+        self.snapshot = (None, None, 0, 0)  # Status, task, remain, publish time
+        self.last_event = None  # Last (status, task, remain) sent to subscribers
+        self.selector = selectors.DefaultSelector()
+        self.sock = None
+        self.thread = None
+        self.closing = False
+        self.clients = {}  # Client socket -> (unread input, unsent output)
+        self.subscribers = set()
+        self.outbox = deque()  # Encoded events waiting for fan-out
+        self._wakeup_r, self._wakeup_w = os.pipe()
+
+    def start(self):
+        """Bind the socket and start serving
+
+        :raises OSError: Socket is used by another running instance
+        """
+        if os.path.exists(self.path):
+            try:
+                send_command(self.path, 'status')
+            except socket.timeout:  # Owner is alive, just busy
+                raise OSError(errno.EADDRINUSE, 'Socket owner is not responding', self.path)
+            except (OSError, ValueError):
+                os.unlink(self.path)  # Stale socket from crashed instance
+            else:
+                raise OSError(errno.EADDRINUSE, 'Application is already running', self.path)
+
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.bind(self.path)
+        os.chmod(self.path, 0o600)
+        self.sock.listen(16)
+        self.sock.setblocking(False)
+        self.selector.register(self.sock, selectors.EVENT_READ, self._accept)
+        self.selector.register(self._wakeup_r, selectors.EVENT_READ, self._wakeup)
+
+        self.thread = threading.Thread(target=self._serve, name='control')
+        self.thread.daemon = True
+        self.thread.start()
+
+    def close(self):
+        """Stop serving and remove the socket"""
+        if self.thread is None:
+            return
+        self.closing = True
+        os.write(self._wakeup_w, b'\0')
+        self.thread.join()
+        self.thread = None
+        for conn in list(self.clients):
+            self._drop(conn)
+        self.selector.close()
+        self.sock.close()
+        os.close(self._wakeup_r)
+        os.close(self._wakeup_w)
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+    def publish(self, status, task, remain):
+        """Update status snapshot served to clients
+
+        Subscribers get an event only when something they see has changed:
+        the event is encoded once and sent to all of them.
+
+        :param status: Timer status
+        :param task: Current phase name
+        :param remain: Remain time in nanoseconds at the moment of call
+        """
+        self.snapshot = (status, task, remain, self.clock())
+        state = (status, task, ceil_seconds(remain))
+        last, self.last_event = self.last_event, state
+        if state == last or not self.subscribers:
+            return
+
+        if last is None or task != last[1]:
+            event = 'phase'
+        elif status != last[0]:
+            event = 'status'
+        else:
+            event = 'tick'
+        self.outbox.append(self._encode(dict(self.status(), event=event)))
+        os.write(self._wakeup_w, b'\0')
+
+    def status(self):
+        """Returns a current status as dict"""
+        status, task, remain, published = self.snapshot
+        if status == TIMER_STATUS['T_RUN']:
+            remain = max(0, remain - (self.clock() - published))
+        return {'status': status, 'task': task, 'remain': ceil_seconds(remain)}
+
+    def _encode(self, reply):
+        return json.dumps(reply).encode() + b'\n'
+
+    def _serve(self):
+        while not self.closing:
+            for key, mask in self.selector.select():
+                key.data(key.fileobj, mask)
+
+    def _wakeup(self, fd, mask):
+        """Send published events to subscribers"""
+        os.read(fd, 4096)
+        while self.outbox:
+            data = self.outbox.popleft()
+            for conn in list(self.subscribers):
+                self._send(conn, data)
+
+    def _accept(self, sock, mask):
+        try:
+            conn, _ = sock.accept()
+        except OSError:
+            return
+        conn.setblocking(False)
+        self.clients[conn] = (bytearray(), bytearray())
+        self.selector.register(conn, selectors.EVENT_READ, self._client)
+
+    def _client(self, conn, mask):
+        if mask & selectors.EVENT_WRITE:
+            self._flush(conn)
+        if mask & selectors.EVENT_READ and conn in self.clients:
+            self._read(conn)
+
+    def _read(self, conn):
+        try:
+            data = conn.recv(4096)
+        except OSError:
+            data = b''
+        if not data:
+            self._drop(conn)
+            return
+
+        inbuf = self.clients[conn][0]
+        inbuf += data
+        *lines, rest = inbuf.split(b'\n')
+        if len(rest) > self.MAX_LINE:
+            self._drop(conn)
+            return
+        inbuf[:] = rest
+
+        for line in lines:
+            command = line.decode(errors='replace').strip()
+            if command == 'subscribe':
+                self.subscribers.add(conn)
+                self.dispatch(command)
+            self._send(conn, self._encode(self._handle(command)))
+            if conn not in self.clients:
+                return
+
+    def _send(self, conn, data):
+        """Queue data for client and try to send it right away"""
+        outbuf = self.clients[conn][1]
+        outbuf += data
+        if len(outbuf) > self.MAX_PENDING:
+            self._drop(conn)
+            return
+        self._flush(conn)
+
+    def _flush(self, conn):
+        outbuf = self.clients[conn][1]
+        try:
+            sent = conn.send(outbuf)
+        except BlockingIOError:
+            sent = 0
+        except OSError:
+            self._drop(conn)
+            return
+        del outbuf[:sent]
+        events = selectors.EVENT_READ
+        if outbuf:
+            events |= selectors.EVENT_WRITE
+        if self.selector.get_key(conn).events != events:
+            self.selector.modify(conn, events, self._client)
+
+    def _drop(self, conn):
+        self.selector.unregister(conn)
+        del self.clients[conn]
+        self.subscribers.discard(conn)
+        conn.close()
+
+    def _handle(self, command):
+        """Execute command and returns reply as dict"""
+        if command in ('status', 'subscribe'):
+            return self.status()
+        if command == 'debug':
+            return self.tick_stats.as_dict() if self.tick_stats else {}
+        if command not in COMMANDS:
+            return {'error': 'unknown command: ' + command}
+        self.dispatch(command)
+        return {'ok': True}
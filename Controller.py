@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+"""
+wxPomodoro - Simple pomodoro timer based on wxPython Phoenix GUI
+
+The MIT License (MIT)
+Copyright (C) 2017 Georgy Komarov <jubnzv@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+
+import sys
+
+from Engine import NS, TIMER_STATUS, PomodoroCycle, TickStats, ceil_seconds, clock, format_remain
+from Events import (TRANSITIONS, EventBus, Paused, PhaseFinished, PhaseRestored, PhaseSkipped,
+                    PhaseStarted, Resumed, Stopped, Tick)
+
+# Statuses of a cycle that has been started and not stopped yet
+ACTIVE = (TIMER_STATUS['T_RUN'], TIMER_STATUS['T_PAUSE'])
+
+
+class PomodoroController:
+    """Drives PomodoroCycle and delivers its events to optional subsystems
+
+    It is shared by GUI (MainFrame) and headless daemon (Daemon module), so
+    they behave the same. The controller has no main loop: a front end
+    calls `tick` on its timer wakeups and `start`, `pause`, `stop`, `skip`
+    on user commands, then rearms its timer for the running phase.
+    History, checkpoint, notifications, hooks, metrics and control socket
+    are set up from command-line options by `setup`.
+    """
+
+    def __init__(self, app_name, durations, clock=clock):
+        """
+        :param app_name: Application name
+        :param durations: Callable that returns durations of a new cycle,
+                          arguments of PomodoroCycle.load
+        :param clock: Callable that returns monotonic time in nanoseconds
+        """
+        self.app_name = app_name
+        self.durations = durations
+        self.cycle = PomodoroCycle(clock=clock)
+        self.bus = EventBus(clock=clock)
+        self.tick_stats = TickStats()  # Filled by the front end timer
+        self.current_task = None  # The last started phase, kept after stop
+
+        self.notify_controller = None
+        self.control = None
+        self.history = []  # History sinks: log, database, stats, checkpoint and metrics
+        self.stats = None
+        self.hooks = None
+        self.metrics = None
+        self.plugins = None
+
+    def setup(self, cl_args, dispatch):
+        """Initialize subsystems enabled by command-line options
+
+        A cycle interrupted by crash is restored here, the front end should
+        arm its timer if it is running.
+
+        :param cl_args: Dict with command-line arguments
+        :param dispatch: Callable that gets a control socket command and
+                         runs `command` in the thread of the main loop
+        """
+        if cl_args.get('show_notify', True):
+            self._initNotify(cl_args.get('notify_remain', 0))
+
+        if cl_args.get('control', True):
+            self._initControl(dispatch)
+
+        if cl_args.get('history', True):
+            self._initHistory(cl_args.get('label', ''))
+
+        if cl_args.get('resume', True):
+            self._initCheckpoint()
+
+        if cl_args.get('hook_start') or cl_args.get('hook_finish'):
+            self._initHooks(cl_args)
+
+        if cl_args.get('metrics_port') or cl_args.get('metrics_file'):
+            self._initMetrics(cl_args.get('metrics_port'), cl_args.get('metrics_file'))
+
+        if self.history:
+            self.bus.subscribe(self._record, *TRANSITIONS)
+
+    def _initNotify(self, remain_interval):
+        """Initialize notifications if libnotify is available
+
+        :param remain_interval: Show remain time every this many minutes, 0 to disable
+        """
+        try:
+            from Notify import PomodoroNotify  # Pulls pgi and GObject introspection
+        except (ImportError, ValueError) as e:
+            sys.stderr.write('Notifications are disabled: {}\n'.format(e))
+            return
+        self.notify_controller = PomodoroNotify(app_name=self.app_name)
+        self.bus.subscribe(self._notify, *TRANSITIONS)
+        if remain_interval:
+            self.bus.subscribe(self._notifyRemain, Tick, interval=remain_interval * 60 * NS)
+
+    def _initControl(self, dispatch):
+        """Initialize control socket used by external scripts"""
+        from Control import ControlServer, socket_path
+        self.control = ControlServer(socket_path(self.app_name), dispatch=dispatch,
+                                     tick_stats=self.tick_stats, clock=self.cycle.clock)
+        try:
+            self.control.start()
+        except OSError as e:
+            sys.stderr.write('Control socket is disabled: {}\n'.format(e))
+            self.control = None
+            return
+        self.bus.subscribe(self._publishControl)
+
+    def _initHistory(self, label):
+        """Initialize history log, database and statistics
+
+        :param label: Task label stored with sessions
+        """
+        from History import HistoryLog, HistoryStore, history_path
+        from Stats import PomodoroStats
+        db_path = history_path(self.app_name, 'history.sqlite')
+        store = HistoryStore(db_path, label=label)  # Creates tables read by stats
+        self.stats = PomodoroStats.load(db_path)
+        self.history = [HistoryLog(history_path(self.app_name)), store, self.stats]
+
+    def _initCheckpoint(self):
+        """Initialize checkpoint and resume the cycle interrupted earlier"""
+        from Checkpoint import Checkpoint
+        from History import history_path
+        checkpoint = Checkpoint(history_path(self.app_name, 'checkpoint'), self.cycle)
+        self.history.append(checkpoint)
+
+        state = checkpoint.load()
+        if state:
+            self.cycle.load(*state['durations'])
+            self.cycle.restore(state['index'], state['remain'], state['running'])
+            self.current_task = self.cycle.current_task
+            # Sinks are created before checkpoint, the bus isn't wired yet
+            self._record(self._event(PhaseRestored, self.cycle.get_duration(),
+                                     started=state['started']))
+
+    def _initHooks(self, cl_args):
+        """Initialize commands run on phase start and finish"""
+        from Hooks import PomodoroHooks
+        self.hooks = PomodoroHooks({'start': cl_args.get('hook_start', []),
+                                    'finish': cl_args.get('hook_finish', [])},
+                                   timeout=cl_args.get('hook_timeout', PomodoroHooks.TIMEOUT))
+        self.hooks.subscribe(self.bus)
+
+    def _initMetrics(self, port, path):
+        """Initialize metrics exported to Prometheus
+
+        :param port: Serve metrics on localhost port if not None
+        :param path: Rewrite metrics file if not None
+        """
+        from Metrics import PomodoroMetrics
+        self.metrics = PomodoroMetrics(notify=self.notify_controller, hooks=self.hooks,
+                                       clock=self.cycle.clock)
+        try:
+            if port:
+                self.metrics.serve(port)
+            if path:
+                self.metrics.write_to(path)
+        except OSError as e:
+            sys.stderr.write('Metrics are disabled: {}\n'.format(e))
+            self.metrics.close()
+            self.metrics = None
+            return
+        self.history.append(self.metrics)  # Counts finished phases
+        self.metrics.publish(self.cycle.get_status(), self.current_task, self.cycle.get_remain())
+        self.bus.subscribe(self._publishMetrics, *TRANSITIONS)
+
+    def init_plugins(self):
+        """Find installed plugins, they are imported on first use
+
+        It is called by the front end once the main loop runs, so looking
+        for entry points doesn't delay the first tick.
+        """
+        from Plugins import PomodoroPlugins
+        self.plugins = PomodoroPlugins()
+        self.plugins.subscribe(self.bus)
+
+    def close(self, stop=True):
+        """Stop subsystems and write pending history events
+
+        :param stop: Stop the active cycle, so it won't be resumed on the
+                     next launch. Otherwise it is kept in checkpoint.
+        """
+        if self.plugins:
+            self.plugins.unsubscribe(self.bus)
+            self.plugins = None
+        if self.hooks:
+            self.hooks.unsubscribe(self.bus)
+            self.hooks.close()
+            self.hooks = None
+        if self.notify_controller:
+            self.bus.unsubscribe(self._notify)
+            self.bus.unsubscribe(self._notifyRemain)
+            self.notify_controller.close()
+            self.notify_controller = None
+        if self.control:
+            self.bus.unsubscribe(self._publishControl)
+            self.control.close()
+            self.control = None
+
+        if stop and self.cycle.get_status() in ACTIVE:
+            self._record(self._event(Stopped))
+        self.bus.unsubscribe(self._record)
+        for sink in self.history:
+            sink.close()
+        self.history = []
+
+    def _event(self, cls, seconds=None, **fields):
+        """Returns timer event of given type with the current cycle state
+
+        :param cls: Event class, see Events module
+        :param seconds: Seconds to record, remain time if None
+        """
+        remain = self.cycle.get_remain()
+        if seconds is None:
+            seconds = ceil_seconds(remain)
+        return cls(self.current_task, self.cycle.get_status(), remain, seconds, **fields)
+
+    def _publish(self, cls, seconds=None, **fields):
+        """Publish timer event to subscribers, see `_event`"""
+        self.bus.publish(self._event(cls, seconds, **fields))
+
+    def _next_phase(self, first=False):
+        """Start the next phase from the plan
+
+        :param first: True if the cycle is started by user
+        """
+        self.current_task = self.cycle.next_phase()
+        self._publish(PhaseStarted, self.cycle.get_duration(), first=first)
+
+    def _finish(self):
+        """Account finished phase and go on with the plan, stop after the last one"""
+        last = not self.cycle.has_next()
+        self._publish(PhaseFinished, self.cycle.get_duration(), last=last)
+        if last:
+            self.cycle.stop()
+        else:
+            self._next_phase()
+
+    def tick(self):
+        """Update the running phase and publish Tick
+
+        Front end calls it on timer wakeups. A finished phase is followed by
+        the next one from the plan.
+        """
+        running = TIMER_STATUS['T_RUN']
+        if self.cycle.get_status() == running and self.cycle.tick() != running:
+            self._finish()
+        self._publish(Tick)
+
+    def start(self):
+        """Resume paused phase or start a new cycle"""
+        if self.cycle.get_status() == TIMER_STATUS['T_PAUSE']:
+            self.cycle.start()
+            self._publish(Resumed)
+        else:
+            self.cycle.load(*self.durations())
+            self._next_phase(first=True)
+
+    def pause(self):
+        """Pause the running phase
+
+        The deadline may have passed before the front end woke up (it
+        could be a minute late after suspend), then the phase is finished
+        and the next one is started as on a tick.
+        """
+        self.cycle.pause()
+        if self.cycle.get_status() == TIMER_STATUS['T_PAUSE']:
+            self._publish(Paused)
+        else:
+            self._finish()
+
+    def stop(self):
+        """Stop the cycle, the event keeps the name of stopped phase"""
+        seconds = ceil_seconds(self.cycle.get_remain())
+        self.cycle.stop()
+        self._publish(Stopped, seconds)
+
+    def skip(self):
+        """Finish the current phase early and start the next one"""
+        if self.cycle.has_next():
+            self._publish(PhaseSkipped)
+            self._next_phase()
+        else:
+            self.stop()
+
+    def command(self, command):
+        """Execute command received from control socket
+
+        Commands that make no sense in the current status are ignored, the
+        rest (show, subscribe) is up to the front end.
+        """
+        status = self.cycle.get_status()
+        if command == 'start' and status != TIMER_STATUS['T_RUN']:
+            self.start()
+        elif command == 'pause' and status == TIMER_STATUS['T_RUN']:
+            self.pause()
+        elif command == 'stop' and status in ACTIVE:
+            self.stop()
+        elif command == 'skip' and status in ACTIVE:
+            self.skip()
+
+    def _record(self, event):
+        """Append timer event to history sinks"""
+        for sink in self.history:
+            sink.record(event.name, event.phase, event.seconds, started=event.started)
+
+    def _notify(self, event):
+        """Show notifications on timer transitions"""
+        if isinstance(event, PhaseStarted):
+            self.notify_controller.show_status(event.phase)
+            if event.first:
+                self.notify_controller.show_action('Started!')
+        elif isinstance(event, Resumed):
+            self.notify_controller.show_action('Started!')
+        elif isinstance(event, Paused):
+            self.notify_controller.show_action('Paused')
+            self.notify_controller.hide_remain()
+        elif isinstance(event, Stopped):
+            self.notify_controller.show_action('Stopped')
+            self.notify_controller.hide_remain()
+        elif isinstance(event, PhaseFinished) and event.last:
+            self.notify_controller.hide_remain()  # Whole cycle has been finished
+
+    def _notifyRemain(self, event):
+        if event.status == TIMER_STATUS['T_RUN']:
+            self.notify_controller.show_remain(format_remain(event.remain))
+
+    def _publishControl(self, event):
+        self.control.publish(event.status, event.phase, event.remain)
+
+    def _publishMetrics(self, event):
+        self.metrics.publish(event.status, event.phase, event.remain)
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+wxPomodoro - Simple pomodoro timer based on wxPython Phoenix GUI
+
+The MIT License (MIT)
+Copyright (C) 2017 Georgy Komarov <jubnzv@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import signal
+
+from Controller import PomodoroController
+from Engine import NS, TIMER_STATUS
+
+
+class PomodoroDaemon:
+    """Runs PomodoroController on asyncio loop without any GUI
+
+    The daemon is controlled via control socket only (see Control module).
+    Like PomodoroTimer, it wakes up only when something observable changes:
+    every second while somebody is subscribed to status events, otherwise
+    once a minute. asyncio clock stops during system suspend, so a single
+    wakeup at the end of phase could come as late as the suspend lasted;
+    minute wakeups bound that delay.
+    """
+
+    TIMER_SLACK = 5000000  # Wake up a bit after deadline to be sure it has passed (ns)
+    TIMER_TICK = NS  # Granularity for status subscribers
+    TIMER_TICK_IDLE = 60 * NS  # Granularity when nobody watches, longest sleep
+
+    def __init__(self, app_name, cl_args, loop):
+        """
+        :param app_name: Application name
+        :param cl_args: Dict that contents user-defined application options
+        :param loop: asyncio event loop
+        """
+        self.loop = loop
+        self.durations = (cl_args['pomodoro'] * 60, cl_args['short_break'] * 60,
+                          cl_args['long_break'] * 60, cl_args['count'])
+        self.wakeup = None  # asyncio.Handle of the next tick
+        self.expected = None  # Planned time of the next tick (cycle clock)
+        self.load_plugins = cl_args['plugins']
+        self.controller = PomodoroController(app_name, durations=lambda: self.durations)
+        self.cycle = self.controller.cycle
+        self.stats = self.controller.tick_stats
+        self.controller.setup(
+            cl_args,
+            dispatch=lambda command: loop.call_soon_threadsafe(self.on_control, command))
+
+    def start(self):
+        """Start the timer, including the phase resumed from checkpoint"""
+        self.controller.tick()
+        self._schedule()
+        if self.load_plugins:
+            self.loop.call_soon(self.controller.init_plugins)  # Don't delay the first tick
+
+    def close(self):
+        """Stop the timer and free resources
+
+        Unlike GUI, the daemon keeps its checkpoint on SIGTERM, so the cycle
+        continues after reboot.
+        """
+        self._cancel()
+        self.controller.close(stop=False)
+
+    def set_profiler(self, profiler):
+        """Measure ticks with Profile.Profiler"""
+        self.tick = profiler.timed(self.tick, self.stats)
+
+    def _cancel(self):
+        if self.wakeup is not None:
+            self.wakeup.cancel()
+            self.wakeup = None
+
+    def _schedule(self):
+        """Arm wakeup at the next observable change"""
+        self._cancel()
+        if self.cycle.get_status() != TIMER_STATUS['T_RUN']:
+            return
+        control = self.controller.control
+        granularity = self.TIMER_TICK if control.subscribers else self.TIMER_TICK_IDLE
+        delay = self.cycle.next_change(granularity) + self.TIMER_SLACK
+        self.expected = self.cycle.clock() + delay
+        self.wakeup = self.loop.call_later(delay / NS, self.tick)
+
+    def tick(self):
+        self.wakeup = None
+        self.stats.tick(self.expected, self.cycle.clock())
+        self.controller.tick()
+        if self.controller.metrics:
+            self.controller.metrics.tick(self.stats.late)
+        self._schedule()
+
+    def on_control(self, command):
+        """Execute command received from control socket"""
+        self.controller.command(command)
+        self._schedule()
+
+
+def run(app_name, cl_args):
+    """Run the daemon until SIGINT or SIGTERM
+
+    :param cl_args: Dict with command-line arguments
+    :returns: Exit code
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    daemon = PomodoroDaemon(app_name, cl_args, loop)
+    if daemon.controller.control is None:  # The only way to control the daemon
+        daemon.close()
+        loop.close()
+        return 1
+    daemon.start()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, loop.stop)
+    profiler = None
+    if cl_args['profile']:
+        from Profile import Profiler
+        profiler = Profiler(cl_args['profile'])
+        daemon.set_profiler(profiler)
+    try:
+        if profiler:
+            profiler.run(loop.run_forever)
+        else:
+            loop.run_forever()
+    finally:
+        daemon.close()
+        loop.close()
+    return 0
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""
+wxPomodoro - Simple pomodoro timer based on wxPython Phoenix GUI
+
+The MIT License (MIT)
+Copyright (C) 2017 Georgy Komarov <jubnzv@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import time
+
+
+# Timer status with UI name representation
+TIMER_STATUS = {'T_STOP': 'Stopped',
+                'T_RUN': 'Running',
+                'T_PAUSE': 'Paused',
+                'T_FINISH': 'Stopped'}
+
+NS = 1000000000  # Nanoseconds in second
+MS = 1000000  # Nanoseconds in millisecond
+
+if hasattr(time, 'CLOCK_BOOTTIME'):
+    def clock():
+        """Returns monotonic time in nanoseconds that keeps counting during suspend"""
+        return time.clock_gettime_ns(time.CLOCK_BOOTTIME)
+else:
+    clock = time.monotonic_ns
+
+
+def ceil_seconds(ns):
+    """Returns nanoseconds rounded up to whole seconds"""
+    return -(-ns // NS)
+
+
+# Formatted values for remain time under an hour, it covers most of phases
+_REMAIN_STRINGS = ['00:{:02d}:{:02d}'.format(*divmod(secs, 60)) for secs in range(3600)]
+
+
+def format_remain(ns):
+    """Format remain time to HH:MM:SS format
+
+    Seconds are rounded up, so the countdown shows 00:00:01 until it ends.
+    Hours aren't wrapped at days.
+
+    :param ns: Remain time in nanoseconds
+    """
+    secs = -(-ns // NS)
+    if 0 <= secs < 3600:
+        return _REMAIN_STRINGS[secs]
+    h, secs = divmod(secs, 3600)
+    return '{:02d}:{:02d}:{:02d}'.format(h, *divmod(secs, 60))
+
+# Phase names
+PHASE_POMODORO = 'Pomodoro'
+PHASE_SHORT_BREAK = 'Short break'
+PHASE_LONG_BREAK = 'Long break'
+
+
+def phase_plan(p_dur, sb_dur, lb_dur, count):
+    """Yields the full pomodoro stack: from start to long break
+
+    The plan is lazy, so its size doesn't depend on `count`.
+
+    :param p_dur: Pomodoro duration (seconds)
+    :param sb_dur: Short break duration (seconds)
+    :param lb_dur: Long break duration (seconds)
+    :param count: Pomodoros to long break
+    :returns: Generator of (phase name, duration) tuples
+    """
+    for i in range(count - 1):
+        yield (PHASE_POMODORO, p_dur)
+        yield (PHASE_SHORT_BREAK, sb_dur)
+    yield (PHASE_POMODORO, p_dur)
+    yield (PHASE_LONG_BREAK, lb_dur)
+
+
+class Countdown:
+    """Remaining time of a single phase
+
+    Running countdown keeps an absolute deadline, so remain time is always
+    computed from a single clock reading and errors don't accumulate. All
+    values are integer nanoseconds, so ticks don't allocate time objects.
+
+    It doesn't depend on GUI: time source is passed via `clock`, so the same
+    countdown could be driven by wx.Timer or by a simulated clock.
+    """
+
+    def __init__(self, dur, clock=clock):
+        """
+        :param dur: Duration of countdown (seconds)
+        :param clock: Callable that returns monotonic time in nanoseconds
+        """
+        self.dur = dur
+        self.clock = clock
+        self.deadline = None  # Clock value when running countdown expires
+        self.remain = 0  # Remain nanoseconds at the last update
+        self.status = TIMER_STATUS['T_STOP']
+
+    def tick(self):
+        """Update remain time and returns a current status"""
+        self.remain = self.deadline - self.clock()
+        if self.remain <= 0:  # Finish current cycle
+            self.finish()
+        return self.status
+
+    def start(self):
+        """Runs the countdown"""
+        if self.status == TIMER_STATUS['T_STOP']:
+            self.remain = self.dur * NS
+        self.deadline = self.clock() + self.remain
+        self.status = TIMER_STATUS['T_RUN']
+
+    def stop(self):
+        """Breaks existing timing data"""
+        self.status = TIMER_STATUS['T_STOP']
+        self.deadline = None
+        self.remain = 0
+
+    def pause(self):
+        """Pause the countdown"""
+        if self.status == TIMER_STATUS['T_RUN']:
+            self.tick()
+        if self.status == TIMER_STATUS['T_RUN']:
+            self.status = TIMER_STATUS['T_PAUSE']
+            self.deadline = None
+
+    def finish(self):
+        """Represent 'Finish' state: countdown expires successfully"""
+        self.status = TIMER_STATUS['T_FINISH']
+        self.deadline = None
+        self.remain = 0
+
+    def restore(self, remain, running):
+        """Continue countdown interrupted earlier
+
+        :param remain: Remain time (seconds)
+        :param running: Run countdown if True, pause otherwise
+        """
+        self.stop()
+        self.status = TIMER_STATUS['T_PAUSE']
+        self.remain = int(remain * NS)
+        if running:
+            self.start()
+
+    def get_remain(self):
+        """Returns remain time in nanoseconds"""
+        return self.remain
+
+    def next_change(self, granularity=NS):
+        """Returns nanoseconds until remain time crosses the next boundary
+
+        Remain time is shown rounded up to `granularity`, so nothing
+        observable changes until that moment (or until the countdown ends,
+        which is a boundary as well).
+
+        :param granularity: Display resolution (nanoseconds), None to wait
+            for the end of countdown
+        """
+        if self.remain <= 0:
+            return 0
+        if granularity is None:
+            return self.remain
+        step = self.remain % granularity
+        return step if step else granularity
+
+    def get_status(self):
+        """Returns a current status of countdown"""
+        return self.status
+
+
+class TickStats:
+    """Accuracy counters of timer wakeups, used for debugging
+
+    * lateness: how much later than planned wakeups happen (tick jitter);
+    * drift: difference between wall clock and countdown clock time elapsed
+      since the first tick. Clock changes and NTP adjustments show up here,
+      while the countdown isn't affected by them;
+    * suspends: system suspends noticed between ticks and their total time.
+    """
+
+    SUSPEND_THRESHOLD = NS  # Clock gap that is treated as suspend
+
+    def __init__(self):
+        # All values are in nanoseconds
+        self.ticks = 0
+        self.late = 0  # Lateness of the last tick
+        self.late_total = self.late_max = 0
+        self.drift = 0
+        self.suspends = 0
+        self.suspended = 0
+        self.origin = None  # (countdown clock, wall clock) of the first tick
+        self.last = None  # (countdown clock, monotonic clock) of the last tick
+
+    def tick(self, expected, now):
+        """Account a wakeup
+
+        :param expected: Planned wakeup time (countdown clock)
+        :param now: Actual wakeup time (countdown clock)
+        """
+        mono, wall = time.monotonic_ns(), time.time_ns()
+        if self.origin is None:
+            self.origin = (now, wall)
+        if self.last is not None:
+            # Countdown clock keeps counting during suspend, monotonic doesn't
+            gap = (now - self.last[0]) - (mono - self.last[1])
+            if gap > self.SUSPEND_THRESHOLD:
+                self.suspends += 1
+                self.suspended += gap
+        self.last = (now, mono)
+
+        late = self.late = max(now - expected, 0)
+        self.ticks += 1
+        self.late_total += late
+        self.late_max = max(self.late_max, late)
+        self.drift = (wall - self.origin[1]) - (now - self.origin[0])
+
+    def as_dict(self):
+        """Returns counters as dict, times are in seconds"""
+        return {'ticks': self.ticks,
+                'late_mean': self.late_total / self.ticks / NS if self.ticks else 0.0,
+                'late_max': self.late_max / NS,
+                'drift': self.drift / NS,
+                'suspends': self.suspends,
+                'suspended': self.suspended / NS}
+
+
+class PomodoroCycle:
+    """Walks through the phase plan: pomodoro / short break / long break
+
+    The cycle is a plain state machine, so it could be used without wx main
+    loop: the caller is responsible to call `tick` periodically. Only the
+    current phase is materialized and the same Countdown is reused for
+    every phase.
+    """
+
+    def __init__(self, clock=clock):
+        """
+        :param clock: Callable that returns monotonic time in nanoseconds
+        """
+        self.clock = clock
+        self.countdown = Countdown(0, clock=clock)  # Countdown of current phase
+        self.plan = iter(())
+        self.upcoming = None  # Next (phase name, duration) from the plan
+        self.current_task = None
+        self.durations = None  # Arguments of the loaded plan
+        self.index = 0  # Number of started phases
+
+    def load(self, p_dur, sb_dur, lb_dur, count):
+        """Setup the phase plan. See `phase_plan` for parameters."""
+        self.clear()
+        self.durations = (p_dur, sb_dur, lb_dur, count)
+        self.plan = phase_plan(p_dur, sb_dur, lb_dur, count)
+        self.upcoming = next(self.plan, None)
+
+    def restore(self, index, remain, running):
+        """Continue the loaded plan from the middle of phase
+
+        :param index: Number of started phases, see `index`
+        :param remain: Remain time of the phase (seconds)
+        :param running: Run the phase if True, pause otherwise
+        """
+        if not index:
+            return  # Nothing has been started yet
+        for i in range(index):
+            self.current_task, dur = self.upcoming
+            self.upcoming = next(self.plan, None)
+        self.index = index
+        self.countdown.dur = dur
+        self.countdown.restore(remain, running)
+
+    def clear(self):
+        """Remove all phases from the plan"""
+        self.countdown.stop()
+        self.plan = iter(())
+        self.upcoming = None
+        self.current_task = None
+        self.index = 0
+
+    def has_next(self):
+        """Returns True if there are phases left in the plan"""
+        return self.upcoming is not None
+
+    def next_phase(self):
+        """Starts the next phase from the plan
+
+        :returns: Name of started phase
+        """
+        self.current_task, dur = self.upcoming
+        self.upcoming = next(self.plan, None)
+        self.index += 1
+        self.countdown.stop()
+        self.countdown.dur = dur
+        self.countdown.start()
+        return self.current_task
+
+    def start(self):
+        """Runs the current phase or the first one if cycle wasn't started"""
+        if self.current_task is None:
+            return self.next_phase()
+        self.countdown.start()
+        return self.current_task
+
+    def pause(self):
+        """Pause the current phase"""
+        self.countdown.pause()
+
+    def stop(self):
+        """Stops the current phase and drops the rest of the plan"""
+        self.clear()
+
+    def tick(self):
+        """Update the current phase and returns its status"""
+        if self.countdown.get_status() != TIMER_STATUS['T_RUN']:
+            return self.countdown.get_status()
+        return self.countdown.tick()
+
+    def get_duration(self):
+        """Returns duration of the current phase (seconds)"""
+        return self.countdown.dur
+
+    def get_remain(self):
+        """Returns remain time of the current phase in nanoseconds"""
+        return self.countdown.get_remain()
+
+    def next_change(self, granularity=NS):
+        """Returns nanoseconds until the current phase crosses the next boundary
+
+        See Countdown.next_change.
+        """
+        return self.countdown.next_change(granularity)
+
+    def get_status(self):
+        """Returns a status of the current phase"""
+        return self.countdown.get_status()
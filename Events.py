@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+wxPomodoro - Simple pomodoro timer based on wxPython Phoenix GUI
+
+The MIT License (MIT)
+Copyright (C) 2017 Georgy Komarov <jubnzv@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+from Engine import clock
+
+
+class TimerEvent:
+    """Base class of timer events
+
+    Every event carries a snapshot of the timer at the moment it happened.
+    `name` is the matching history event, see History.EVENTS.
+    """
+
+    name = None
+    started = None  # Unix time the phase was started, known for PhaseRestored only
+    __slots__ = ('phase', 'status', 'remain', 'seconds')
+
+    def __init__(self, phase, status, remain, seconds):
+        """
+        :param phase: Name of the current phase
+        :param status: Timer status, see Engine.TIMER_STATUS
+        :param remain: Remain time of the phase (nanoseconds)
+        :param seconds: Seconds recorded to history: phase duration for
+                        start/finish, remain time otherwise
+        """
+        self.phase = phase
+        self.status = status
+        self.remain = remain
+        self.seconds = seconds
+
+    def __repr__(self):
+        return '{}({!r}, {!r}, {!r}, {!r})'.format(
+            type(self).__name__, self.phase, self.status, self.remain, self.seconds)
+
+
+class PhaseStarted(TimerEvent):
+    """Phase has been started: by user (`first` phase of the cycle), by skip
+    or after the previous one has finished"""
+
+    name = 'start'
+    __slots__ = ('first',)
+
+    def __init__(self, phase, status, remain, seconds, first=False):
+        super(PhaseStarted, self).__init__(phase, status, remain, seconds)
+        self.first = first
+
+
+class PhaseFinished(TimerEvent):
+    """Countdown of the phase has expired, `last` is set at the end of cycle"""
+
+    name = 'finish'
+    __slots__ = ('last',)
+
+    def __init__(self, phase, status, remain, seconds, last=False):
+        super(PhaseFinished, self).__init__(phase, status, remain, seconds)
+        self.last = last
+
+
+class PhaseSkipped(TimerEvent):
+    """Phase has been finished early by user"""
+    name = 'skip'
+    __slots__ = ()
+
+
+class Paused(TimerEvent):
+    name = 'pause'
+    __slots__ = ()
+
+
+class Resumed(TimerEvent):
+    name = 'resume'
+    __slots__ = ()
+
+
+class Stopped(TimerEvent):
+    """The cycle has been stopped by user"""
+    name = 'stop'
+    __slots__ = ()
+
+
+class PhaseRestored(TimerEvent):
+    """Phase interrupted by crash has been resumed from checkpoint
+
+    It is passed to history sinks only, so they could continue the session
+    started by previous run.
+    """
+
+    name = 'restore'
+    __slots__ = ('started',)
+
+    def __init__(self, phase, status, remain, seconds, started=None):
+        super(PhaseRestored, self).__init__(phase, status, remain, seconds)
+        self.started = started
+
+
+class Tick(TimerEvent):
+    """Timer has woken up, it isn't recorded to history"""
+    __slots__ = ()
+
+
+# Events that change the state of timer
+TRANSITIONS = (PhaseStarted, PhaseFinished, PhaseSkipped, Paused, Resumed, Stopped)
+
+
+class Subscription:
+    """Handler subscribed to some event types"""
+
+    __slots__ = ('handler', 'types', 'interval', 'last')
+
+    def __init__(self, handler, types, interval):
+        self.handler = handler
+        self.types = types
+        self.interval = interval
+        self.last = None  # Clock value when the last Tick was delivered
+
+
+class EventBus:
+    """Delivers timer events to subscribers
+
+    The timer publishes every event once, subscribers choose event types
+    they need. Tick delivery could be throttled per subscriber, any state
+    transition resets throttling, so the first tick after it is always
+    delivered. Handlers are called synchronously in order of subscription.
+    """
+
+    def __init__(self, clock=clock):
+        """
+        :param clock: Clock for Tick throttling, see Engine.clock
+        """
+        self.clock = clock
+        self.subscriptions = []
+        self.routes = {}  # Event type -> subscriptions that get it
+
+    def subscribe(self, handler, *types, interval=0):
+        """Call handler with events of given types
+
+        :param handler: Callable that accepts event
+        :param types: Event classes, all events if empty
+        :param interval: Deliver Tick at most once per interval (nanoseconds)
+        """
+        self.subscriptions.append(Subscription(handler, types or TRANSITIONS + (Tick,), interval))
+        self._route()
+
+    def unsubscribe(self, handler):
+        """Remove all subscriptions of handler"""
+        self.subscriptions = [s for s in self.subscriptions if s.handler != handler]
+        self._route()
+
+    def _route(self):
+        self.routes = {}
+        for subscription in self.subscriptions:
+            for cls in subscription.types:
+                self.routes.setdefault(cls, []).append(subscription)
+
+    def wants(self, cls):
+        """Returns True if somebody is subscribed to events of given type"""
+        return cls in self.routes
+
+    def publish(self, event):
+        """Deliver event to subscribers"""
+        if type(event) is Tick:
+            now = self.clock()
+            for subscription in self.routes.get(Tick, ()):
+                if subscription.interval:
+                    if subscription.last is not None and now - subscription.last < subscription.interval:
+                        continue
+                    subscription.last = now
+                subscription.handler(event)
+            return
+
+        for subscription in self.subscriptions:
+            subscription.last = None
+        for subscription in self.routes.get(type(event), ()):
+            subscription.handler(event)
+
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""
+wxPomodoro - Simple pomodoro timer based on wxPython Phoenix GUI
+
+The MIT License (MIT)
+Copyright (C) 2017 Georgy Komarov <jubnzv@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+from Engine import PHASE_POMODORO
+
+
+# Timer events stored in history
+EVENTS = ('start', 'finish', 'pause', 'resume', 'skip', 'stop', 'restore')
+
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS sessions (
+           started REAL NOT NULL,
+           finished REAL NOT NULL,
+           phase TEXT NOT NULL,
+           label TEXT NOT NULL,
+           duration INTEGER NOT NULL,
+           completed INTEGER NOT NULL)""",
+    "CREATE INDEX IF NOT EXISTS sessions_started ON sessions (started)",
+    "CREATE INDEX IF NOT EXISTS sessions_phase ON sessions (phase, started, label)",
+    "CREATE INDEX IF NOT EXISTS sessions_label ON sessions (label, started)",
+)
+
+# Completed pomodoros per local day, maintained along with sessions
+DAILY_SCHEMA = """CREATE TABLE daily (
+                      day TEXT PRIMARY KEY,
+                      pomodoros INTEGER NOT NULL,
+                      seconds INTEGER NOT NULL)"""
+DAILY_BACKFILL = """INSERT INTO daily
+                    SELECT date(finished, 'unixepoch', 'localtime'), COUNT(*), SUM(duration)
+                    FROM sessions WHERE phase = ? AND completed GROUP BY 1"""
+
+
+def history_path(app_name, name='history.log'):
+    """Returns path of a history file for current user"""
+    data_dir = os.environ.get('XDG_DATA_HOME') or os.path.expanduser('~/.local/share')
+    return os.path.join(data_dir, app_name, name)
+
+
+def read_history(path, offset=0):
+    """Read events appended to history log after offset
+
+    Only complete lines are read, so the log could be tailed while it's
+    being written.
+
+    :param offset: Offset returned by the previous call
+    :returns: Tuple of (list of (time, event, phase, seconds), new offset)
+    """
+    try:
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+    except FileNotFoundError:
+        return [], offset
+
+    end = data.rfind(b'\n') + 1
+    records = []
+    for line in data[:end].splitlines():
+        ts, event, phase, seconds = line.decode().split('\t')
+        records.append((float(ts), event, phase, int(seconds)))
+    return records, offset + end
+
+
+class HistoryLog:
+    """Append-only log of timer events
+
+    Each event is a tab-separated line: unix time, event (see EVENTS),
+    phase name and seconds (phase duration for start/finish/restore, remain
+    time otherwise).
+
+    `record` only puts a line to memory buffer. A background thread
+    collects lines for `flush_interval` seconds and writes them with one
+    fsync, so the timer never waits for disk. A batch that fails to be
+    written is dropped and the error is reported to stderr, the next
+    batches are tried as usual. The buffer is bounded, so events are
+    dropped as well while the disk is stuck.
+    """
+
+    FLUSH_INTERVAL = 5  # Maximum delay before buffered events are written (seconds)
+    MAX_BUFFER = 10000  # Events waiting for the worker
+
+    def __init__(self, path, flush_interval=FLUSH_INTERVAL):
+        """
+        :param path: Path of the log file, created if doesn't exist
+        :param flush_interval: Batching interval (seconds)
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        self.buffer = []
+        self.cond = threading.Condition()
+        self.closed = False
+        self.lost = 0  # Events dropped by errors or full buffer
+        self.failing = False  # The last write has failed, it's already reported
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.file = open(path, 'ab')
+
+        self.worker = threading.Thread(target=self._worker, name='history')
+        self.worker.daemon = True
+        self.worker.start()
+
+    def record(self, event, phase, seconds, started=None):
+        """Append event to the log
+
+        :param event: One of EVENTS
+        :param phase: Phase name
+        :param seconds: Phase duration or remain time (seconds)
+        :param started: Unix time the phase was started, given with restore
+        """
+        line = '{:.3f}\t{}\t{}\t{}\n'.format(time.time(), event, phase, seconds).encode()
+        with self.cond:
+            if len(self.buffer) >= self.MAX_BUFFER:
+                self.lost += 1
+                return
+            self.buffer.append(line)
+            if len(self.buffer) == 1:
+                self.cond.notify()
+
+    def _worker(self):
+        """Write buffered events in batches until closed"""
+        while True:
+            with self.cond:
+                while not self.buffer and not self.closed:
+                    self.cond.wait()
+                if not self.closed:
+                    self.cond.wait(self.flush_interval)  # Collect a batch
+                lines, self.buffer = self.buffer, []
+                closed = self.closed
+
+            if lines:
+                try:
+                    self.file.write(b''.join(lines))
+                    self.file.flush()
+                    os.fsync(self.file.fileno())
+                except OSError as e:
+                    self._failed(e, len(lines))
+                else:
+                    self.failing = False
+            if closed:
+                return
+
+    def _failed(self, error, count):
+        """Account events lost by error, only the first error in a row is reported"""
+        self.lost += count
+        if not self.failing:
+            sys.stderr.write('History log {}: {} events are lost: {}\n'.format(
+                self.path, count, error))
+        self.failing = True
+
+    def close(self):
+        """Write pending events and close the log"""
+        with self.cond:
+            self.closed = True
+            self.cond.notify()
+        self.worker.join()
+        try:
+            self.file.close()
+        except OSError as e:  # Data left from a failed write
+            self._failed(e, 0)
+
+
+def day_of(ts):
+    """Returns local date of unix time in YYYY-MM-DD format"""
+    return time.strftime('%Y-%m-%d', time.localtime(ts))
+
+
+def pomodoros_per_label(path, since, until=None):
+    """Returns completed pomodoros per task label
+
+    :param path: Path of HistoryStore database
+    :param since: Start of the range (unix time)
+    :param until: End of the range (unix time), now if None
+    :returns: List of (label, pomodoros, seconds) tuples
+    """
+    if until is None:
+        until = time.time()
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(
+            """SELECT label, COUNT(*), SUM(duration) FROM sessions
+               WHERE phase = ? AND started >= ? AND started < ? AND completed
+               GROUP BY label ORDER BY label""",
+            (PHASE_POMODORO, since, until)).fetchall()
+    finally:
+        conn.close()
+
+
+class HistoryStore:
+    """SQLite database of timer sessions
+
+    It gets the same events as HistoryLog and turns them into sessions: a
+    phase from start to finish (completed) or to skip/stop. Rows are
+    inserted by a background thread in one transaction per batch, so the
+    caller never waits for database.
+
+    Daily totals of completed pomodoros are kept in `daily` table, which
+    is updated in the same transaction. Tables are created (and `daily` is
+    backfilled from older databases) by the constructor, so the database
+    could be read as soon as it returns.
+
+    Like in HistoryLog, a batch that fails to be inserted (e.g. database is
+    locked or disk is full) is dropped and reported to stderr.
+    """
+
+    FLUSH_INTERVAL = 5  # Maximum delay before buffered sessions are written (seconds)
+    MAX_BUFFER = 10000  # Sessions waiting for the worker
+
+    def __init__(self, path, label='', flush_interval=FLUSH_INTERVAL):
+        """
+        :param path: Path of the database, created if doesn't exist
+        :param label: Task label stored with sessions
+        :param flush_interval: Batching interval (seconds)
+        """
+        self.path = path
+        self.label = label
+        self.flush_interval = flush_interval
+        self.session = None  # (started, phase, duration) of the current phase
+        self.buffer = []
+        self.cond = threading.Condition()
+        self.closed = False
+        self.lost = 0  # Sessions dropped by errors or full buffer
+        self.failing = False  # The last insert has failed, it's already reported
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._create()
+        self.worker = threading.Thread(target=self._worker, name='history-db')
+        self.worker.daemon = True
+        self.worker.start()
+
+    def record(self, event, phase, seconds, started=None):
+        """Handle timer event. See HistoryLog.record for parameters."""
+        now = time.time()
+        if event == 'start':
+            self.session = (now, phase, seconds)
+            return
+        if event == 'restore':  # Continue session of the previous run
+            self.session = (started or now, phase, seconds)
+            return
+        if event not in ('finish', 'skip', 'stop') or self.session is None:
+            return
+
+        started, phase, duration = self.session
+        self.session = None
+        if event == 'finish':
+            row = (started, now, phase, self.label, duration, 1)
+        else:  # Interrupted: store time actually spent
+            row = (started, now, phase, self.label, duration - seconds, 0)
+        with self.cond:
+            if len(self.buffer) >= self.MAX_BUFFER:
+                self.lost += 1
+                return
+            self.buffer.append(row)
+            if len(self.buffer) == 1:
+                self.cond.notify()
+
+    def _create(self):
+        """Create tables that don't exist yet"""
+        conn = sqlite3.connect(self.path)
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            with conn:
+                for statement in SCHEMA:
+                    conn.execute(statement)
+                if not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'daily'").fetchone():
+                    conn.execute(DAILY_SCHEMA)
+                    conn.execute(DAILY_BACKFILL, (PHASE_POMODORO,))
+        finally:
+            conn.close()
+
+    def _worker(self):
+        """Insert buffered sessions in batches until closed"""
+        conn = None
+
+        while True:
+            with self.cond:
+                while not self.buffer and not self.closed:
+                    self.cond.wait()
+                if not self.closed:
+                    self.cond.wait(self.flush_interval)  # Collect a batch
+                rows, self.buffer = self.buffer, []
+                closed = self.closed
+
+            if rows:
+                try:
+                    if conn is None:
+                        conn = sqlite3.connect(self.path)
+                    self._insert(conn, rows)
+                except sqlite3.Error as e:
+                    self._failed(e, len(rows))
+                else:
+                    self.failing = False
+            if closed:
+                if conn is not None:
+                    conn.close()
+                return
+
+    def _insert(self, conn, rows):
+        """Insert sessions and update daily totals in one transaction"""
+        with conn:
+            conn.executemany('INSERT INTO sessions VALUES (?, ?, ?, ?, ?, ?)', rows)
+            for started, finished, phase, label, duration, completed in rows:
+                if phase != PHASE_POMODORO or not completed:
+                    continue
+                day = day_of(finished)
+                conn.execute('INSERT OR IGNORE INTO daily VALUES (?, 0, 0)', (day,))
+                conn.execute("""UPDATE daily SET pomodoros = pomodoros + 1,
+                                                 seconds = seconds + ?
+                                WHERE day = ?""", (duration, day))
+
+    def _failed(self, error, count):
+        """Account sessions lost by error, only the first error in a row is reported"""
+        self.lost += count
+        if not self.failing:
+            sys.stderr.write('History database {}: {} sessions are lost: {}\n'.format(
+                self.path, count, error))
+        self.failing = True
+
+    def close(self):
+        """Write pending sessions and close the database"""
+        with self.cond:
+            self.closed = True
+            self.cond.notify()
+        self.worker.join()
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+wxPomodoro - Simple pomodoro timer based on wxPython Phoenix GUI
+
+The MIT License (MIT)
+Copyright (C) 2017 Georgy Komarov <jubnzv@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import os
+import selectors
+import signal
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from Events import PhaseFinished, PhaseStarted
+
+
+class PomodoroHooks:
+    """Runs user commands when a phase starts or finishes
+
+    Commands are executed by shell in a bounded pool of worker threads, so
+    a slow command never delays the timer. A command that runs longer than
+    `timeout` is killed with its process group. When too many commands are
+    pending, new ones are dropped. Output of failed commands is written to
+    stderr. On close queued commands are cancelled and running ones are
+    killed, so they never delay exit.
+
+    Commands get the event in environment: WXPOMODORO_EVENT (start or
+    finish), WXPOMODORO_PHASE and WXPOMODORO_SECONDS (phase duration).
+    """
+
+    WORKERS = 2
+    MAX_PENDING = 16  # Queued and running commands
+    TIMEOUT = 30  # Seconds
+    OUTPUT_LIMIT = 4096  # Bytes of output kept for every command
+    KILL_WAIT = 1  # Seconds to wait for killed command to exit
+
+    def __init__(self, commands, timeout=TIMEOUT, workers=WORKERS):
+        """
+        :param commands: Dict of event name (start / finish) -> list of commands
+        :param timeout: Kill commands running longer than this (seconds)
+        """
+        self.commands = commands
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='hook')
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.procs = set()  # Running commands
+        self.closed = False
+        self._wakeup_r, self._wakeup_w = os.pipe()  # Interrupts reading output on close
+        # Counters, read by metrics
+        self.runs = 0
+        self.failures = 0  # Non-zero exit code or failed to start
+        self.timeouts = 0
+        self.dropped = 0
+        self.outputs = {}  # Command -> (exit code, output) of the last run
+
+    def subscribe(self, bus):
+        """Run commands on events of Events.EventBus"""
+        bus.subscribe(self.on_event, PhaseStarted, PhaseFinished)
+
+    def unsubscribe(self, bus):
+        bus.unsubscribe(self.on_event)
+
+    def on_event(self, event):
+        """Queue commands configured for event"""
+        commands = self.commands.get(event.name)
+        if not commands:
+            return
+        env = dict(os.environ,
+                   WXPOMODORO_EVENT=event.name,
+                   WXPOMODORO_PHASE=event.phase,
+                   WXPOMODORO_SECONDS=str(event.seconds))
+        for command in commands:
+            with self.lock:
+                if self.pending >= self.MAX_PENDING:
+                    self.dropped += 1
+                    continue
+                self.pending += 1
+            self.executor.submit(self._run, command, env)
+
+    def _run(self, command, env):
+        deadline = time.monotonic() + self.timeout
+        try:
+            if self.closed:
+                return
+            try:
+                proc = subprocess.Popen(command, shell=True, env=env, stdin=subprocess.DEVNULL,
+                                        stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                        start_new_session=True)
+            except OSError as e:
+                self._done(command, None, str(e).encode(), 'failed to start')
+                return
+            with self.lock:
+                self.procs.add(proc)
+            try:
+                with proc.stdout:
+                    output = self._read(proc.stdout, deadline)
+                if self.closed:
+                    self._kill(proc)  # Killed by close, it isn't accounted
+                    return
+                try:
+                    code = proc.wait(timeout=max(deadline - time.monotonic(), 0))
+                except subprocess.TimeoutExpired:
+                    self._kill(proc)
+                    self._done(command, None, output, 'timed out')
+                else:
+                    self._done(command, code, output)
+            finally:
+                with self.lock:
+                    self.procs.discard(proc)
+        finally:
+            with self.lock:
+                self.pending -= 1
+
+    def _read(self, pipe, deadline):
+        """Returns the last OUTPUT_LIMIT bytes read from pipe until EOF or deadline"""
+        output = bytearray()
+        fd = pipe.fileno()
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            selector.register(self._wakeup_r, selectors.EVENT_READ)
+            while True:
+                left = deadline - time.monotonic()
+                if left <= 0 or not selector.select(left) or self.closed:
+                    break  # Timed out or closed, the caller kills the command
+                chunk = os.read(fd, 4096)
+                if not chunk:
+                    break
+                output += chunk
+                del output[:-self.OUTPUT_LIMIT]
+        return bytes(output)
+
+    def _kill(self, proc):
+        """Kill command with its process group, waiting for it a bounded time
+
+        Output pipe is closed at this point, so a grandchild that escaped
+        the group can't block the worker.
+        """
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except OSError:
+            pass  # Exited meanwhile
+        try:
+            proc.wait(timeout=self.KILL_WAIT)
+        except subprocess.TimeoutExpired:
+            pass
+
+    def _done(self, command, code, output, error=None):
+        """Account finished command
+
+        :param code: Exit code, None if command hasn't finished by itself
+        :param error: Reason why there is no exit code
+        """
+        output = output.decode(errors='replace')
+        with self.lock:
+            self.runs += 1
+            self.outputs[command] = (code, output)
+            if error == 'timed out':
+                self.timeouts += 1
+            elif code != 0:
+                self.failures += 1
+        if code != 0:
+            sys.stderr.write('Hook "{}" {}:\n{}'.format(
+                command, error or 'failed with exit code {}'.format(code), output))
+
+    def close(self):
+        """Cancel queued commands and kill running ones
+
+        Killed commands are waited for at most KILL_WAIT seconds.
+        """
+        with self.lock:
+            self.closed = True
+            procs = list(self.procs)
+        try:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        except TypeError:  # Python < 3.9, queued commands return right away
+            self.executor.shutdown(wait=False)
+        for proc in procs:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except OSError:
+                pass  # Exited meanwhile
+        os.write(self._wakeup_w, b'\0')
+        self.executor.shutdown(wait=True)
+        os.close(self._wakeup_r)
+        os.close(self._wakeup_w)
@@ -25,13 +25,12 @@ OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
 import wx
-import datetime
 import time
-from collections import deque
 
-from TaskBarIcon import TimerTaskBarIcon
 from Timer import PomodoroTimer
-from Notify import PomodoroNotify
+from Controller import PomodoroController
+from Engine import format_remain
+from Events import TRANSITIONS, Tick
 
 
 class StatusTextCtrl(wx.TextCtrl):
@@ -49,6 +48,28 @@ class StatusTextCtrl(wx.TextCtrl):
         self.Navigate()
 
 
+class ViewState:
+    """Remembers the last rendered values of UI elements
+
+    It used to find out which elements should be updated on Refresh.
+    """
+
+    def __init__(self):
+        self.values = {}
+
+    def __getitem__(self, key):
+        return self.values[key]
+
+    def update(self, **values):
+        """Store new values and returns a set of keys that have changed"""
+        dirty = set()
+        for key, value in values.items():
+            if key not in self.values or self.values[key] != value:
+                self.values[key] = value
+                dirty.add(key)
+        return dirty
+
+
 class MainFrame(wx.Frame):
     """Main frame of program
     """
@@ -66,16 +87,19 @@ class MainFrame(wx.Frame):
         self.app_name, self.app_version = app_creds
 
         # Timer initialization
-        self.timer = None  # Current timer
-        self.timers_queue = deque()
-        self.timers_count = 0
-        self.p_dur = self.sb_dur = self.lb_dur = 0
+        self.controller = PomodoroController(self.app_name, durations=self._getUserInput)
+        self.cycle = self.controller.cycle
+        self.timer = PomodoroTimer(self.cycle, parent=self, id=wx.ID_ANY,
+                                   stats=self.controller.tick_stats)
+        self.Bind(wx.EVT_TIMER, self.TimerLoop, self.timer)
+        self.Bind(wx.EVT_SHOW, self.OnShow)
+        self.controller.bus.subscribe(self.OnTimerEvent)
         self.timer_status = None
+        self.refresh_time = None  # Duration of Refresh on the last Tick event (ns)
 
-        # Status & notifications elements
-        self.current_task = 'Waiting'
-        self.notify_controller = None
+        # Status elements
         self.tbIcon = None
+        self.view = ViewState()  # Last rendered values
 
         # Intiailize the UI
         self.mainPanel = wx.Panel(self)
@@ -86,8 +110,14 @@ class MainFrame(wx.Frame):
         self._initControlButtons()
         self._setTitle()
 
-        if cl_args['show_notify']:
-            self._initNotify()
+        self.controller.setup(cl_args,
+                              dispatch=lambda command: wx.CallAfter(self.OnControl, command))
+        if self.controller.stats is not None:
+            self.statsBut.Enable()
+        self.timer.update()  # Run the phase resumed from checkpoint
+
+        if cl_args.get('plugins', True):
+            wx.CallAfter(self.controller.init_plugins)  # Look for plugins when the frame is shown
 
         if cl_args['show_icon']:
             self._initTrayIcon()
@@ -98,7 +128,7 @@ class MainFrame(wx.Frame):
         self.mainSz.Fit(self)
         self.mainPanel.SetSizer(self.mainSz)
 
-        self.Refresh()
+        self.controller.tick()
 
     def _initStatusPanel(self):
         """Initialize the status panel that represents current pomodoro state"""
@@ -174,6 +204,11 @@ class MainFrame(wx.Frame):
         """Initialize the control buttons in a bottom of MainFrame"""
         btnSz = wx.GridBagSizer(vgap=4, hgap=4)
 
+        self.statsBut = wx.Button(self.mainPanel, wx.ID_ANY, label='Stats')
+        self.Bind(wx.EVT_BUTTON, self.OnStats, self.statsBut)
+        self.statsBut.Disable()  # Enabled with history
+        btnSz.Add(self.statsBut, pos=(0,0), flag=wx.ALL, border=3)
+
         self.startBut = wx.Button(self.mainPanel, wx.ID_ANY, label='Start')
         self.Bind(wx.EVT_BUTTON, self.OnStart, self.startBut)
         btnSz.Add(self.startBut, pos=(0,1), flag=wx.ALL|wx.EXPAND, border=3)
@@ -193,62 +228,65 @@ class MainFrame(wx.Frame):
 
     def _initTrayIcon(self):
         """Initialize tray icon and minimize-restore routines"""
+        from TaskBarIcon import TimerTaskBarIcon  # Pulls wx.adv
         self.tbIcon = TimerTaskBarIcon(self)
+        self.tbIcon.set_status(self.timer.get_status())
+        self.controller.bus.subscribe(self._updateTray, *TRANSITIONS)
         self.Bind(wx.EVT_ICONIZE, self.Minimize)
 
-    def _initNotify(self):
-        """Initialize notifications"""
-        self.notify_controller = PomodoroNotify(app_name=self.app_name)
-
     def _cleanIcon(self):
         """Remove taskbar icon"""
         if self.tbIcon:
+            self.controller.bus.unsubscribe(self._updateTray)
             self.tbIcon.RemoveIcon()
             self.tbIcon.Destroy()
 
-    def queue_init(self):
-        """Setup the PomodoroTimer queue
+    def Refresh(self):
+        """Update panel contents
 
-        Timers queue used to implement full pomodoro stack: from start to long break.
+        Only elements whose values have changed since the last call are
+        updated, so a steady-state tick touches the countdown and the title
+        (it shows the remain time while running).
         """
-        self.timers_queue = deque()
-        for i in range(self.timers_count):
-            self.timers_queue.append(('Pomodoro', PomodoroTimer(dur=self.p_dur, parent=self, id=wx.ID_ANY)))
-            self.timers_queue.append(('Short break', PomodoroTimer(dur=self.sb_dur, parent=self, id=wx.ID_ANY)))
-        self.timers_queue[-1] = (('Long break', PomodoroTimer(dur=self.lb_dur, parent=self, id=wx.ID_ANY)))
-
-    def queue_clean(self):
-        """Remove all timers from queue"""
-        self.timers_qeueue = deque()
-        self.timer = None
-        self.timer_status = None
-
-    def queue_next(self):
-        """Starts the next timer from queue"""
-        self.current_task = self.timers_queue[0][0]  # Type of current timer
-        self.timer = self.timers_queue[0][1]  # Timer object
-        self.timer.start()
         self.timer_status = self.timer.get_status()
-        self.Bind(wx.EVT_TIMER, self.TimerLoop)
-        self.timers_queue.popleft()
-        if self.notify_controller:
-            self.notify_controller.show_status(self.current_task)
+        remain = format_remain(self.timer.get_remain())
+        dirty = self.view.update(status=self.timer_status,
+                                 task=self._getCurrentTask(),
+                                 time=remain,
+                                 title=self._getTitle(remain))
+        if not dirty:
+            return
+
+        batch = len(dirty) > 2  # More than countdown and title
+        if batch:
+            self.Freeze()
+        try:
+            if 'status' in dirty:
+                self._setCurrentStatus()
+                self._setStatusControls()
+            if 'task' in dirty:
+                self._setCurrentTask()
+            if 'time' in dirty:
+                self.currentTime.SetValue(remain)
+            if 'title' in dirty:
+                self.SetTitle(self.view['title'])
+        finally:
+            if batch:
+                self.Thaw()
 
-    def Refresh(self):
-        """Update panel contents"""
-        self._setCurrentStatus()
-        self._setCurrentTask()
+    def _setCurrentStatus(self):
+        """Set current status in UI"""
+        self.timer_status = self.timer.get_status()
+        self.currentStatus.SetValue(self.timer_status)
 
+    def _setStatusControls(self):
+        """Update elements that depend on timer status only"""
         # Update timer status color
         if self.timer_status == PomodoroTimer.TIMER_STATUS['T_RUN']:
             self.currentTime.SetBackgroundColour((255, 255, 255))
         else:
             self.currentTime.SetBackgroundColour(self.statusPanel.GetBackgroundColour())
 
-        # Update app icon
-        if self.tbIcon:
-            self.tbIcon.set_status(self.timer_status)
-
         # Update control buttons according current timer status
         if self.timer_status == PomodoroTimer.TIMER_STATUS['T_RUN']:
             self.startBut.Disable()
@@ -263,50 +301,40 @@ class MainFrame(wx.Frame):
             self.pauseBut.Disable()
             self.stopBut.Disable()
 
-        self._setCurrentTime()
-        self._setTitle()
-
-    def format_timedelta(self, td):
-        """Format timevalue in seconds to HH:MM:SS format
-
-        :type td: datetime.timedelta
-        """
-        h = td.seconds // 3600
-        m, s = divmod(td.seconds, 60)
-        return '{:02d}:{:02d}:{:02d}'.format(h, m, s)
-
-    def _setCurrentStatus(self):
-        """Set current status in UI"""
-        if not self.timer:
-            self.timer_status = PomodoroTimer.TIMER_STATUS['T_STOP']
-        else:
-            self.timer_status = self.timer.get_status()
-        self.currentStatus.SetValue(self.timer_status)
+    def _getCurrentTask(self):
+        """Returns current task type (work / short break / long break)"""
+        return self.controller.current_task or 'Waiting'
 
     def _setCurrentTask(self):
-        """Set current task type (work / short break / long break) in UI"""
-        self.currentTask.SetValue(self.current_task)
+        """Set current task type in UI"""
+        self.currentTask.SetValue(self._getCurrentTask())
 
     def _setCurrentTime(self):
         """Sets actual timer value to currentTime element"""
-        if self.timer:
-            remain = self.format_timedelta(self.timer.get_remain())
-        else:
-            remain = '00:00:00'
+        remain = format_remain(self.timer.get_remain())
         self.currentTime.SetValue(remain)
 
-    def _setTitle(self):
-        """Change frame's title according timer current status"""
+    def _getTitle(self, remain):
+        """Returns frame's title according timer current status
+
+        :param remain: Formatted remain time
+        """
         if self.timer_status in (PomodoroTimer.TIMER_STATUS['T_RUN'], PomodoroTimer.TIMER_STATUS['T_RUN']):
-            remain = self.format_timedelta(self.timer.get_remain())
-            title = ' '.join([self.app_name, self.timer_status.lower(), remain, 'left'])
+            return ' '.join([self.app_name, self.timer_status.lower(), remain, 'left'])
         else:  # Stopped or finished
-            title = self.app_name+ ' ' + self.timer_status.lower()
+            return self.app_name+ ' ' + self.timer_status.lower()
 
-        self.SetTitle(title)
+    def _setTitle(self):
+        """Change frame's title according timer current status"""
+        remain = format_remain(self.timer.get_remain())
+        self.SetTitle(self._getTitle(remain))
 
     def _getUserInput(self):
-        """Get input from UI forms"""
+        """Returns durations of a new cycle from UI forms
+
+        :returns: Tuple of pomodoro, short break and long break durations
+                  (seconds) and pomodoros to long break
+        """
         def get_secs(valElement, unitElement):
             """Return current time in seconds according time unit choice in UI"""
             val = valElement.GetValue()
@@ -317,40 +345,92 @@ class MainFrame(wx.Frame):
             if unitElement.GetSelection() == 2:  # hours
                 return int(val)*3600
 
-        self.p_dur = get_secs(self.pDurationVal, self.pDurationUnit)
-        self.sb_dur = get_secs(self.sbDurationVal, self.sbDurationUnit)
-        self.lb_dur = get_secs(self.lbDurationVal, self.lbDurationUnit)
-        self.timers_count = self.cntVal.GetValue()
+        return (get_secs(self.pDurationVal, self.pDurationUnit),
+                get_secs(self.sbDurationVal, self.sbDurationUnit),
+                get_secs(self.lbDurationVal, self.lbDurationUnit),
+                self.cntVal.GetValue())
+
+    def OnTimerEvent(self, event):
+        """Update UI on any timer event, timing updates on ticks for metrics"""
+        if not isinstance(event, Tick):
+            self.Refresh()
+            return
+        t_refresh = time.perf_counter_ns()
+        self.Refresh()
+        self.refresh_time = time.perf_counter_ns() - t_refresh
+
+    def _updateTray(self, event):
+        self.tbIcon.set_status(event.status)
 
     def TimerLoop(self, event):
-        self.timer_status = self.timer.get_status()
-        if self.timer_status == PomodoroTimer.TIMER_STATUS['T_FINISH'] and self.timers_queue:
-            self.queue_next()
-        self.Refresh()
+        self.refresh_time = None
+        self.controller.tick()
+        if self.controller.metrics:
+            self.controller.metrics.tick(self.timer.stats.late, self.refresh_time)
+        if self.controller.control:
+            self._updateGranularity()  # Subscribers may have gone
 
     def OnStart(self, event):
-        self._getUserInput()
-        self.queue_init()
-        self.queue_next()
-        self.timer.start()
-        if self.notify_controller:
-            self.notify_controller.show_action('Started!')
+        self.controller.start()
+        self.timer.update()
         self.stopBut.SetFocus()
-        self.Refresh()
 
     def OnPause(self, event):
-        self.timer.pause()
-        if self.notify_controller:
-            self.notify_controller.show_action('Paused')
-        self.Refresh()
+        self.controller.pause()
+        self.timer.update()
 
     def OnStop(self, event):
-        self.timer.stop()
-        self.queue_clean()
-        if self.notify_controller:
-            self.notify_controller.show_action('Stopped')
+        self.controller.stop()
+        self.timer.update()
         self.startBut.SetFocus()
-        self.Refresh()
+
+    def _updateGranularity(self, shown=None):
+        """Tick once a minute while nobody watches the countdown
+
+        :param shown: Frame visibility, current one if None
+        """
+        if shown is None:
+            shown = self.IsShown()
+        control = self.controller.control
+        if shown or (control and control.subscribers):
+            granularity = PomodoroTimer.TIMER_TICK
+        else:
+            granularity = PomodoroTimer.TIMER_TICK_HIDDEN
+        if granularity != self.timer.granularity:
+            self.timer.set_granularity(granularity)
+
+    def setProfiler(self, profiler):
+        """Measure timer events with Profile.Profiler
+
+        :param profiler: Profile.Profiler object
+        """
+        self.Unbind(wx.EVT_TIMER, self.timer)
+        self.Bind(wx.EVT_TIMER, profiler.timed(self.TimerLoop, self.timer.stats), self.timer)
+
+    def OnShow(self, event):
+        """Update display only once a minute while the frame is hidden"""
+        self._updateGranularity(event.IsShown())
+        if event.IsShown():
+            self.Refresh()
+        event.Skip()
+
+    def OnStats(self, event):
+        """Show statistics dialog"""
+        from StatsDialog import StatsDialog
+        dlg = StatsDialog(self, self.controller.stats)
+        dlg.ShowModal()
+        dlg.Destroy()
+
+    def OnControl(self, command):
+        """Execute command received from control socket"""
+        self.controller.command(command)
+        self.timer.update()
+        if command == 'show':
+            self.Show()
+            self.Restore()
+            self.Raise()
+        elif command == 'subscribe':
+            self._updateGranularity()
 
     def Minimize(self, event):
         """Minimize to tray"""
@@ -362,6 +442,7 @@ class MainFrame(wx.Frame):
         It should be called from external, if we bind Minimize on EVT_CLOSE
         """
         self._cleanIcon()
+        self.controller.close()
         self.Destroy()
         self.Close()
 
@@ -374,4 +455,5 @@ class MainFrame(wx.Frame):
                 return
 
         self._cleanIcon()
+        self.controller.close()
         self.Destroy()
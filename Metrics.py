@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""
+wxPomodoro - Simple pomodoro timer based on wxPython Phoenix GUI
+
+The MIT License (MIT)
+Copyright (C) 2017 Georgy Komarov <jubnzv@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import http.server
+import os
+import tempfile
+import threading
+
+from Engine import (MS, NS, PHASE_LONG_BREAK, PHASE_POMODORO, PHASE_SHORT_BREAK,
+                    TIMER_STATUS, clock)
+
+PHASES = (PHASE_POMODORO, PHASE_SHORT_BREAK, PHASE_LONG_BREAK)
+STATUSES = sorted(set(TIMER_STATUS.values()))
+
+
+class PomodoroMetrics:
+    """Counters and gauges of the running timer in Prometheus text format
+
+    Values are updated where they change: on timer events (it accepts the
+    same events as HistoryLog), on status publishing and on ticks. Scraping
+    only formats them, remain time of running phase is extrapolated from
+    the last published value.
+    """
+
+    PREFIX = 'wxpomodoro_'
+    LATE_THRESHOLD = 100 * MS  # Tick later than this is counted as late (ns)
+
+    def __init__(self, notify=None, hooks=None, clock=clock):
+        """
+        :param notify: Notify.PomodoroNotify object to report its latency
+        :param hooks: Hooks.PomodoroHooks object to report its failures
+        :param clock: Clock of the timer, see Engine.clock
+        """
+        self.notify = notify
+        self.hooks = hooks
+        self.clock = clock
+        self.exporters = []
+        self.completed = dict.fromkeys(PHASES, 0)
+        self.phase = None
+        self.status = TIMER_STATUS['T_STOP']
+        self.remain = 0  # Nanoseconds
+        self.published = 0  # Clock value when remain was published
+        self.ticks = self.late_ticks = 0
+        self.lateness = 0  # Total lateness of ticks (ns)
+        self.refreshes = 0
+        self.refresh_time = 0  # Total duration of Refresh (ns)
+
+    def record(self, event, phase, seconds, started=None):
+        """Count finished phases, see HistoryLog.record"""
+        if event == 'finish':
+            self.completed[phase] = self.completed.get(phase, 0) + 1
+
+    def publish(self, status, phase, remain):
+        """Update current status gauges
+
+        :param remain: Remain time (nanoseconds)
+        """
+        self.status = status
+        self.phase = phase
+        self.remain = remain
+        self.published = self.clock()
+
+    def tick(self, late, refresh=None):
+        """Account a timer tick
+
+        :param late: Lateness of the tick (nanoseconds)
+        :param refresh: Duration of UI update on this tick (nanoseconds)
+        """
+        self.ticks += 1
+        self.lateness += late
+        if late > self.LATE_THRESHOLD:
+            self.late_ticks += 1
+        if refresh is not None:
+            self.refreshes += 1
+            self.refresh_time += refresh
+
+    def render(self):
+        """Returns metrics in Prometheus text exposition format"""
+        lines = []
+        remain = self.remain
+        if self.status == TIMER_STATUS['T_RUN']:  # Timer may not tick until the phase ends
+            remain = max(remain - (self.clock() - self.published), 0)
+
+        def metric(name, kind, help, samples):
+            lines.append('# HELP {}{} {}'.format(self.PREFIX, name, help))
+            lines.append('# TYPE {}{} {}'.format(self.PREFIX, name, kind))
+            for suffix, labels, value in samples:
+                lines.append('{}{}{}{} {}'.format(self.PREFIX, name, suffix, labels, value))
+
+        metric('phases_completed_total', 'counter', 'Finished phases.',
+               [('', '{{phase="{}"}}'.format(phase), count)
+                for phase, count in sorted(self.completed.items())])
+        metric('phase', 'gauge', 'Current phase.',
+               [('', '{{phase="{}"}}'.format(phase), int(phase == self.phase))
+                for phase in PHASES])
+        metric('status', 'gauge', 'Current timer status.',
+               [('', '{{status="{}"}}'.format(status), int(status == self.status))
+                for status in STATUSES])
+        metric('remaining_seconds', 'gauge', 'Remaining time of the current phase.',
+               [('', '', remain / NS)])
+        metric('ticks_total', 'counter', 'Timer wakeups.', [('', '', self.ticks)])
+        metric('late_ticks_total', 'counter',
+               'Timer wakeups later than {:g} seconds.'.format(self.LATE_THRESHOLD / NS),
+               [('', '', self.late_ticks)])
+        metric('tick_lateness_seconds', 'summary', 'Lateness of timer wakeups.',
+               [('_sum', '', self.lateness / NS), ('_count', '', self.ticks)])
+        metric('refresh_duration_seconds', 'summary', 'Duration of UI updates on ticks.',
+               [('_sum', '', self.refresh_time / NS), ('_count', '', self.refreshes)])
+        if self.notify:
+            metric('notification_latency_seconds', 'summary',
+                   'Time from queueing to shown notification.',
+                   [('_sum', '', self.notify.latency_total), ('_count', '', self.notify.shown)])
+            metric('notifications_dropped_total', 'counter',
+                   'Notifications outdated or failed to show.',
+                   [('', '', self.notify.dropped)])
+        if self.hooks:
+            metric('hooks_total', 'counter', 'Finished hook commands.',
+                   [('', '', self.hooks.runs)])
+            metric('hook_failures_total', 'counter',
+                   'Hook commands failed to start or exited with error.',
+                   [('', '', self.hooks.failures)])
+            metric('hook_timeouts_total', 'counter', 'Hook commands killed by timeout.',
+                   [('', '', self.hooks.timeouts)])
+            metric('hooks_dropped_total', 'counter', 'Hook commands dropped by full queue.',
+                   [('', '', self.hooks.dropped)])
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port, host='127.0.0.1'):
+        """Serve metrics over HTTP until closed"""
+        self.exporters.append(MetricsServer(self, host, port))
+
+    def write_to(self, path, interval=None):
+        """Rewrite metrics file periodically until closed"""
+        self.exporters.append(MetricsFile(self, path, interval or MetricsFile.INTERVAL))
+
+    def close(self):
+        """Stop exporters"""
+        for exporter in self.exporters:
+            exporter.close()
+        self.exporters = []
+
+
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        body = self.server.metrics.render().encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MetricsServer:
+    """HTTP endpoint for Prometheus scraper, served by a background thread"""
+
+    def __init__(self, metrics, host, port):
+        self.server = http.server.HTTPServer((host, port), _MetricsHandler)
+        self.server.metrics = metrics
+        self.thread = threading.Thread(target=self.server.serve_forever, name='metrics')
+        self.thread.daemon = True
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class MetricsFile:
+    """Metrics file for node_exporter textfile collector
+
+    The file is replaced atomically, so the collector never reads a partial
+    one. It is written by a background thread every `interval` seconds and
+    once more on close. Write errors are ignored after the first write.
+    """
+
+    INTERVAL = 15  # Seconds
+
+    def __init__(self, metrics, path, interval=INTERVAL):
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self.closed = threading.Event()
+        self.write()  # Raise OSError early if the file can't be written
+        self.thread = threading.Thread(target=self._worker, name='metrics')
+        self.thread.daemon = True
+        self.thread.start()
+
+    def _worker(self):
+        while not self.closed.wait(self.interval):
+            try:
+                self.write()
+            except OSError:
+                pass
+
+    def write(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix='.metrics')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(self.metrics.render())
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, self.path)
+        except OSError:
+            os.unlink(tmp)
+            raise
+
+    def close(self):
+        self.closed.set()
+        self.thread.join()
+        try:
+            self.write()
+        except OSError:
+            pass
@@ -24,6 +24,10 @@ OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
 OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
+import threading
+import time
+from collections import OrderedDict
+
 import pgi
 pgi.require_version('Notify', '0.7')
 from pgi.repository import Notify
@@ -31,23 +35,117 @@ from pgi.repository import Notify
 
 class PomodoroNotify:
     """Notification wrapper
+
+    Notifications are shown by a background worker, so a slow or hung
+    notification server never blocks GUI. Only the latest pending
+    notification of each kind (status / action / remain) is shown.
+
+    There is a single notification object per kind: it updated in place
+    instead of stacking new bubbles on the desktop.
     """
-    def __init__(self, app_name):
+
+    TIMEOUT = 5  # Pending notifications older than this are dropped (seconds)
+
+    def __init__(self, app_name, timeout=TIMEOUT):
+        """
+        :param timeout: Drop notifications queued longer than this (seconds)
+        """
         self.app_name = app_name
+        self.timeout = timeout
+        self.remain_shown = False  # Remain time notification is shown
+        self.pending = OrderedDict()  # Kind -> (text, urgency, time queued)
+        self.notifications = {}  # Kind -> Notify.Notification
+        self.cond = threading.Condition()
+        self.closed = False
+        # Counters updated by the worker, read by metrics
+        self.shown = 0
+        self.dropped = 0
+        self.latency_total = 0.0  # Seconds from queueing to shown notification
         Notify.init(app_name)
 
-    def _show_notify(self, text='', urg=0):
-        """Shows notification via libnotify"""
-        status = Notify.Notification.new(self.app_name, text, 'dialog-information')
+        self.worker = threading.Thread(target=self._worker, name='notify')
+        self.worker.daemon = True
+        self.worker.start()
+
+    def _worker(self):
+        """Show pending notifications until closed"""
+        while True:
+            with self.cond:
+                while not self.pending and not self.closed:
+                    self.cond.wait()
+                if self.closed:
+                    return
+                kind, (text, urg, queued) = self.pending.popitem(last=False)
+
+            if time.monotonic() - queued > self.timeout:
+                self.dropped += 1
+                continue  # Outdated: the server was busy for too long
+            try:
+                if text is None:
+                    self._close_notify(kind)
+                else:
+                    self._show_notify(kind, text=text, urg=urg)
+                    self.latency_total += time.monotonic() - queued
+                    self.shown += 1
+            except Exception:
+                self.dropped += 1  # Notification server is not available
+
+    def _push(self, kind, text, urg=0):
+        """Queue notification replacing the pending one of the same kind"""
+        with self.cond:
+            self.pending.pop(kind, None)
+            self.pending[kind] = (text, urg, time.monotonic())
+            self.cond.notify()
+
+    def _show_notify(self, kind, text='', urg=0):
+        """Shows notification via libnotify
+
+        :param kind: Notification of the same kind is updated in place
+        """
+        status = self.notifications.get(kind)
+        if status is None:
+            status = Notify.Notification.new(self.app_name, text, 'dialog-information')
+            self.notifications[kind] = status
+        else:
+            status.update(self.app_name, text, 'dialog-information')
         status.set_urgency(urg)
         status.show()
 
+    def _close_notify(self, kind):
+        """Close notification of given kind if it is shown"""
+        status = self.notifications.pop(kind, None)
+        if status is not None:
+            status.close()
+
     def show_status(self, status):
         """Shows current status"""
         status = ' '.join(['Current stage:', status])
-        self._show_notify(text=status)
+        self._push('status', text=status)
 
     def show_action(self, action):
         """Shows current action e.g. pause, stop, run"""
-        self._show_notify(text=action, urg=1)
+        self._push('action', text=action, urg=1)
+
+    def show_remain(self, remain):
+        """Shows remain time
+
+        It is called on throttled ticks, see Events.EventBus.
+
+        :param remain: Formatted remain time
+        """
+        self.remain_shown = True
+        self._push('remain', text=' '.join([remain, 'left']))
+
+    def hide_remain(self):
+        """Close remain time notification"""
+        if not self.remain_shown:
+            return
+        self.remain_shown = False
+        self._push('remain', text=None)
 
+    def close(self):
+        """Stop the worker, pending notifications are dropped"""
+        with self.cond:
+            self.closed = True
+            self.pending.clear()
+            self.cond.notify()
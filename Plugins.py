@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+wxPomodoro - Simple pomodoro timer based on wxPython Phoenix GUI
+
+The MIT License (MIT)
+Copyright (C) 2017 Georgy Komarov <jubnzv@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import sys
+
+from Events import TRANSITIONS, Tick
+
+EVENTS_GROUP = 'wxpomodoro.events'
+MENU_GROUP = 'wxpomodoro.menu'
+
+# Entry point name -> event class
+EVENT_TYPES = dict([(cls.name, cls) for cls in TRANSITIONS] + [('tick', Tick)])
+
+
+def entry_points(group):
+    """Returns entry points of installed packages in group"""
+    try:
+        from importlib import metadata
+    except ImportError:  # Python < 3.8
+        try:
+            import importlib_metadata as metadata
+        except ImportError:
+            return []
+    eps = metadata.entry_points()
+    if hasattr(eps, 'select'):
+        return list(eps.select(group=group))
+    return list(eps.get(group, ()))
+
+
+class LazyHook:
+    """Callable that imports entry point on the first call
+
+    Errors of a plugin are reported to stderr and never reach the timer,
+    a plugin that failed to load is not called anymore.
+    """
+
+    def __init__(self, entry_point):
+        self.entry_point = entry_point
+        self.func = None
+        self.broken = False
+
+    def __call__(self, *args):
+        if self.func is None:
+            if self.broken:
+                return
+            try:
+                self.func = self.entry_point.load()
+            except Exception as e:
+                self.broken = True
+                sys.stderr.write('Plugin {} is disabled: {}\n'.format(self.entry_point.value, e))
+                return
+        try:
+            self.func(*args)
+        except Exception as e:
+            sys.stderr.write('Plugin {} failed: {!r}\n'.format(self.entry_point.value, e))
+
+
+class PomodoroPlugins:
+    """Plugins installed as packaging entry points
+
+    Plugins declare hooks in their package metadata, so they are found
+    without importing them:
+
+        [wxpomodoro.events]
+        finish = myplugin:on_finish
+
+        [wxpomodoro.menu]
+        Export to CSV = myplugin:export
+
+    Names in `wxpomodoro.events` are timer events: start, finish, pause,
+    resume, skip, stop and tick. A hook is called with Events.TimerEvent.
+    Names in `wxpomodoro.menu` are labels of tray menu items, a hook is
+    called with MainFrame. Plugin module is imported when its hook is
+    called for the first time.
+    """
+
+    def __init__(self):
+        self.events = []  # (event class, LazyHook)
+        for ep in entry_points(EVENTS_GROUP):
+            cls = EVENT_TYPES.get(ep.name)
+            if cls is None:
+                sys.stderr.write('Plugin {}: unknown event {}\n'.format(ep.value, ep.name))
+                continue
+            self.events.append((cls, LazyHook(ep)))
+        self.menu = [(ep.name, LazyHook(ep)) for ep in entry_points(MENU_GROUP)]
+
+    def subscribe(self, bus):
+        """Subscribe event hooks to Events.EventBus"""
+        for cls, hook in self.events:
+            bus.subscribe(hook, cls)
+
+    def unsubscribe(self, bus):
+        for cls, hook in self.events:
+            bus.unsubscribe(hook)
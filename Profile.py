@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+wxPomodoro - Simple pomodoro timer based on wxPython Phoenix GUI
+
+The MIT License (MIT)
+Copyright (C) 2017 Georgy Komarov <jubnzv@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import cProfile
+import io
+import pstats
+import sys
+import time
+import tracemalloc
+
+from Engine import MS
+
+
+class Histogram:
+    """Latency histogram with power-of-two buckets
+
+    Bucket `i` counts values in [2^(i-1), 2^i) microseconds, bucket 0 is
+    below one microsecond and the last one is everything from ~0.5 second.
+    """
+
+    BUCKETS = 21
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+        self.total = self.max = 0  # Nanoseconds
+
+    def add(self, value):
+        """Account a value in nanoseconds"""
+        self.counts[min((value // 1000).bit_length(), self.BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def format(self, title):
+        """Returns histogram as text table, times are in milliseconds"""
+        lines = ['{}: {} samples, mean {:.3f} ms, max {:.3f} ms'.format(
+            title, self.count, self.total / self.count / MS if self.count else 0.0,
+            self.max / MS)]
+        for i, count in enumerate(self.counts):
+            if count:
+                if i < self.BUCKETS - 1:
+                    upper = '{:>10.3f} ms'.format(2 ** i / 1000)
+                else:
+                    upper = '{:>13}'.format('inf')
+                lines.append('  < {} {:8} {}'.format(
+                    upper, count, '#' * max(1, count * 40 // self.count)))
+        return '\n'.join(lines)
+
+
+class Profiler:
+    """Profile the main loop and timer wakeups, enabled by --profile
+
+    It collects cProfile statistics and tracemalloc allocations of the whole
+    main loop, plus histograms of timer handler latency and event loop
+    lag: how much later than planned the timer woke up. Report is written
+    when the main loop exits.
+    """
+
+    TOP_FUNCTIONS = 25
+    TOP_ALLOCATIONS = 15
+    TRACEMALLOC_FRAMES = 1  # Keep tracing cheap, line of allocation is enough
+
+    def __init__(self, path='-'):
+        """
+        :param path: Path of report, '-' for stderr. Raw cProfile data is
+                     saved next to report file as `path.prof`
+        """
+        self.path = path
+        self.profile = cProfile.Profile()
+        self.handler = Histogram()
+        self.lag = Histogram()
+        self.memory = None  # tracemalloc (snapshot, current, peak) of the run
+
+    def timed(self, handler, stats):
+        """Wrap timer event handler to fill latency histograms
+
+        :param handler: Handler of timer events, e.g. MainFrame.TimerLoop
+                        or PomodoroDaemon.tick
+        :param stats: Engine.TickStats of the timer that fires events
+        """
+        def wrapper(*args):
+            self.lag.add(stats.late)
+            t_start = time.perf_counter_ns()
+            handler(*args)
+            self.handler.add(time.perf_counter_ns() - t_start)
+        return wrapper
+
+    def run(self, func):
+        """Call func, e.g. app.MainLoop, under profiler and write report"""
+        tracemalloc.start(self.TRACEMALLOC_FRAMES)
+        self.profile.enable()
+        try:
+            return func()
+        finally:
+            self.profile.disable()
+            current, peak = tracemalloc.get_traced_memory()
+            self.memory = (tracemalloc.take_snapshot(), current, peak)
+            tracemalloc.stop()
+            self.dump()
+
+    def report(self):
+        """Returns text report"""
+        out = io.StringIO()
+        out.write(self.lag.format('Event loop lag') + '\n\n')
+        out.write(self.handler.format('Timer handler latency') + '\n\n')
+
+        if self.memory:
+            snapshot, current, peak = self.memory
+            out.write('Memory: {:.1f} KiB traced at exit, {:.1f} KiB peak\n'.format(
+                current / 1024, peak / 1024))
+            for stat in snapshot.statistics('lineno')[:self.TOP_ALLOCATIONS]:
+                out.write('  {}\n'.format(stat))
+            out.write('\n')
+
+        stats = pstats.Stats(self.profile, stream=out)
+        stats.sort_stats('cumulative').print_stats(self.TOP_FUNCTIONS)
+        return out.getvalue()
+
+    def dump(self):
+        """Write report to `path`"""
+        if self.path == '-':
+            sys.stderr.write(self.report())
+            return
+        with open(self.path, 'w') as f:
+            f.write(self.report())
+        self.profile.dump_stats(self.path + '.prof')
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+wxPomodoro - Simple pomodoro timer based on wxPython Phoenix GUI
+
+The MIT License (MIT)
+Copyright (C) 2017 Georgy Komarov <jubnzv@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import datetime
+import os
+import sqlite3
+import time
+
+from Engine import PHASE_POMODORO
+
+
+class PomodoroStats:
+    """Statistics of completed pomodoros
+
+    Counters are loaded once from `daily` table of HistoryStore and then
+    updated on each finished pomodoro, so reading them never rescans
+    history. It accepts the same events as HistoryLog.
+    """
+
+    def __init__(self, days=None):
+        """
+        :param days: Dict of date -> [pomodoros, seconds]
+        """
+        self.days = {}
+        self.streak_days = 0  # Length of the last run of days with pomodoros
+        self.streak_last = None  # The last day of that run
+        for day, (pomodoros, seconds) in sorted((days or {}).items()):
+            self._add(day, pomodoros, seconds)
+
+    @classmethod
+    def load(cls, path):
+        """Returns stats loaded from HistoryStore database
+
+        :param path: Path of the database, missing one gives empty stats
+        """
+        days = {}
+        if not os.path.exists(path):
+            return cls(days)  # First run
+        try:
+            conn = sqlite3.connect(path)
+            try:
+                for day, pomodoros, seconds in conn.execute('SELECT day, pomodoros, seconds FROM daily'):
+                    days[datetime.datetime.strptime(day, '%Y-%m-%d').date()] = [pomodoros, seconds]
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass  # Database isn't initialized yet
+        return cls(days)
+
+    def _add(self, day, pomodoros, seconds):
+        counters = self.days.setdefault(day, [0, 0])
+        counters[0] += pomodoros
+        counters[1] += seconds
+
+        if self.streak_last == day:
+            return
+        if self.streak_last == day - datetime.timedelta(days=1):
+            self.streak_days += 1
+        else:
+            self.streak_days = 1
+        self.streak_last = day
+
+    def record(self, event, phase, seconds, started=None):
+        """Handle timer event. See HistoryLog.record for parameters."""
+        if event == 'finish' and phase == PHASE_POMODORO:
+            self._add(datetime.date.fromtimestamp(time.time()), 1, seconds)
+
+    def close(self):
+        """Nothing to release, it's here to be used as history sink"""
+
+    def today(self):
+        """Returns tuple of (pomodoros, seconds) completed today"""
+        return tuple(self.days.get(datetime.date.today(), (0, 0)))
+
+    def streak(self):
+        """Returns number of consecutive days with pomodoros up to today
+
+        Today is counted as a part of streak even before the first pomodoro.
+        """
+        today = datetime.date.today()
+        if self.streak_last in (today, today - datetime.timedelta(days=1)):
+            return self.streak_days
+        return 0
+
+    def chart(self, count):
+        """Returns list of (date, pomodoros) for the last `count` days"""
+        today = datetime.date.today()
+        return [(day, self.days.get(day, (0, 0))[0])
+                for day in (today - datetime.timedelta(days=i) for i in range(count - 1, -1, -1))]
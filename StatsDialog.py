@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+wxPomodoro - Simple pomodoro timer based on wxPython Phoenix GUI
+
+The MIT License (MIT)
+Copyright (C) 2017 Georgy Komarov <jubnzv@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import wx
+
+
+class ChartPanel(wx.Panel):
+    """Bar chart of pomodoros per day"""
+
+    BAR_COLOUR = (220, 60, 60)
+
+    def __init__(self, parent, chart, *args, **kwargs):
+        """
+        :param chart: List of (date, pomodoros) tuples
+        """
+        super(ChartPanel, self).__init__(parent, *args, **kwargs)
+        self.chart = chart
+        self.SetMinSize((24 * len(chart), 120))
+        self.Bind(wx.EVT_PAINT, self.OnPaint)
+
+    def OnPaint(self, event):
+        dc = wx.PaintDC(self)
+        width, height = self.GetClientSize()
+        label_h = dc.GetTextExtent('0')[1] + 2
+        bar_w = width // max(len(self.chart), 1)
+        top = max([count for day, count in self.chart] + [1])
+
+        dc.SetBrush(wx.Brush(self.BAR_COLOUR))
+        dc.SetPen(wx.TRANSPARENT_PEN)
+        for i, (day, count) in enumerate(self.chart):
+            bar_h = (height - 2 * label_h) * count // top
+            x = i * bar_w
+            dc.DrawRectangle(x + 2, height - label_h - bar_h, bar_w - 4, bar_h)
+            dc.DrawText(str(day.day), x + 2, height - label_h)
+            if count:
+                dc.DrawText(str(count), x + 2, height - 2 * label_h - bar_h)
+
+
+class StatsDialog(wx.Dialog):
+    """Shows statistics of completed pomodoros"""
+
+    CHART_DAYS = 14
+
+    def __init__(self, parent, stats):
+        """
+        :type stats: Stats.PomodoroStats
+        """
+        super(StatsDialog, self).__init__(parent, wx.ID_ANY, title='Statistics')
+
+        pomodoros, seconds = stats.today()
+        mainSz = wx.BoxSizer(wx.VERTICAL)
+
+        countersSz = wx.FlexGridSizer(rows=3, cols=2, vgap=5, hgap=10)
+        for label, value in (('Pomodoros today', pomodoros),
+                             ('Focus minutes today', seconds // 60),
+                             ('Streak (days)', stats.streak())):
+            countersSz.Add(wx.StaticText(self, wx.ID_ANY, label=label))
+            countersSz.Add(wx.StaticText(self, wx.ID_ANY, label=str(value)))
+        mainSz.Add(countersSz, flag=wx.ALL|wx.EXPAND, border=10)
+
+        chartBox = wx.StaticBox(self, wx.ID_ANY, label='Last {} days'.format(self.CHART_DAYS))
+        chartSz = wx.StaticBoxSizer(chartBox)
+        chartSz.Add(ChartPanel(chartBox, stats.chart(self.CHART_DAYS)), proportion=1,
+                    flag=wx.ALL|wx.EXPAND, border=5)
+        mainSz.Add(chartSz, proportion=1, flag=wx.ALL|wx.EXPAND, border=10)
+
+        mainSz.Add(self.CreateButtonSizer(wx.OK), flag=wx.ALL|wx.EXPAND, border=10)
+        self.SetSizerAndFit(mainSz)
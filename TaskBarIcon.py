@@ -24,1095 +24,19 @@ OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
 OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
+import os
+
 import wx
 import wx.adv
-from wx.lib.embeddedimage import PyEmbeddedImage
 
 from Timer import PomodoroTimer
 
-PAUSE_ICON = PyEmbeddedImage(
-    b'iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAABHNCSVQICAgIfAhkiAAAIABJ'
-    b'REFUeJzs3XeYnHW5//H3PbMpkAQULLQAEZKdzQqIBhXEEkQBBRuoCKI/lCYWFPSIniMCNlDx'
-    b'CHjEAooNBcQOCCqxUDWoATY7uwsECE2lkwBJduf+/ZEJhGTL7O7M3t/neT6v6+K6jgfIvNlM'
-    b'5nvP92mGiDSNOyX62BFnPrAjUMGZCUwDnhFblxmPAMuBu4Ae4AZK/Im7uN7m0x+bJpIfFh0g'
-    b'kgfewy7AITgHAs+O7smph4CLKPF9ZvMXMzw6SCTLNACIjIP3sA/OJ4Hdo1sKxfkH8Dkq/NyM'
-    b'WnSOSBZpABAZA+9ie8p8DdgruqXgrsc42tr5a3SISNaUogNEssQd8yofpsxNaPFPwYtwrvZu'
-    b'TnSnHB0jkiXaARBpkHcxnTI/BN4Y3SKDuoIB3mqdPBAdIpIFGgBEGuBdbEKZXwO7RbfIsLoZ'
-    b'YG/r5I7oEJHUaQAQGYHfwDOZzJ+AHaJbpCG3AS+zCndHh4ikTOcAiAzDl7IBk/k1WvyzZFvg'
-    b't75E910QGY4GAJHhLOdM4GXRGTJqO7CSH7hrl1NkKBoARIbg3bwDeG90h4yRsy9VPhCdIZIq'
-    b'Tccig6if9FdFd/XLusdwOq2D26JDRFKjHQCRwbTxBbT458GGGF+OjhBJkXYARNbhXWxNmZuB'
-    b'SdEt0iTOPOvg+ugMkZRoB0BkXWWOR4t/vhjHRyeIpEY7ACJr8UVMYwr3ADOiW6Sp+hlgpnVy'
-    b'b3SISCq0AyCytqnsjxb/PGqjjXdER4ikRAOAyNpqvCk6QVrEeUt0gkhKdAhApM6dEj38B9gk'
-    b'ukVaYiUr2MR2Ynl0iEgKtAMgskYPz0eLf55NZgoviY4QSYUGAJE1jI7oBGkx/R6LPEkDgMhT'
-    b'2qMDpOUq0QEiqdAAIPIU3fkv71y/xyJraAAQeYou/8s//R6L1GkAEHnK5OgAabkp0QEiqdAA'
-    b'ILKG6/KwAlgWHSCSCg0AIms4j0QnSMvp91ikTgOAyBrGHdEJ0nK3RweIpEIDgMgaTjU6QVqu'
-    b'JzpAJBUaAETWqLEI8OgMaaEa/4xOEEmFngUgshbvpgtjbnSHtMS/aWczMw15IqAdAJGnM34X'
-    b'nSAt8zst/iJP0QAgsrYSP45OkBYxzotOEEmJBgCRtdgcrgO6ozuk6e7lbi6PjhBJiQYAkXUZ'
-    b'X4lOkCYzTrf59EdniKREJwGKrMO7mEyZm4GZ0S3SFA9SZlubrZsAiaxNOwAi67BOVuIcH90h'
-    b'TeKcoMVfZH3aARAZglf5PfDq6A4ZB+cfVNjFjIHoFJHUaAdAZChtHArcF50hY7acNt6pxV9k'
-    b'cBoARIZg27MU51CgFt0iY2AcbbNZHJ0hkioNACLDsA5+A3wgukNGyTnJ2vl+dIZIyjQAiIzA'
-    b'KpwFfCq6Qxp2hnVwYnSESOp0EqBIg7yHo3HORINzyk61iq7gEGmEBgCRUfAqewA/AjaLbpGn'
-    b'eQTjSGvnJ9EhIlmhbzIio2AVrgBeBPw6ukWe9EfKvFCLv8joaAdAZIy8m/0wvghUolsK6nbg'
-    b'v2nnPD3lT2T0NACIjIM7JXo4APgwsGt0T0EsAs5gGT+weayKjhHJKg0AIk3ii5lNiQNx9sR4'
-    b'KTA5uikn+jEW4vwBuMAq3BAdJJIHGgBEWsCXsgGP0kGZOThbAxsBMzCmjv0XZTYwv1mNLWWc'
-    b'C6wcw7+5EngU52HgLowe+um2TpY1tU9ENACIZIX3cAiekZvblNlYD+ARSZuuAhARESkgDQAi'
-    b'IiIFpAFARESkgDQAiIiIFJAGABERkQLSACAiIlJAGgBEREQKSAOAiIhIAWkAEBERKSANACIi'
-    b'IgWkAUBERKSANACIiIgUkAYAERGRAtIAICIiUkAaAERERApIA4CIiEgBaQAQEREpIIsOEJHV'
-    b'fAnP4AlmAttQYmtqzMTq/xu2BjYFpoVGNu4a4FaMO3DuwLiDfm4HbrdOlkXHiYgGAJEJ5V1M'
-    b'p0wFo4MaczEqGLNxZgIbRfdNkAeAOzBuBao4i6nRzWNUbR6PRceJFIUGAJEW8EVMYzI7UWIu'
-    b'NTowOoEKq7/J68/d4By4DagCXUCVGl3MYJHN5PHQMpEc0geRyDj5Atp4Du208SKcFwEvAnYB'
-    b'Jgen5cUATg/G9cD1GNczmYU2iyeiw0SyTAOAyCh5DxVqvATYBWMXYCdgSnBW0awAFgELcf6K'
-    b'8WersCQ6SiRLNACIjMCrbAG8DGNPnL1ZvY0v6bkHuBLn99S4yjrpig4SSZkGAJF1+GK2wXgV'
-    b'sAfGfGBmcJKMzZ3AAuBPlFhgc7g1OkgkJRoApPC8i8kYr6TMfjivA7aLbpKWqGJcjHMJy/iL'
-    b'zWNVdJA0xm9hY1axF7AjsAXOczAewvk3cCvOZTaXvuDMzNEAIIXkfTybfl6HsS+wFzAjukkm'
-    b'1CPA5cAlrOIS24F/RQfJ+rzKHhjH47wKmDTCP96L8y2m83VdNdIYDQBSGN5FJ23sh7Mf8BKg'
-    b'HN0kSXDgeuAX1LhA3yTjeR9z6ed0jD3H8K/fhfM/1sG5ze7KGw0Akmu+mG0o8Sacd2PsHN0j'
-    b'GeAsBi4EzrMOeqNzisZ72Afnx8DG4/ylzmaA91snK5vRlUcaACR36mftvw14B/Di4BzJtr/h'
-    b'XIBzoc3l9uiYvPMq7wO+RvOeU/MXJrGfbcfDTfr1ckUDgOSCd7EJbeyP8w7glehBV9JcDlyL'
-    b'cy6TOV8LSvN5N3thXEyzD8051zGZvfR7tj4NAJJZ7pToYw9qHAG8Ed15TybGY8BFON+hwp/M'
-    b'8OigrPM+tmOAhcAzWvMCGgIGowFAMse72Iwy7wYOR5fsSaylwHk437AObouOySqv8lNg/xa/'
-    b'zPWs5DW2Iw+2+HUyQwOAZII7JXp4Lcbh9bP4R7okSGQiDQC/w/gmc/i1GQPRQVnhVeYBf2Ui'
-    b'1iPtBDyNBgBJmvfxbAY4AjgM2DY4R6QRS3D+j6mcY7N4KDomdd7NjzEOnLAXNK6ljb01BGgA'
-    b'kER5F9tT5oOsXvg3jO4RGYMngAup8UWby03RMSnyhUxiOv+mVcf+h6bDAWgAkMR4lfkYx9Zv'
-    b'yasz+SUPnNWHB05nDr81oxYdlAqvMh+4IuTFjWspsZfN5pGQ10+APmAlnC9kklc52KtcD1yB'
-    b'sy96b0p+GPBanIvpocu7ebcv1DksADjPD3ztl1LjMu9jo7CGYPqQlTC+kA29h2OZzq3AD4EX'
-    b'RjeJtFgF41ym0+tV3udLmBodFKrEZqGvX/AhQAOATDhfyIbezXFMZwnOacBW0U0iE2xb4Ous'
-    b'4Fbv5jjvYnp0UJBnRQfgvJQBflvEIUADgEwYX8S0Jxd+48vAc6KbRIJtjvFlytzmPZzgN/DM'
-    b'6KAJ5cmcib9rEYcADQDScr6QDb3KMUyhTwu/yKA2xTmJydzhVU4pzEJk3BudsJbCDQEaAKRl'
-    b'fCkbeDcfZTpLgK8Cm0c3iSRuOvBxBujxHo7O/cmCzi3RCeso1BCgywCl6dwxejgAOBWYFd0j'
-    b'kmF34HyOCufk8e6C3sV0ytwHTIluWcc1lNk775cIagCQpvJudsU4Ddg1ukUkN5zFGCdahQuj'
-    b'U5rNq1wGvDa6YxC5HwJ0CECawnvp8Cq/wrgaLf4izWXMBS7wKgu8yo7ROU1lfCM6YQi7MsCl'
-    b'eT4coB0AGRfvZlOME4CjgbboHpECqAE/oo2P2vb8OzqmGbyHa3BeGt0xhNzuBGgAkDHxhUxi'
-    b'GsfUF/8Z0T0iBfQAxgnczTdtPv3RMePhPbwcZwFQjm4ZwtXA3lbh0eiQZtIAIKPmPeyO83Vg'
-    b'h+gWEaEKfMQq/DY6ZDy8h2PrNwZLVe52AjQASMO8j2dT44s470bvHZHU/JQ2jrXtWRodMlZe'
-    b'5TvAodEdw8jVToA+xGVE7hi9HFKfzuNv3SkiQ3kMOJl2vpzFywbdKdPDd4FDoluGkZudAA0A'
-    b'Mizv5QXU+Do6s18kS65hgMOtk67okNFyp0yV72C8K7plGFdTZp+sDwEaAGRQvoSprOAzwEdI'
-    b'98QcERnaSuBUynzOZrMiOmY0MrITcBWwT5YPB2gAkPV4Ly+hxneBjugWERkn42acI63CFdEp'
-    b'o+FOiV7Owfl/0S3DyPROgAYAeZL3MYUBTgI+ir71Z8ky4H7gP8B9wP0Yy6mxDGNV/Z95EABj'
-    b'FTWW1f/vx3A2BKDEJLz+SFpnQ+zJW7NuDEwGNh3kL71HssOBb7KCj9pOLI+OaZQ7JXo4m7RP'
-    b'DMzsToAGAAHAq8zDOBenM7pFnrQCuB24DeM2YAk1bgfuYfUifz9l7o/a3vUuNqHEs1gzEJTY'
-    b'GmcWq591v+YvnTSaEuNmBjjE5nJtdEqj6kPAt4D3RrcMI5NDgAaAgvMuJlPmBODj6E5+EQaA'
-    b'm4EbMG7CuRVYAiyhnXvM8Ni88fEqM/D6MGDMYvVhpR2A57N6d0EmXj9wCss42eY9uUOUNL+F'
-    b'jVnFzaQ9UGZuCNAAUGC+mOdT4jx0Q5+Jch+wCLix/tcNTKPLZvJ4bFYM72ZbjB1Z/f7bsf7X'
-    b'bHRoYaJcT4lDbA7d0SHD8T42YoDfko0rka4EXpeVIUADQEF5laOArwAbRLfk1CqM66lxDXAl'
-    b'xrVW4e7oqNT5EqbyBDsDu2HsDuwGPCc4K88ex/k4Fb6W4m5Txhb/NTIzBGgAKBhfwjNYwdnA'
-    b'/tEtOfMgztWsPiv4Sjbgb0X9Zt9svpjZGC/DeBnObhgd6LOruYzfsZJDbAf+FZ2yRkYX/zWu'
-    b'ZIB9rLN+wm2i9IeoQLyb3TDOA7aJbsmBFTh/ocSlDHA5HXSl+A0qj7ybTYFXYewN7A1sFZyU'
-    b'F/fgHGQd/DE6JOOL/xq/pJ23mFGLDhmKBoACcMfo4UPAl4BJ0T0ZtgTjdzi/p8xlWb32N2+8'
-    b'l+dRYz+cfTFeDk9ewiijN4DzWSqcHLVw+SKmMZlLMF4R8fpN9lmr8KnoiKFoAMg5X8zmlPgB'
-    b'8Orolgzqx1iAczHOpdZBb3SQDM+rzMB4Nc7ewBuBzaKbMuoyyhxis/nPRL5oTr75r80psavN'
-    b'4brokMFoAMix+pb/T4HNo1sypAZcA1zIAOdbJ/dGB8nY1O8ktxvOW4G3oWFgtO7CONDauXIi'
-    b'Xixn3/yf4vzZOnhldMZgNADkVP0s/9NZfRc3GV4N50pKnM9KLkrpRChpDl9AG89lPiXeDrwZ'
-    b'2CS6KSP6gU/Wny7YsnNccvjNf117WIUF0RHr0gCQM/Xb+X4NOCy6JQOuB74P/FSX6BWHL2QS'
-    b'M9gT5x3AAehS2EaczzLeY/N4rNm/cAEWf4CzrMLR0RHr0gCQI15lC4yLcF4a3ZKwRzB+wgDf'
-    b'tLn8PTpGYnkfG9HPgRhHAi+M7kncImq80eZye7N+wdxu+69vKe1sk9qVQhoAckLH+0d0NXA2'
-    b'K7ggSw9DkYnjPexCjcMxDgRmRPckyfgXzv5W4arx/lIF+eb/lBrbNnN4agYNADng3RyBcSY6'
-    b'3r+uB4AfMMC3rZOu6BjJBu9iOm0ciHM48OLongStAI62Ct8Z6y9QuMUfwNnNOrgmOmNtGgAy'
-    b'rH6W8xdxjotuSYpxM/BVHuW7rThmKcXhi3kpJY5j9YmDekbB053OPXzU5tM/mn+pkIs/gLO/'
-    b'dfCz6Iy1aQDIKF/KBizn+6w+iUlWuxrnNCr8IuW7b0n2eC/Pw/kIzqHAtOieZBi/o8QBjd4U'
-    b'q7CLP4DxZmvnF9EZa9MAkEHexSaU+QXw8uiWBNQwLsE5pRnHJUWGU1/ADgU+im5BvMZNtPE6'
-    b'256lw/1DBTrhb3DGS6ydv0ZnrE0DQMZ4F9vTxqU420e3BFsBnEOZr9hsbomOkWKpX257MPBx'
-    b'YE50TwLuoMw+NpvFg/3NQn/zX6PMTJvNndEZa9MAkCH145G/pNiPR10F/IQSJ9ocbo2OkWJz'
-    b'p0QP+2N8XkM5D1LiTTaHP6/9/yz8N//VbrUK20VHrKsUHSCN8SoHUGIBxV38+zHOBdqtwru0'
-    b'+EsKzKhZhQt5lLk4R8Hw2+A590xqXObdTz1q3PvYiCn8LpnF3/g0xo8DXvnXAa85Iu0AZIB3'
-    b'cyTG1ynmwFYDfoJzkh7GI6nzPqbQzxEYn6C49+SoAR+hzLmJbfufYBU+406ZHr4PHDRhr1xj'
-    b'V5vLtRP2eg3SAJA47+FYnC9TxN8r42f0c4Ku4Zes8YVsyDTeVx8ENo3uCXInqZwoaXza2jl5'
-    b'zf+sDwHfAw6egNf+jbWzX8tfZwyKt6hkiHdzIsanozsmnPMP4CPWwZ+iU0TGw7vYhDZOrB8e'
-    b'mBTdU0jrLP5r1IeAc4F3tvDVB3B2tg5ubOFrjJkGgAS5Y/TypQLe4Od+4DO08zUzBqJjRJrF'
-    b'u5lDidNw9o1uKRTjRGvnpKH+tjtlejkH590tev1jrZ3/bcmv3QQaABJTX/xPx/lgdMsEWgWc'
-    b'xSROsO14ODpGpFW8lz1xvorTGd2SeyMs/mvU76j6naYPAc73raNFg0WTFPGksmT5Atro4YcF'
-    b'W/x/yQBzrcIxWvwl72wOv+dRdsY4Fngouie3Glz8YfWVHMzhPcAXm1hwNjUOb+Kv1xLaAUiE'
-    b'L6CNLTgf5y3RLRPkNpyjrIPLokNEIngfz2aAr9DaY9DFs/qKoRPH9K9WORj4NrDBGF99FfBR'
-    b'q3DGGP/9CaUdgAS4Y2zONwqy+NcwvgXsqMVfisxm8x+rcAiwD6T1mNjMMk4c6+IPYBV+RJk5'
-    b'9c+o0TzkyIELcZ6flcUftAOQBO/mKxgfie6YADdiHJba/bBFonkX0ynzWeAD6KmDYzOOb/6D'
-    b'/nJ9bMcABwD7svpeBuv+vjhwPc7FOD+1udzUrNeeKBoAgnmV/wY+G93RYk8An2MZp9o8VkXH'
-    b'yFO8ygzaeUxXXaTBe3kJNb4N7BDdkilNXvzX++X7mMJKnkuJLTFKlLiHDbjHZvJ4q15zImgA'
-    b'CORVjgLOiu5osasocbjNoTs6RNbnPZxHjWusgzOjW2Q1X0Abm3MccCIwNTgnC061CsdHR2SR'
-    b'BoAg3s1bMC4gv9t9q3A+T4WTzahFx8j6vIdDcL4PPIrRYe3cFd0kT/E+5jLAj4AXRLckTIv/'
-    b'OOgkwADey54Y55Hfxb9KjZdaBydq8U+T38xMnNPr/3MGzldDg2Q9NpvFTGFX4FTQn6NBaPEf'
-    b'J+0ATLD6Mb7fA9OjW1rkB6zgfbYTy6NDZHD1R9heAbxynb/1Rqvwq4gmGZ73sic1vgdsEd2S'
-    b'iC9ahY9HR2SdBoAJ5It5PiX+BGwS3dIC/wEO0wKSPu/hBHzQm6TcwQCd1smyCY+SEdXvG3A2'
-    b'8IbolmBa/JtEhwAmiPfyPEpcTh4Xf+N3wAu0+KfPq8zD+Z8h/vbWlAv48KmMqN834I0Y74bC'
-    b'7rBp8W8i7QBMAF/M5pS4EnhedEuT9eN8ggqnmeHRMTI8X8Q0pvB3YM4w/1g/ZV5ss/nHRHXJ'
-    b'6HkXnZS5CGiPbplAn7UKn4qOyBPtALSY38LGlLiE/C3+91FiH+vgy1r8M2IKZzL84g/QxgDf'
-    b'dM/tCaq5YJ10AbsAP41umSBf1OLffBoAWsgXsiGr+A35u4zn7zi72Bx+Hx0ijfEe3gwc2uA/'
-    b'vgu9HNXKHhk/q/Ao7bwNOB5yfSOnL2nbvzV0CKBFfCGTmM6vgb2iW5rK+TZtfNBmsyI6RRrj'
-    b'PWyJswjYdBT/2iMYc3VvgGzwbl5bv7R4NL/HWdBHOx26U2VraAegVaZzBvla/FdgHGEdHKHF'
-    b'PzvcKeF8j9EvDBvhfKUVTdJ81sHltLEz5O45G7Op8qXoiLzSANAC3sP7IVdbqHcCu1s7344O'
-    b'kVHq4Tjg1WP8t9/m3ezXzBxpHduepUzhlRjfi25pKuMjXuW90Rl5pEMATea9vIIavwMmR7c0'
-    b'yY208XrbnqXRITI63sfODHAt43sv6t4AGeRVjgG+Qn6+5K3Cea118MfokDzJy5sjCV5lFjUu'
-    b'Ij+L/+WU2V2Lf/b4EqYywPcY/3txa8o6+zprrMLpwIGsfhJnHkzC+Kn3sV10SJ5oAGgSrzID'
-    b'+BXwrOiWJjmbZexrs3kkOkTGYAWn0bxHyh7rvbm7kiX3rMKFOHuw+i6debAp/fzKb2Hj6JC8'
-    b'0ADQBO6U6mfgPj+6pQkc5ySrcLjNY1V0jIyeV9kbeF8Tf8k2anzTXZ8XWWMdXEOZXYHe6Jam'
-    b'MOayih/rPhXNoT/QzdDDKTj7Rmc0wePA26yDE6NDZGy8j2cD36X55/e8mB6ObPKvKRPAZnML'
-    b'ZXYHroluaZJ96OUz0RF5oJMAx8m7eUf923/WPYCzr3Xk5kOicNwxevlVC4dR3Rsgw3wpG7Cc'
-    b'84A3Rbc0gQNvtgq/jA7JMu0AjIMvZjbGN6I7muDfGHto8c+4Ku9v8U7URjintfDXlxaymTxO'
-    b'Owfk5DJBA8713tzdYn1CaQdgjHwJU3mCqzF2jm4Zp3up8Rqby03RITJ23sdcBlgIbND6F2M/'
-    b'6+A3LX8daYn6TtHpOB+MbmmCRUxjV5vJ49EhWaQdgLFawddysPjfzgAv1+Kfbd7HFAb4EROx'
-    b'+AMYX/NFTJuQ15KmM8OZwzE5udPjTizTnQLHSgPAGHg374DM35mqhzK7Wyc3R4fIONV4OxP7'
-    b'wKltmMwBE/h60mRmuHVwHKsfJJRtxvu9yjujM7JIA8AoeTdzML4Z3TEuzmJqzLfZ3BmdIk1Q'
-    b'Y2rAq04JeE1pMqtwKuTiSXtneS8d0RFZowFgFHwR0yjxM2BGdMs4LKTGy20u90SHiEg8q/BF'
-    b'nA+x+sz6rJpOjZ/40gk6DJYTGgBGYyr/h9MZnTEON+LsbZ08EB0iIumwDs7E+Vh0xzjtyHLO'
-    b'iI7IEg0ADfJuDsJ5d3THOPRRYy/r4P7oEBFJj3VwGs5J0R3jdJhXdX5KozQANMCrbIFxZnTH'
-    b'ONxRv9RP2/4iMqT6XUBPje4Yp7O8i82iI7JAA8AI3DHgbGCT6JYxuosS820ut0eHiEgGtPMJ'
-    b'4KzojHF4FuWMn6g9QTQAjKSXo4F9ojPG6D+Uea3N4dboEBHJBjOcdt4PnBPdMg5v8GrmL9Vu'
-    b'OQ0Aw/A+tsM5JbpjjB6mxt42m8XRISKSLfUh4Ejg/OiWcTjdu9g+OiJlGgCG4Atoo8YPgenR'
-    b'LWPwBMa+Npe/R4eISDaZMcAA7wL+GN0yRtMo8109OnhoGgCGsjmfwHlpdMYYOHC4tXNldIiI'
-    b'ZJt1spIyb4TM3i58d3r4aHREqjQADMIX80LgU9EdY+L8t1X4YXSGiOSDzeYR4A0Y/4puGaOT'
-    b'vZsdoiNSpAFgHb6ANoyzgUnRLWNwjnXwhegIEckXq7Ck/qjp5dEtYzAZ4xwdClifBoB1bcaH'
-    b'M/qUvwUMcHR0hIjkk1VYiHMgMBDdMga7UOV90RGp0QCwFu9ia4xPR3eMmtHFFN5inayMThGR'
-    b'/LIOfoPxX9EdY2J83vvYKjojJRoA1lbi62TvrP+7KbOPzeKh6BARyT9r5ys4/xfdMQYz6Nez'
-    b'AtamAaDOq7wV4/XRHaO0CuNA256l0SEiUiD38mHgT9EZo2a82Xt4U3RGKjQAAN7HRsD/RneM'
-    b'wTHWzl+iI0SkWGw+/azi7cCd0S2j5nzdb2Hj6IwUaAAAGOAUYMvojFH6kVUyfb9uEckw24F/'
-    b'UeIAYEV0yyhtTj+fiY5IQeEHAF/MS4EjoztGxfkH0zg8OkNEis3mcB3wkeiOUXPe7728JDoj'
-    b'WqEHAHdKGF8nWz+HBzD2t5k8Hh0iImIVzsL4XnTHKJWocUb9aa+FlaWFr/l6eU/GrvmvYbzT'
-    b'KiyJDhERedJkjgIWRmeM0ovp5Z3REZEKOwB4lRl45o4DfdrauTQ6QkRkbTaLJ3DeCjwQ3TIq'
-    b'zhd8EdOiM6IUdgDA+SSwWXRGw5w/067b/IpImqyD2zAOi+4YpS2ZnNEbGzVBIQcArzIL48PR'
-    b'HaPwEDUOMcvkLThFpCCsnZ8D50R3jIrxMV/MNtEZEQo5AACnAlOjIxpmHGWd3BGdISIyohUc'
-    b'A/REZ4zCBpT4fHREhMINAN7NbsAB0R2j8B1r5/zoCBGRRthOLMc5GDL1bJJ3eA+7R0dMtEIN'
-    b'APXL/r4Kmbn041bI1KEKERGsg+uBk6M7RsFwvuperDWxUP+x9Us+donOaFA/JQ6yCo9Gh4iI'
-    b'jFo7p+D8OTpjFF5EL2+LjphIhRkAfCGT8Ew96vek+l22REQyx4wB2jiYLF0a6JzsC2iLzpgo'
-    b'hRkAmMahwPOiMxr0T+7hlOgIEZHxsNncCXw0umMUZrMZB0dHTJRCDADexWSMT0R3NKifGu+1'
-    b'+fRHh4iIjJdV+C7G76I7Gmac6F1Mjs6YCIUYAChxBLBtdEZDjC/aXP4enSEi0jQ1jgCWR2c0'
-    b'aFtKHBodMRFyPwD4EqZiHB/d0aA+NuSz0REiIs1kHdyGc2J0R8OME3wpG0RntFruBwBWcjSw'
-    b'ZXRGAxzjfXrKn4jkUoX/JTsPDNqC5fl/5HquB4D6Qx6ycZ9n49vWzh+iM0REWqF+K/P3Aqui'
-    b'Wxr0CV/IhtERrZTrAYCpfBDnudEZDbibyXw8OkJEpJWswg04p0V3NGgzpvOB6IhWyu0A4IuY'
-    b'hmfk8hPnQzaLh6IzRERabjonA7dEZzTouDyfC5DbAYDJvAfYNDqjAVdYBxdFR4iITIT6eU7H'
-    b'RXc06Dks593REa2SywHAnTLGMdEdDRgAPhIdISIykazCL4HLozsa9DF3ytERrZDLAYBe3gps'
-    b'F53RgG9ZhRuiI0REJlyZj0Ambnj2PHp4c3REK+RzAPBMfKt+COOE6AgRkQg2m8XAt6M7GpSN'
-    b'q8lGKXcDgFfZA3hxdEcDTrJ27ouOEBEJM8D/APdHZzRgF+/mldERzZa7AQD4WHTAiIybGeDr'
-    b'0RkiIpGskwcgM3c/TX9tGaVcDQDezQ7AXtEdDTjGOlkZHSEiEu4evobRFZ0xIuN13sNO0RnN'
-    b'lKsBgNWPnbToiBH8wdq5JDpCRCQFNp9+apl4WquRs6u2cjMA+I08F+PA6I4ROZ+KThARSYl1'
-    b'8Guc66I7RuQc6D08KzqjWXIzANDGeyDxZzg7F1sH10RniIgkKAtXRU3K4+AIAAAgAElEQVTB'
-    b'8/Oo4FwMAO4YJd4T3TECp8RJ0REiIimyDi4H/hTd0YCj3POxdubiP4Ie9sLZPjpjWM4vrJ2/'
-    b'RWeIiCTL+J/ohAY8jyp7Rkc0Qz4GADgyOmAENX37FxEZnrVzJWTisehHRQc0Q+YHAF/M5sDr'
-    b'ozuG5Vxg7SyKzhARSV4WTpQ29vMetozOGK/MDwCUOQKYFJ0xjAHKnBwdISKSBfUTpS+N7hhB'
-    b'G3BYdMR4ZXoAcKeM897ojhGcb3Pojo4QEcmMLBwydQ7zBbRFZ4xHpgcAeng9MDM6Y1g1TotO'
-    b'EBHJEpvDdcBfojtGsBVbsG90xHhkewAg+W//V9hc/h4dISKSQV+ODhhRxu8JkNkBwLvYBNg7'
-    b'umNYloE3sIhIitr5NSR/+HRv72bT6IixyuwAQJm3kfad/6rM4bLoCBGRLDLDcU6P7hjBZGD/'
-    b'6Iixyu4AAAdFB4zgS2bUoiNERDKrjXOBe6MzRnBwdMBYZXIA8C62Bl4W3TGMfzOF86IjRESy'
-    b'zGazAuMb0R3DMl7u3WwbnTEWmRwAaOMg0m4/w2bxRHSEiEjm9XMmsDw6YxhGKQNPoh1Eyovo'
-    b'0Dzp7f/H8cQnVhGRjLBOHsD4UXTHsDybhwEyNwB4lR2BHaI7hnGRdXB/dISISG7U+FZ0wgie'
-    b'X1+bMiVzAwCpn3BR4tvRCSIieWIdXA/J31Ml7bVpEJkaANwx4O3RHcPoYXbyd68SEcmi1L9c'
-    b'pbw2DSpTAwDd7AxsE50xJOfbZnh0hohI7kzix6R9MuA23ssLoiNGI1sDgPGG6IRhrGQSP4iO'
-    b'EBHJI9uOhzEujO4Ylie9Rq0nWwMASf9wf2Hb8+/oCBGR3KolfhhAA0BreA9bYglvr+jkPxGR'
-    b'lrIOrsboiu4Yxgu9j62iIxqVmQEAeCNg0RFDWMJsroiOEBHJPefs6IRhGAPsFx3RqOwMAGlv'
-    b'rfxQ9/0XEZkAZX4E9EdnDCPlteppMjEAeBfTgVdFdwypxgXRCSIiRWCz+Q/wp+iOYcz3KjOi'
-    b'IxqRiQGAMvsAU6IzhlC1udwUHSEiUhie9JeuKcBe0RGNyMYAQMLHVJzzoxNERAqlxM/QYYBx'
-    b'S34AqN/97zXRHUNqS3oSFRHJHWvnPuAP0R3D2LO+diUt+QGAbjqBzaIzhnCDzWZxdISISAGl'
-    b'/OVrc/qoREeMJP0BwJgfnTCMlN+AIiL5NYWfASujM4bk7BGdMJL0BwASHgB09r+ISAibxUM4'
-    b'v4vuGJInvHbVJT0AuFPCeGV0xxAW2Vz6oiNERArsp9EBw3iVe9prbNJxdPMCYJPojEEZF0cn'
-    b'iIgUWhsXQ7I3YduUm9kpOmI4aQ8AlvQxlN9GB4iIFFn9pkD/jO4YUn/Sa1jyA0Cqx1Ae4VGu'
-    b'jY4QEREujQ4YRqprGJDwAOALaAN2j+4YwuU2j1XRESIikvAAYLzCFzIpOmMoyQ4APJd5wEbR'
-    b'GUPQ9r+ISAru4TrgweiMIcxgI14YHTGUdAeAEi+NThiCYxoARERSYPPpB34f3TGkAV4cnTCU'
-    b'dAcA2CU6YAg3WDt3RUeIiMiTUj4MkOpapgFgDPTtX0QkJQNcCnh0xhC0AzAavoRnANtHdwzK'
-    b'Er7zlIhIAVkn90Kyj2WfU1/TkpPkAMDj7AJJPkmpn36ui44QEZH1XBUdMARjFfOiIwaT5gBQ'
-    b'SnbL5J/WybLoCBERWU+qA0CyJwKmOQCke/w/3TeYiEixpfv5nOiJgBoARifdN5iISIFZhSXA'
-    b'ndEdQ3hJdMBgkhsAfDGbA1tEdwyqzDXRCSIiMqRUP6M39x62jI5YV3IDAJbmyRLA7TY72elS'
-    b'RERS3qWtpXdHwBQHgLnRCUO4MjpARESGle4AYHREJ6wrxQEguR9SXbpvLBERgXv4JyR6pVaC'
-    b'a1t6A4Cn90MCwPlrdIKIiAzN5tOP8/fojkF5ervbSQ0A7hgkOQD0M5Wu6AgRERlBiRuiE4ZQ'
-    b'qa9xyUhqAOAWtgJmRGesx+m1WTwRnSEiIiOocWN0whA24ua0rgRIawBYld4WSV2qE6WIiKzN'
-    b'E/68XpXWDndaA0Ap2QEg1YlSRETWtoobgVp0xqASW+PSGgBqaU1Ha0l3ohQRkSfZTiwHlkR3'
-    b'DCGpNS6tASDByyQAqGkAEBHJjFQPAyR2lVtaAwDMiQ4YxMPMZWl0hIiINCzNw7Yl2qMT1pbM'
-    b'AOBL2QB4dnTHIG4ww6MjRESkYanuADzHlzA1OmONZAYAHmUrSOsaybrF0QEiIjIKpWTv22I8'
-    b'xlbREWukMwCU2To6YQi3RgeIiMgoTOY2SHTntszM6IQ10hkAPNkB4LboABERaVz9xm33RncM'
-    b'KqG1Lp0BwNKZip7Gkr2cREREhpbmZ3dCa106A4Cn80N5mpJ2AEREMui26IBBaQAYVDLbImtZ'
-    b'brP5T3SEiIiMWpo7ADoEMKhkpqK1pPkGEhGR4VmiOwAaAAaVzKURT0r1DSQiIsNL9fPbNAA8'
-    b'jd/CxqT4GOBUjyGJiMjw0j2Be7r3sVF0BCQyALCKTaITBlXTACAikkkPcwepPhWwP401L40B'
-    b'wNP4YazH+Fd0goiIjJ7NYxXwYHTHoBJZ8zQADMe4PzpBRETG7L7ogEGVeWZ0AqQyAJQTHQBS'
-    b'ffOI1Hk3u2IcN+EvbBzv3bxqwl9XZHTS/BKXyJfeNAYAT2MaWo92ACRRvoSpXuUUjL8Q8xjt'
-    b'WRhXeA/f9EVMC3h9kUak+RmuAWAtifww1lNO9M0jheZVtuAJrgY+DpQDUwznCCbzF6+yRWCH'
-    b'yFDS3MUtpfGlN40BwNL4YaxjFc/jkegIkbV5H3OBqzF2jm550uqWv3kvL4hOEVlHml/iEtn1'
-    b'TmMAII0fxjruN0v0cZJSSN7DixngSmCb6JZBbEGNBd7LS6JDRJ6U7mHcJHa90xgAUjwEkO4b'
-    b'RwrI+9gO+BVpDstrPIMaF3uV9ugQkbo0DwFYGmteGgOA8YzohPXUNABIGryHZzHAJTjPjW5p'
-    b'wKbAJX5jJlol/9L8HPc01rw0BgCYGh0wiEejA0TcKVHjImLO9B+r5zGJ892T+XyR4kr1PK4k'
-    b'1rxU/oBOjg5YT4kV0QkiVDkW4xXRGWPwSnr5cHSEFN7K6IAhJLHmaQAYmgYACeU9VDBOju4Y'
-    b'M+fz3kVndIYUWqqf40mseRoAhpbq5ChF4ZwFbBCdMQ5TKPO16AgpMEv2c3xSdABoABhOqpOj'
-    b'FID38GrIxa12X6VbBkugVD/Hk1jzNAAMLdXJUYqgxgnRCU1jfDY6QQpLA8AwUhkAktgOeZqa'
-    b'BgCJ4d28MqMn/g3lZd7D7tERUkCpHgIwDQBrS+KH8TS6CkCiGO+KTmiBQ6IDpJDS/Bz3NNY8'
-    b'DQBD0Q6ABPAuJgNviu5oOuet9f82kYlTSvZzPIk/C6kMAOkdAjBWRSdIAZXZh0TuE95kz2QS'
-    b'r4mOkIKZrAFgOKkMABYdsB6jLTpBCum10QEtU2PP6AQpmOX6HB9OKgNAisdpkpjQpHB2iQ5o'
-    b'oXnRAVIwxpTohCEksealMgCkt02TyEkaUhz1Y+Q7Rne00At9gb6RyQRK93NcA8BakvhhrCPV'
-    b'N47k1WQ6IdlvLM2wIVtl6qFGkn2p/nlK4ktvKgNAEj+MdWgAkIlVY7PohJYb0GOCZQLpEMCw'
-    b'0hgA0rxZQ6pvHMkrz+XZ/0/nPDM6QQok3UMASax5aQwAiUxD60j1jSN5VYTF0Qrw3yjp0A7A'
-    b'sNIYANK86Y4GAJlYJaZHJ0yAGdEBUiDaARhWGgNAIj+MdaQ6OUpeOY9HJ7Sc81h0ghRKqp/j'
-    b'2gFYSxI/jHVMiw6Qwnk0OqDlSjwSnSAF4sl+jifxpTeVASCJH8Y6nhUdIAVjPBCd0HK1Avw3'
-    b'Sjos2c/xJL70pjEAWJJbn5tGB0jBDHBzdELLGX3RCVIg6V5Z80R0AKQzAKT4rSDVyVHyahJ9'
-    b'wEB0Rgs9QTt3REdIgRjPjk4Ywv3RAZDKAFBL44exjqm+KNnjR5JDNpsVGNXojha60SzXA46k'
-    b'J9Wd3CTWvDQGgER+GOtpS/bNI/m1IDqgha6IDpDCSXUnN4k1L5UB4L7ogEFN1gAgE6yW4wHA'
-    b'c/zfJqlK8zPcNACsLYkfxnpWJTs9Sl6t5DJgWXRGCzxIG3+MjpCC8UQHgES+9KYyACTxw1hP'
-    b'Odk3j+SU7cRy4OfRHS1wvs1O49InKZB0LwNM4ktvGgOAp/HDWE8t2TNIJd++Gx3QdCXOjU6Q'
-    b'YnGnBIk+e6KUxpqXygCQ5g6AsXV0ghSPVVgA/C26o4n+aHO4LjpCCuZmtgAmRWcMytJY89IY'
-    b'AB7nfsCjMwaxbXSAFJTx+eiEpjE+G50gBVRjVnTCEJyladz7JokBwOaxijTvg57qG0jybg6/'
-    b'BK6KzmiCy6ydP0RHSCFtGx0whIdtPv3REZDIAFCXxJbIOraNDpBiMsOpcRSwKrplHFYAx0RH'
-    b'SEF5sp/fSRz/h5QGAOfO6IRBbOp9bBQdIcVkc7kJ57TojjFzTrYKPdEZUlip7uAujQ5YI50B'
-    b'AG6LDhjUQLJTpBTBvXyKbB4KWECFU6MjpNBSHQCWRAeskdIAkMwPZR3bRgdIcdl8+hngIODf'
-    b'0S2jcCereIfu+y/Bto0OGJSl82U3pQHgtuiAIaQ6RUpBWCd3AK8BHopuacDDwOttB/4VHSLF'
-    b'5QtoA7aK7hhCMl92UxoAkvmhrEMDgISzCjdgHAA8Ft0yjEdwXmcVbogOkYLbnJlAW3TGEG6L'
-    b'DlgjnQHA0/mhrKMjOkAEwNr5A8Z8UrxixvgXNeZbB1dHp4hQYm50wpBK6XzZTWcA6OBO0rzk'
-    b'aYfoAJE1rJ2/UuaVQG90y1puxNjN5vL36BARAAbYMTphCCvZnrujI9ZIZgConzCU4qWAm/vN'
-    b'PCc6QmQNm81iYB5wXnQL8AOW8VKbw63RISJPKiX6xc24w4xadMYayQwAdclsjTzNQKJvJiks'
-    b'q/CoVTgYeDtwV0DCEpz9rMK7bF7S5yVIMaW6A5DUGpfaAHBbdMAQUn0zScFZhQtYfZ7KqcCy'
-    b'CXjJhzA+zTQ6rYPfTMDriYyK9zEFZ050xxA0AAwjqR/Ok1w7AJKu+m7A8Tjb4pwM3NOCl1mK'
-    b'80nKbGPtnGwzebwFryEyfjUqpPoUwFpaX3JTu0wi1duGagCQ5FkH9wOfdudkengNcBCr7x+w'
-    b'2Rh/yTuBy4DzaOePKR27FBlGuju2JarRCWtLbQBI9frhTnfKurOZZEH9ffrb+l94H3Op8TKg'
-    b'HWjH2QJ4BjCD1Y/hXgY8yOoFvweo4lxlHUldaSDSmJR3bEtprXEWHbA2d8r08CiwQXTLeowO'
-    b'a09rehMRkafzKpcCe0d3DGI57WyU0k5aUucA1L+5dEV3DGGX6AARERmaO8bqS2TT49yU0uIP'
-    b'iQ0AdUltkTzJeVl0goiIDKOPCvCs6IwhJLe2pTgA3BgdMAQNACIiKUv7i1pya1uKA0ByU1Jd'
-    b'p3exSXSEiIgMKeUBILm1Lb0BwNL7IdUZbbwkOkJERIaQ9g7ATdEB60puALB27qM1NzIZv7Tf'
-    b'XCIiheV9PBvYPrpjCHfV79ORlOQGgLpUdwE0AIiIpKjG7iR2aftaklzTUh0AkjtZou7FvjDR'
-    b'W0yKiBSZs1t0wjCSXNNSHQD+Fh0whA2Zwc7RESIisp6Ud2gXRgcMJtUB4MrogGHsER0gIiJP'
-    b'8T42ItUbAAHU0lzTkhwArMLdwO3RHYOqsU90goiIrKWf15DqEwDhVpub5ontSQ4AdVdFBwzK'
-    b'2M1vYePoDBERqbMk7/2/RpprGSkPAJbsD62Nlbw6OkJERJ702uiAIXmya1nCA0DCUxOmwwAi'
-    b'IinwbnYAto7uGJIGgDGYw43Aw9EZQ9i7/tQpERGJlPYXsofoYHF0xFCSHQDqj028LrpjCFvR'
-    b'TWd0hIiIJH38/+rUHgG8tmQHACDl8wCglPTUKSKSe97FdEj4BkAJb/9D6gNAyucBoAFARCRU'
-    b'G3sCU6IzhnF1dMBw0h4A+rkO6I/OGMLL/WaeEx0hIlJYzv7RCcNYxXL+Gh0xnKQHAOtkGXBt'
-    b'dMcQ2uhP+s0nIpJbvoSpwBuiO4Zxlc3jseiI4SQ9AADgXBqdMIy3RQeIiBTSSvYBNorOGEbK'
-    b'axeQhQGgLekf4iu8yhbRESIiheO8PTphBL+NDhhJ+gPA9vwT0ryPMlDCeUt0hIhIkfhCNgRe'
-    b'H90xjHtoT/MRwGtLfgAwwzEuj+4YkukwgIjIhJrOvsD06IxhXGKGR0eMJPkBoC7lwwC7e1fC'
-    b't6EUEcmf1L94Jb/9D1kZAFZwOeleDmiUdRhARGQi+CKmkfbd//qZwu+jIxqRiQHAduRBSPp6'
-    b'yoOiA0RECmEKbwamRWcM4xqbxUPREY3IxABQl/KWyi7eywuiI0REcs85PDphWJ70WvU0WRoA'
-    b'Uj4PAJz3RieIiOSZdzMH4+XRHcNK+9L1p8nOANDO34G7ozOG5LzTl7JBdIaISG4Zh0HSj2K/'
-    b'q37peiZkZgCoP1Lxp9Edw3gGj3FAdISISB55F5OBd0d3DMu5IAuX/62RmQGg7oLogGGlfmxK'
-    b'RCSryrwBEn8Amye+Rq0jWwNAO1cDt0dnDOPl3sfc6AgRkRxK/QvWUjq4LjpiNDI1AJjhOBdF'
-    b'dwyrxnuiE0RE8qR+s7VXR3eM4CdZ2v6HjA0AAJQT32Jx3uV9TInOEBHJjTKHA+XojGEZF0Yn'
-    b'jFbmBgCbw3XALdEdw3g2AxwcHSEikge+hKlY8tv/tzKHhdERo5W5AaAu7cMA8DH3zP5sRUTS'
-    b'sYL/h/Pc6IxhGednbfsfsjoApH+mZYXepO9VLSKSPHcM+FB0x4gs+TVpUJkcAKyD6zFuju4Y'
-    b'lnNcdIKISKb18kagIzpjBL02Jzs3/1lbJgeAutQnrj28j52jI0REMss5NjqhAamvRUPK7gBQ'
-    b'4juQ+DGXAe0CiIiMhfewCyR+339wBvhedMRYZXYAsNncAvwxumMEb69fvyoiIqPh/Fd0QgOu'
-    b'sM7ED0cPI7MDAADOt6MTRtBGWwZOYBERSYj38jzgzdEdIzLOjk4Yj2wPADUuAv4TnTEs5yi/'
-    b'OfH7V4uIpKTGJ0n9xj9wPyV+Hh0xHpkeAKyTlcCPojtGMI1+PhYdISKSBd7HdsC7ojtG5Hzf'
-    b'ZrMiOmM8Mj0AAGB8k9RPBoQPeA9bRkeIiCRvgE8Dk6IzRlTjnOiE8cr8AGDtVIFrojtGMDUj'
-    b'J7SIiITxbuYA74juaMBV1klXdMR4ZX4AALJwMiDAkX4zM6MjRESSZXwGaIvOGJFn++S/NfIx'
-    b'AEznfOCh6IwRTKGf/46OEBFJkS/m+cAB0R0NeJiV2Xvy32ByMQDYTB4HzovuaMB7vMqs6AgR'
-    b'keQYJ5ONNek824nl0RHNkIUfdmOMM4FadMYIJmGcEB0hIpIS7+ZFGG+K7miAU+LM6Ihmyc0A'
-    b'UD8Z8OLojhE57/JuXhSdISKSjBJfACw6owG/sTl0R0c0S24GAACc06ITGlDC+FJ0hIhICryb'
-    b'/XFeE93RkGysMQ3LwsQ1Kt7NtRgvie4YkbO/dfCz6AwRkSjexWTa6MLZPrqlAQutwi7REc2U'
-    b'rx0AgBJfjU5oiPFlX8LU6AwRkTAljsvI4g/Gl6MTmi1/A8AcLgRujc5owCxW8uHoCBGRCH4j'
-    b'z8U4PrqjQbdxNxdFRzRb7gYAMwYgI2dpOv/ti9k8OkNEZMJN5hRgo+iMBn3V5tMfHdFsuRsA'
-    b'6s4h/RsDAUynxOeiI0REJpIv5oV4Bh74s9qDDGT/vv+DyeUAYBUeBb4V3dGgd3uVedERIiIT'
-    b'wR2jxBlkZ/35lnWyLDqiFbLyGzB6xhmQiUc1lnC+5QsycP9rEZHxqnI48LLojAatAM6IjmiV'
-    b'3A4A1s5dkJFtG2NnNufY6AwRkVbyxWyOcUp0R8OMb1uFu6MzWiV39wFYmy9mc0rcAmwQ3dKA'
-    b'xxlgR+vk5ugQEZFW8G5+hvHm6I4GPYGxff3LZC7ldgcAwOZyD843ojsatAFlznbP91AmIsXk'
-    b'3eyfocUfnK/nefGHnO8AAHgPz8K5FZgR3dKgw6ySkUMXIiIN8FvYmFV0AVtGtzRoOavYznbg'
-    b'X9EhrZTrHQAAa+c+4OvRHaNwmvdk5g+JiMjIVvIlsrP4g3Nm3hd/KMAAAIDzJeCR6IwGbYzz'
-    b'v9ERIiLN4N28EuOw6I5RWEYbX4mOmAiFGACsg/vxjDwjYLW3epW3RkeIiIyHdzGdEmeTpcPN'
-    b'zldsNv+JzpgIhRgAAJjMV4AHojNG4VvexdbRESIiY1bmjMw87Ge1h1iVqS+L41KYAcC242HI'
-    b'1Nb6MyjzQ3fK0SEiIqPl3bwFODS6Y1ScL9mOPBidMVGysy3TBN7FdMr0AZtFt4zC8Vbh1OgI'
-    b'EZFG+c3MpJ9FwDOjW0bhXgaYndfb/g6mMDsAAPXf2E9Gd4zSZ7yHF0dHiIg0wp0S/ZxLthZ/'
-    b'cD5RpMUfCrYDAPU3Zw/XArtEtzTMuJl+di7am1NEssd7OB7nC9Edo+L8gwrzzKhFp0ykQu0A'
-    b'AJhRwzkG8OiWhjnbU+bL0RkiIsOpP+b3pOiOUXJKHFO0xR8KOAAAWAfX4Jwf3TFKR3o3+0dH'
-    b'iIgMxqvMoMSPgcnRLaPinG/t/CU6I0IhBwAA2vgYsDw6Y1SMc72PudEZIiJrqz/D5DvAnOiW'
-    b'UXoc5/joiCiFHQBsNnfinBbdMUrTGeBn3sdG0SEiIk/q5ePAAdEZo+Z80eZye3RGlMKdBLg2'
-    b'X8oGLKcKmbvhzi9p581mGTqPQURyyXt4Nc5lkLl7ltzJCiq2U8Z2gpuosDsAADaTx8neZYEA'
-    b'b6SHj0ZHiEixeRdb4/yY7C3+4PxXkRd/KPgOANSPXfVwJbBbdMso9QN7WYUrokNEpHh8CVNZ'
-    b'wV+AedEtY3AV7by86Luohd4BADDDMd4LrIhuGaU24EKvMis6REQKaAVfI5uL/0oGOLLoiz9o'
-    b'AADA2qnimbzd7ibA+b6QDaNDRKQ4vMpRwHujO8bEOcU66YrOSEHhDwGs4V1MpsQ/sAxeZmf8'
-    b'hjm8yYyB6BQRyTevsjfwa1bvQmZND1N4gc3iieiQFGgHoM46WYnzXsjg3aCcfanyxegMEck3'
-    b'76IT+AnZXPxrGIdp8X+KBoC12FyuBb4R3TEmxrHezQejM0Qkn7zKFpS5FNg4umVMnLOsnSuj'
-    b'M1KiQwDr8D42YoCbgJnRLWMwAOxvFX4ZHSIi+eFVZgB/Bl4Q3TJGdzOFTpvFQ9EhKdEOwDps'
-    b'No9gHBXdMUZl4Dw9PlhEmsWdMvAjsrv4AxytxX99GgAGYe1cAlwQ3TFGG+L8whezTXSIiORA'
-    b'ldOB/aIzxuEC7YoOTgPAUFbxIeD+6Iwx2hzjEu/hWdEhIpJd3sMJGO+P7hiHBxjgmOiIVGkA'
-    b'GILtwL8wDo/uGDNjLs7vvYtNolNEJHu8yodwToruGBfjaOvk3uiMVGkAGIa183PgnOiOcdiJ'
-    b'Ni6un8AjItIQr3Io8NXojnE6x9o5PzoiZboKYAS+iGlM4XqgPbplHK5gGvvWH34kIjIkr3IA'
-    b'q6/1z94Dfp5yC7CzVXg0OiRlGgAa4N28CONqYHJ0yzhcTpk32OzMPfNARCaIV3kj8FOyeaOf'
-    b'NfopsbvN4brokNTpEEADrIPrM38sDF5LPz/2BZn+gy0iLeK97El27/L3FOfTWvwbox2ABrlT'
-    b'psoVGK+IbhmnH9DOoXpugIis4d28CuNiyPiDxZw/U2EPfb41RjsADTJjgDYOBh6IbhmnQ+jh'
-    b'PF/IpOgQEYnnVfbGuISsL/7wEM67tPg3TgPAKNhs7sQ5IrqjCd7GNH7uS9kgOkRE4ng3+wE/'
-    b'hxx8FjhH21xuj87IEg0Ao2QdXAR8N7pj3IzXs4xf+SKmRaeIyMTzKu/E+BkwNbqlCb5rHfw4'
-    b'OiJrNACMxRSOBhZGZ4ybsSdTWKCbBYkUi3dzBPA9sn7C32qLWMYHoiOySCcBjpF3sTVlrodc'
-    b'3G737xh7WTv3RYeISGt5Nx/AOIN8fP4/SIl5Nodbo0OySDsAY2Sd3IHzTqAW3dIEL8RZ4IvZ'
-    b'PDpERFrHuzkR40zysfjXcN6hxX/sNACMg3VwGXBCdEeTPJ8Sf/PeTD/yU0QG4Qto8ypnYXw6'
-    b'uqWJTqh/BssY5WEKDOWO0cOFwP7RLU2yDONt1s6l0SEiMn7exXTKXADsE93SRL+mnTeZ5WIH'
-    b'Nox2AMbJDAcOBbqjW5pkOs6vvMpR0SEiMj7ew5aU+Qv5Wvz7mMK7tPiPnwaAJrAKj2K8BXgk'
-    b'uqVJ2oCzvMrp7nqPiGSRV9kR51rI1WG95dR4i83ioeiQPNCHe5NYO1WMIwCPbmmiD9HDD7yP'
-    b'KdEhItI472Zf4Cpgq+iWJnKMw2wuN0WH5IUGgCayds7HOTm6o8kOop/LvY9nR4eIyMi8yocw'
-    b'fgFMj25pKucz1s5PojPyRCcBNpk7Ri/fxXl3dEuT3UWNA2wu10aHiMj6fAlTWcH/Ae+Jbmk6'
-    b'5ydUOKh+zpU0iXYAmswM51EOB/4Q3dJkW1Lij17lmOgQEXk672JrVvBn8rn4/5k2/p8W/+bT'
-    b'DkCLeB8bMcCVwA7RLS3wA6ZxpM3k8egQkaLzHvbB+SHk8pbeVVaym+3Ig9EheaQBoIW8m20p'
-    b'cS3Oc6Nbms75B8b+VmFJdIpIEdXvQfJfwOfJ527ufQywq3Vyc3RIXmkAaDHv5kUYf4JcPnXv'
-    b'fpyDrIPLo0NEisT72Ih+zsV4c3RLizyO82rr4JrokDzL49SYFOvgeiw3zwxY16YYl3iVk31B'
-    b'Lp4qJpI872Y3Bvhnjhf/GsbBWvxbTwPABLB2fgEcF93RImXgU2zGld7HdtExInnlC2irP8zn'
-    b'T8Cs6J6WMT5q7fw8OqMIdAhgAnkPn8P5ZHRHCz0GfNIqnB4dIpInvphtKPED+P/t3XuQleV9'
-    b'wPHPc5abiPECjqNGBS/sLqvgpNq0SmtN7KgRY2K0TqO2MbUmqUFNTdXWdMZ0zIWqsdIaLzGp'
-    b'KRFrrSQdL2OmlzgNGNuQFCULu0gKVYmm4g0BBdzz9I9ztMYogqxCIKQAAAvPSURBVOye51x+'
-    b'n5mdgzI4X/Wc9/2d9/b4jdItIyq7NvX649IZnSIGgAbLA67CZ0t3jKhkgarzUq9nSqeE0Ory'
-    b'gNNxM3Yr3TKisutTr0+XzugkMQA0WP1BQTfKzivdMsKewjmpx/2lQ0JoRfVbia/HWaVbRlzy'
-    b'TVN9PBb4aawYAArIWZcV5sl+t3TLCKvKrrPZn6cZNpSOCaFV1O/tvxH7l25pgDt0OzMlQ6VD'
-    b'Ok0MAIXkrMug23F66ZYGWC37ZOr13dIhITSz/IjdjfXlDjhC+Krv6nJKOsSm0iGdKAaAgnK/'
-    b'Mbp8R3ut1b01d+pyfjrE06VDQmg29XP919MxC2/9m7FOSlO8XDqkU8UAUFhebLwJ7sMxpVsa'
-    b'5DnZZanXzaVDQmgGebnJkhtxfOmWhkke8orfTn3Wl07pZDEANIH6xT7/jF8t3dJA9xnyqdTn'
-    b'sdIhIZRQPw04G1dqzyeFvpXFRjsuHeSF0iGdLgaAJpH7TdDln/C+0i0NtFF2lQnmxMJCoZPk'
-    b'Fd5ryHWS95ZuabAfGnJC6vNs6ZAQA0BTqZ8OWKCTDgXWPCG53FTzYsnP0M7yo95tyBfVbu3r'
-    b'tO3vA/hg6vFi6ZBQ02lvwKaX+40xyu2yU0u3NFz2H7KL0jQPlU4JYTjlxcbb2SWSS7BT6Z6G'
-    b'y+41welxpK+5xADQhOrPCfi67PdLtxRQxW2GXJL6PFU6JoQdUV+y9zRcrTPu6X8zd1jv7HSE'
-    b'LaVDwi+KAaBJ1S8Qugl/ULqlkHWSL3nZX8dDhEIrysv9lmSOzrq4942+odt58ZCf5hQDQBPL'
-    b'WTLgGslnSrcUtBZX29ncOHwYWkFe5td0uVw2q3RLYTfo9ul4vG/zigGgBeQBl+LLpTsK+198'
-    b'xVjXxYNDQjPKA6bjczrj6Z5vZ07qcVnpiLB1MQC0iDzgIlyDSumWwv5HcqUXfTPOKYZmkAfN'
-    b'kH0eHxTb1CouTj3+qnRIeHud/mZtKXnQh2S3YXzplibwU9mVquanPptLx4TOU9/xX47TxLYU'
-    b'NkrOSt2+XTokbJt407aYPOhI3C3bq3RLU0h+rupGVXPj4SKhEfKgmbhUdpLYhr7qGZySeiwq'
-    b'HRK2Xbx5W1BebjLulUwr3dJE1kvmq7om9VpROia0l/rCXafgT3Bk6Z6mkqw05ANpmkdLp4Tt'
-    b'EwNAi8qr7GaTBTi2dEuTqUruU/XF1OsHpWNCa6uv03EOLsZ+pXua0CLJh1K3taVDwvaLAaCF'
-    b'5X5jVHxN8nulW5pS9u+4yTgL4s6BsD3yoBmq/rD+2dqldE+TmmfIuXENTuuKAaAN5AEX4lrx'
-    b'//OtvCC5Q3JDmmpJ6ZjQnPKAXSQfVnW25LjSPU1urm4XxdodrS12GG0iDzpDdgsmlG5pcj/A'
-    b'LTa5I54wGKg/uKfiXJwhPj9vZ4Pk3NTt70uHhB0XA0AbycscquIuTC3d0gLW4XbM0+3B+CbT'
-    b'WfIye6v4HbVHbR9WuqdFPKrq1DTNT0qHhOERA0CbyQN2wd/iI6VbWsgTWCC501SLYhhoT7nf'
-    b'HkaZhdNlJ2BU6aaWkd1rnLPSFM+XTgnDJwaANlRfgewSfAFdpXtazGP4TgwD7SE/Yndjnay2'
-    b'0z8eo0s3tZiMv9Ttz+KZ/u0nBoA2lpc7XjIfe5RuaUnJStwpu1e3h2JFs9aQH/VuVSfKPozj'
-    b'xE7/nXoWZ6Ye95cOCSMjBoA2l1fazyvuEg8v2VHrJQ+outso96VDPFE6KNTkrMuAw3GyZBbe'
-    b'I7ZtO2qJio+kqf67dEgYOfEh6QD5cTvZ6Kuyj5VuaRNZtkTF/ZL7rfFgOtYrpaM6SV7mABUn'
-    b'4gS8X1y9P3ySW433R7H8dvuLAaCD5AGn4SZxSmC4bcASLJQtssXCNN1zpaPaSV7hQNlMHK1q'
-    b'pqRXbL+G2zqcn3p8q3RIaIz4AHWY3G9/Xf4Ox5RuaWNDskEVC9UelbowDqVuu7zYaDubLtV3'
-    b'+LwPEwtntbfkIcmZ8T7tLDEAdKD6OdNLJVeIC6QaZQ0ewSOyR7DUBgPpCFsKdxWVl9lbcphk'
-    b'htr9+IehT7wvG2WL7Ao95sRFrp0nBoAOlgcdKbsNh5Ru6VCbsRxLsVSyFKuMsbrd1i7IA/aR'
-    b'Ta4fun91Rz8dk8qWdbDaXS5npm7/WTollBEDQIfL/Sboci3OLd0SfsGTWFX/WS1ZjVUqVtvo'
-    b'qWZ6jHH+nlEmmWiMA2STMRlTXvd6AMYVCwxv5huGXJj6rC8dEsqJASCAvNypkpvFudZW8TKe'
-    b'ed3P2vpP7a+zjdJrFyJuUrGx/usXDXlFlyG1i77GGjK+/nu76DLKkC7Ju0Cyk2y82vtiUv11'
-    b'omyiiomyPbHryP/rhmHyLD6Revxj6ZBQXgwA4TV5qb2MdhXOLt0SQhhmyT34ZOq2pnRKaA4x'
-    b'AIRfkgd9QHYD9i/dEkLYYU/KZqded5UOCc2lUjogNJ/U7T7r9WIOcWVwCC0qY54hh8bOP7yZ'
-    b'OAIQtiovdxS+JplWuiWEsI2SlbLzUo/vlU4JzSuOAIStSr0etMHhuAybSveEELZqC+aoODR2'
-    b'/uHtxBGAsM1yvz5dbsZRpVtCCL/kQVWfSNP8pHRIaA0xAITtlpc7WTJX7T7vEEJZP5N9Xo9b'
-    b'UlItHRNaRwwA4R3Ji403wWx8TqzEFkIJL2EuvpB6vFg6JrSeGADCDsmD9pV9CWeJ91MIjZHc'
-    b'I7sg9VhVOiW0rthgh2FRX1fgOvx66ZYQ2tiPJRelbt8vHRJaXwwAYdjkLBl0Gq7BfqV7Qmgj'
-    b'a3Glbn8Tq/aF4RIDQBh29QWGLsTF2L10Twgt7Dl8BdfFef4w3GIACCOmPgicr/YMgd1K94TQ'
-    b'QtbjepvNSdNfW9QphGEVA0AYcbnfHioukHyG+ipzIYQ3swFft8UX02F+XjomtLcYAELD5EGT'
-    b'ZJ/FbF5bgjaEwGbJrYZckaZ5snRM6AwxAISGy4/a05CLcSHGle4JoaDajp+/iGV6Q6PFABCK'
-    b'yUvtZZRPSWZjj9I9ITTQOtxqlKvTwR4vHRM6UwwAobjcb4KKj0ouxtTSPSGMoNW40Vg3pSme'
-    b'Lx0TOlsMAKFp5KxiwEmSPxUPFArtZYnkWj8zPx3rldIxIRADQGhSedBM2QU4FV2le0J4B7Ls'
-    b'XzE39bq7dEwIbxQDQGhqeVCPbDbOxK6le0LYBuswX8XcNNXy0jEhvJUYAEJLyKuMs8nJsvMk'
-    b'7xfv3dB8fiS7WdX81Gd96ZgQ3k5sREPLyQO6cQ4+jj0L54TO9rzkH/DV1O3h0jEhbI8YAELL'
-    b'yv3G6HJKHBUIBdS+7W/wrXSEjaVjQngnYoMZ2kLud7AuH5OcITu4dE9oQ8lK2R2G3Jr6rCyd'
-    b'E8KOigEgtJ3cr0/F6ZKP4pDSPaGlPY5vS+401aKU5NJBIQyXGABCW3vdMHAWDirdE1rCE1gQ'
-    b'O/3Q7mIACB0j9+vT5WycjX1K94SmslayAPNM9WBKqqWDQhhpMQCEjlQfBmbJjpMcg9Glm0JD'
-    b'DWEJ/kVyT+z0QyeKASB0vPpaBMeqmCU7EfuVbgoj4mk8ILnHJnen6Z4rHRRCSTEAhPAGeYUD'
-    b'VZ0smyX5TYwp3RTekdq3/Owe3K3Hj+N8fgj/LwaAELYiLzbeLt4jO1oyU3aUWLq4Wa3Hw1go'
-    b'W2Sc78eKeyG8tRgAQthOeYUDZTNxtKqZkmmlmzrUk1iIRbKFevxXnMcPYdvFABDCDsoD9sFM'
-    b'HIEZOAx7F41qP09iqdo3/MWSRanbmsJNIbS0GABCGAF5ld1sdqiqaZI+/AoOx86F05rdZtlK'
-    b'yY/QL1um6oepz1Olw0JoNzEAhNAgOatY7iAVM9CNyZhSf91f59yKuAWPYTVW1V8HVT2s10/j'
-    b'MH4IjREDQAhNIGddltnXaJMNmYIpKiarmiLZV23Vw3cVztxW6/C0bI2KVar1HX2XVbZYbZo1'
-    b'KRkq3BhCx4sBIIQWkRcbbbxJmCiZiImYVP+Z+LrXsZIKdq39QTtJxtX/Mbupfe5HY0L9761X'
-    b'+1aeqV81n70sean++y/IqtiEZ7D2da+1X2fPyNZ6yTPpCFtG6D9BCGEY/R98eiWQfoEFSQAA'
-    b'AABJRU5ErkJggg==')
-
-STOP_ICON = PyEmbeddedImage(
-    b'iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAABHNCSVQICAgIfAhkiAAAIABJ'
-    b'REFUeJzs3XeYnGW5x/HvM7tppIAUpRM0kuzOJoChBfEQEAUURKSIFD1IFQtSVGwI2ECBI2BF'
-    b'UBABAUEUAQGlSAkooSQ7uwlGCE1AeiCk7c59/ngnsEm2zO7O7P287/v7XBfXOSpkvmwm89zz'
-    b'vC0gIjVjUIDiFGAnYAqESWAbAaOBNXzrUmMBsBB4GsJcsFlgd8DbZwZu7/COE8mK4B0gkgVG'
-    b'cWsIh4AdAKzj3ZNRrwBXQ/k30H5nAPMOEkkzDQAig2A07w7ha8AO3i058yDwXSj9IUDZO0Yk'
-    b'jTQAiAyAUZwA/BjY1bsl52YCxwRK//AOEUmbgneASJoYBKP4RaAVLf4xmArcY7ScYuzX4B0j'
-    b'kibaARCpklEcA/wW2Mu7Rbp1K7BfoPSSd4hIGmgAEKmCUVwTuA7Y3rtFetUO7BYoPeEdIhI7'
-    b'DQAifTAmvw3KdwCTvVukKvOh472Buf/xDhGJmc4BEOmFMW0UlK9Di3+ajIfGvxhb6L4LIr3Q'
-    b'ACDSqwXnAe/1rpB+mwzLLjHtcor0SAOASA+M4ieAw7w7ZMD2gObPeUeIxErTsUg3Kif9zUF3'
-    b'9Uu7N6CzGJgz3ztEJDbaARDp3vfR4p8Fq0HDmd4RIjHSDoDISozixsA8YJh3i9RKYavA7Jne'
-    b'FSIx0Q6AyKpOQot/xpRP8i4QiY12AES6MKaMhs5ngLHeLVJTHcBGgdKz3iEisdAOgMgKOvdB'
-    b'i38WNQKf8I4QiYkGAJEVfdQ7QOrmY94BIjHRIQCRCoMCFJ8H1vRukbpYCg1rBmYt9A4RiYF2'
-    b'AETe1NKCFv8sGw6d23pHiMRCA4DIW5q8A6Tu9HssUqEBQORNNtG7QOpukneASCw0AIi8RXf+'
-    b'yz79HotUaAAQeYsu/8u8oN9jkQoNACJvGe4dIPVmI7wLRGKhAUDkLbo8LPte9w4QiYUGAJG3'
-    b'LPAOkLrT77FIhQYAkTeFJ7wLpO4e9w4QiYUGAJE32RzvAqm3MNe7QCQWGgBE3vIwYN4RUk+d'
-    b'D3kXiMRCA4BIReVRse3eHVI3/4X2kneESCw0AIis6BbvAKmXcEvQDo/ImzQAiKzALvcukHrp'
-    b'vMy7QCQmGgBEugi03YcOA2TRs/COm70jRGKiAUBkVWd7B0jNnRO4vcM7QiQmwTtAJDZGcTgw'
-    b'D9jIu0Vq4mVYMj4wTzcBEulCOwAiKwmUlgIneXdIzZysxV9kVRoARLoRKF0G/M27QwbtQWj+'
-    b'mXeESIx0CECkB0bLRmAPAGt7t8iALAS2CZTavENEYqQdAJEeBFqfhHAoUPZukQE5Rou/SM80'
-    b'AIj0ItD6Zwif8+6Q/gqnBkq/8a4QiZkOAYhUwSh+A/i2d4dUw84NtB3rXSESOw0AIlUyiscA'
-    b'56Gds5idESjpCg6RKmgAEOkHo7gzcCmwrneLrGABcFSg9DvvEJG00DcZkX4IlG6FjqnAdd4t'
-    b'8qbbIbxHi79I/2gHQGSAjOKewA+ASd4tOfU42Neh7TI95U+k/zQAiAyCQQGa94XwRWCad09O'
-    b'PAzhXBhxSWDmMu8YkbTSACBSI0bTu6FwAIRdwLYDhns3ZUQHhPvB/gbhykDrLO8gkSzQACBS'
-    b'B8a0UfBKExQ2AzYGxoGNhTByEL/su4GdalNYdxcBSwfwzy2F8BrYqxCeBpsLtAdKr9c2T0Q0'
-    b'AIikhNFyCFhKbm6zZHU9gEckbroKQEREJIc0AIiIiOSQBgAREZEc0gAgIiKSQxoAREREckgD'
-    b'gIiISA5pABAREckhDQAiIiI5pAFAREQkhzQAiIiI5JAGABERkRzSACAiIpJDGgBERERySAOA'
-    b'iIhIDmkAEBERySENACIiIjmkAUBERCSHgneAiCSMLdaAzo3ANgHbGNgIQuU/szGwFjDat7Jq'
-    b'MyA8CjyR/NX5BITHITweKL3uHSciGgBEhpRRHANhEtAE1pz8//ZuYCNgnHPeUHmJZDB4FGwO'
-    b'0AbWDqvNCcx8w7lNJDc0AIjUgTFlNJQ3TxZ5moAiMInkm7z+3HXPgPnAHLASFOZAZwnWeDgw'
-    b'Y5Fzm0jm6INIZJCM6Y3w34kQpoJNTf4vWwPDvdsyohOYC8yEMBNsJiy8PzB/sXeYSJppABDp'
-    b'J2PyJChvS7LIbw1sDozwrcqdJcDDwP3AP6Dh74FZjzk3iaSKBgCRPhgT14eG90LYBdiNZBtf'
-    b'4vMMhLvA/gp2d6Ct5B0kEjMNACIrMZo2gcJ0YGdgJ5IT9CR9ngJug3AHhNsCsx/1DhKJiQYA'
-    b'yT2jOBzCjsCeYB8C3uXdJHUxB8L1YDfAyDsDM5d5B0l1jKmrw6JdIUyBsD7Y2yG8AvZf4FEo'
-    b'3xRo/5d3Z9poAJBcMrZcB5Z+CNgD2BUY65wkQ2sBcHMyDBRuCLQ+5x0kqzKKOwMnAdOBYX38'
-    b'7Y+AnQ+r/1RXjVRHA4DkhtFchLAnsCewLdDgnCRxMJIrDK6Fziv1TdKfUWyGcA7YLgP4x58G'
-    b'vhEoXVTjrMzRACCZlhzPb/go2KeALb17JBXaIFwFHZcF5jziHZM3RvPuEC4HVh/kL3UB8NlA'
-    b'aWkNsjJJA4BkTnLWfuP+wCeAbbx7JNX+CeFK6Lwq0P64d0zWGS2fAfsxtXtOzZ0wcs/AzFdr'
-    b'9OtligYAyQSjuCawD8mivyN60JXUlgH3AhfByCu0oNSeUdwVuJ7aH5q7D0buqt+zVWkAkNQy'
-    b'KEDTztBwJNhe6M57MjTeAK6G8CtovSMkw4EMgtHyLrD7gTXq9BIaArqhAUBSxyiuC3wKOAJd'
-    b'sie+ngQug86fB+bM945JK6P4e5IdvHqaCYUPBGa/XOfXSQ0NAJIKybf94gdJFv096fuSIJGh'
-    b'1AncAuVfQMt1gas6vYPSwmjZCuwfDM16pJ2ALjQASNSS6/WXHQl2ODDeu0ekCo+B/QSGXxh4'
-    b'6BXvmNgZxcuBA4buFcO9MGI3DQEaACRSRnEC2OchHA6s5t0jMgCLgaug/INAe6t3TIyMqcNg'
-    b'8X+p37H/nuhwABoAJDJGcSfgeOBD6Ex+yQYjOTxwDrT/JUDZOygWlT/vt/q8ergXFu8amLfA'
-    b'5/X9aQAQd8m3gEX7Q+F4sPd494jU0RzgdBh5mZ5FAEbz5yGc61eQ7yFA37DEjTF1NaN4PCx+'
-    b'FMJvtfhLDkwCLoLFjxgtnzHGj/QOcrau78vbdjDyJmPCON8OHxoAZMglC3/zCbD4MeAsYEPv'
-    b'JpEhNh7spzD6UaP5BKM4xjvIR1jbuyAZAkb8JY9DgAYAGTLGlNFvLfzhTODt3k0iztar/FmY'
-    b'bxRPNia/zTtoiMVyJv60PA4BGgCk7pJv/C3HQue/tPCLdGst4FQoP2EUT8/RQvSsd0AXuRsC'
-    b'NABI3RjTRhktJybf+O1HwHreTSKRGwN8BUbMNYrHJCfIZpn927tgJbkaAnQVgNScQYDmfSGc'
-    b'AWzq3SOSYk8A34XmC7N4d8HKuQ8vACO8W1YyA5bslvWrAzQASE0Zk6dB+SxgmneLSIa0gZ0S'
-    b'aLvKO6TWjOJNwAe9O7qR+SFAhwCkJoyWJqP4JyjfgxZ/kVprhnClUbzNaJniHVNb4efeBT2Y'
-    b'BiNuzPLhAO0AyKAYk9aCwskQjgEavXtEcqAMXAoNJwZm/dc7phaMlhnJ5XhRyuxOgAYAGZDk'
-    b'5KQlx4KdDIz17hHJoZeAk2GdXwRu7/COGQyj+X0QbgMavFt6cA907BaY+5p3SC1pAJB+M4o7'
-    b'AD8FJnu3iAhzgOMCpb94hwxGcldQzvLu6EXmdgI0AEjVkkfzLv0B8Cn03hGJze8hHB9ofdI7'
-    b'ZKCMll+BHerd0YtM7QToJEDpk0Ewip+EpW3A/6LFXyRG+4LNMYpfMfaLdSu9D01HAJd4V/Ri'
-    b'e2jMzLMD9EEuvTKKW5Bs9+vMfpH0mAF2RKCt5B3SX8nw0vYr4JPeLb24B5bsnvbDARoApFvJ'
-    b'U8pW+zaE44j3xBwR6dlS4AxY8t3AvCXeMf1RGQJ+DRzi3dKLu6Fj9zQfDtAAIKswmreF8Gug'
-    b'ybtFRAZtHnBUoHSrd0h/GBSgeCHJYcdYpXonQAOAvMmYMAJGnAqciL71p8nrwIvA88ALEF4E'
-    b'W1j575dV/p6XK/93WeW/B8IbYKtV/vthJPehB1iNN2/NaqsDwyGsRfLAmq5/6T2SHgb2C2g8'
-    b'MTBroXdMtZIhoOWCyE8MTO1OgAYAAcBo2QrsIqDo3SJvWgI8Dsyv/PVY8p/DM8kiv/RF6HzR'
-    b'a3vXKK4JnWvDsLXA1gLbGGxTCOOB5X9F8Lx36WIelA8JtN/rHVKtyk7A+cBh3i29SOUQoAEg'
-    b'54zicOBk4CvoTn4eOoF5EGaBtUJ4FOwx6HgM5j4TwLwDB8OYOBaGj4fyeAibQrkJwmSgBVjd'
-    b'ty63OoDTYeRpgZnL+vy7I2BMXR0WzyPugTJ1Q4AGgBwzmlqgcBm6oc9QeQF4GJgNYTYwC8aW'
-    b'AjMWOXe5MCaNh4YpyUBQngJhCvBudGhhqMyEcEigtd07pDfJJXcj/kI6rkS6Czo+lJYhQANA'
-    b'ThktR4OdDYzybsmoZRBmgs2AcBcsuzcw9z/eUbFLrj4ZuyV0bg+FHcC2B97u3ZVhi8C+Am0/'
-    b'jnG3KWWL/3KpGQI0AOSMscUasOwCYB/vlox5GbgHwj3QeRes8c+8frOvNaPp3VB4L/BeYHuS'
-    b'q1P02VVbt1R2A57zDlkupYv/cncBuwdKr3uH9EZ/iHLEaNke7DJgE++WDFgC4U6wG6F8M7SX'
-    b'YvwGlUXJEygbpgO7Vf7a0LcoM56BcGCg9XbvkJQv/sv9EUofC8nTG6OkASAHDAK0fAHshySX'
-    b'e8nAPAbcAvZXWHpTWq/9zRpj8jvB9gT2AHsfb17CKAPQCeE70Hqa18JlTBkN5RvA/sfj9Wvs'
-    b'O4HSN70jeqIBIOOMpvWgcAnwfu+WFOoAboNwPXTcGJjziHeQ9C656qDwfmjYDWwvYF3vppS6'
-    b'CYYfEnjw+aF80Yx88+/KwKYF2u7zDumOBoAMq2z5/x5Yz7slRcrADAhXgV0RKD3rHSQDU7l+'
-    b'fHuw/SDsj4aB/noaOCBQumsoXixj3/y7CH8PtO7oXdEdDQAZVTnL/xxguHdLCpSTM/XtCghX'
-    b'x3QilNSGMb0RXtgJ7OPA3sCa3k0p0QHha9B6Zj3PccngN/+V7Rwo3eYdsTINABlTuZ3vj4HD'
-    b'vVtSYCaE38Cy3+sSvfwwpg6DRbtA+ASwL7oUthpXwMhPB2a+UetfOAeLP8DPAqVjvCNWpgEg'
-    b'Q4yJ68Owq8G2826J2ALgd1D+RaD9Ae8Y8VVZfA6AcBTYe7x7IvcwlPcKtD9eq18wu9v+q3gS'
-    b'SpvEdqWQBoCM0PH+Pt0DdgE0Xpmmh6HI0DGKWwNHAAcAY51zYvUcsE+gdPdgf6GcfPPvojy+'
-    b'lsNTLWgAyACjeCRwHjrev7KXgEvAfhloK3nHSDoYxTEkQ8ARwDbOOTFaAuGYQOuvBvoL5G/x'
-    b'ByhsH5g9w7uiKw0AKVZ5VOYPwE7wbonMPOBHMPLX9ThmKflhNG0HhRNIThzUMwpWdA6sc2Lg'
-    b'9o7+/EP5XPwBwj6B1mu8K7rSAJBSxrRRsOA3JCcxSeIeCGdB67Ux331L0ie52VD5OOBQYLR3'
-    b'T0RugSX7VntTrPwu/gDlvQPt13pXdKUBIIWS57BzLfA+75YIlIEbgNNrcVxSpDfJAjbyULAT'
-    b'0S2IK0Ir8KFA65O9/V05OuGvJ9sGSv/wjuhKA0DKGMUJwI3ABO8WZ0uACyGcHWj9t3eM5Ety'
-    b'ue3Ig5In6bGZd08EniB5+E1bd/9jvr/5L9ewUWDWU94VXWkASJHK8cg/ku/Hoy4DfgeFUwKz'
-    b'H/WOkXxLzsNp3gfC99BQ/jKUPxpo/3vX/1Lf/AF4NFB6l3fEygreAVIdo7gvFG4jv4t/B3AR'
-    b'NEwMlD6pxV9iEKAcaLsKRjaDHQ30ug2ecW+Dwk1G8c1HjSff/DtviWjx/xZwucPrXufwmn3S'
-    b'DkAKGM1HQfgp+RzYysDvoPNUPYxHYpccGhh+JISvkt97cpQhHAeLL4ps2//kQOnbxn4N0PYb'
-    b'4MChe+nytED7vUP3etXRABA5o3g8cCb5/L26BuxkXcMvaWNMXQ0WfaYyCKzl3ePkKeI5UfJb'
-    b'gdJpy/9DMgS0Xwx20BC89p8DpT2H4HX6LY+LSmoYLaeAfcu7w8GDUDguMPsO7xCRwUiu2Amn'
-    b'VA4PDPPuyakVFv/lkiGgdBGEg+v42p1Q2DIwe3YdX2PA8rilHD2DYLScmcPF/0UIX4TmrbX4'
-    b'SxYESi8FWr8AnS3An7178sdO6W7xBwhc1QnF/wUurmPAl2Jd/EE7ANExCNByDtjnvVuG0DKw'
-    b'n8GokwMzX/WOEakXo2kXKPwIKHq3ZJ+dEmg7tc+/CwpQ/BXwqRoH/CZQqvWvWVMaACKSPLP8'
-    b'+YsZ0pNT3P0RODFQmucdIjIUkscRL/4ccDKwhndPNlW3+L/5dydDwPeBL9co4ALgs4HS0hr9'
-    b'enWhASASlcX/CuBj3i1DZD5wdKB0k3eIiAdjy3Vgydl1PgadQ+HUQOspA/knjeaDIPwSGDXA'
-    b'F18G4cRA67kD/OeHlM4BiECy7f/8z8nH4l8GzoeOKVr8Jc8CDz4faDsE2B2I6jGx6WWnDHTx'
-    b'Bwi0XQoNmwHnk9x7pOoXhnAVdLakZfEH7QBEwSieDRzn3TEEZgOHx3Y/bBFvlUcQfwf4HHrq'
-    b'4AAN/Jt/d4yWd4HtC+xBci+DlX9fDJgJ4Xro/H2gvbVWrz1UNAA4M1q+DvYd7446Wwx8F0ae'
-    b'EZi5zDtG3mJMHAtT3kjOiBZvRvO2lS3oyd4t6VLbxX9lyQ2eRrwDChtAuQCFZ2DMM4EZi+r1'
-    b'mkNBA4Ajo+Xo5Oz3TLsbwhGB1nbvEFmVUbwMbEag7TzvFklUzgc6ATgFGOmckwZnBEoneUek'
-    b'kQYAJ0bLx8CuJLvbfcuSB6S0nhaS4/4SGaPlELDfAK9BY1Pg4ae9m+QtRrEZuBTYwrslYlr8'
-    b'B0EnATpIrgW2y8ju4j8HytsFWk/R4h8no2UjsHMq/3EsdPzINUhWkTxad+E04Az056g7WvwH'
-    b'STsAQ6xyjO+vwBjvljq5BBo+E5i10DtEule55vlWYMeV/qe9AqU/eTRJ7yo3ELoYWN+7JRI/'
-    b'CJS+4h2RdhoAhpDR1AKFO4A1vVvq4HmSM/y1gETOKJ4MdHeTlCeAYqD0+hAnSRWS+wYsvQD4'
-    b'iHeLMy3+NaJDAEPEmPxOKNxMNhf/W6BjCy3+8TNatgK+0cP/vHEOnz+RGsl9A0p7kdyyNq87'
-    b'bFr8a0g7AEPAaFoPCncB7/RuqbGO5HGnrWeF5JpYiZgxZTR0PgBs1svf1gG2TaDtwaHqkv4z'
-    b'mosQrgYmercMoe8ESt/0jsgS7QDUmTF1dSjcQPYW/xegvHug9Uwt/mlRPo/eF3+ARgi/SB6V'
-    b'KrEKtJWgY2vg994tQ+QHWvxrTwNAHRlTV4PFfyZzl/GEB6Bz60D7X71LpDpGy95gh1b5t28N'
-    b'bUfXNUgGLTD3NSjtD5wEZPlGTj/Utn996BBAnVSe+HUdsKt3S439EpZ8PjBviXeIVMfYfAPo'
-    b'eBhYqx//2AJobNa9AdLBaPlg5dLi/vwep8G/oLlJd6qsD+0A1M2ic8nW4r8EODJQOlKLf3ok'
-    b'l/x1XEz/F4ZxsOzsejRJ7QVab4awJZC152y8G9p+6B2RVRoA6sAofhZClrZQn4KwQ6D0S+8Q'
-    b'6a+WE4D3D+yfDfsbxT1rmiN1E2h9EhbuCFzs3VJjxxkth3lHZJEOAdSY0fQ/ULgFGO7dUiOz'
-    b'IXw4+XCRNDGat4RwL4N7L+reAClktBwLdjbZ+ZK3DMIHA623e4dkSVbeHFEwpmwKhavJzuJ/'
-    b'MyzZQYt/+hjjR0K4mMG/FzcGdPZ1ygRazwE7gORJnFkwDOz3ySN6pVY0ANRI8ljV8p+Atb1b'
-    b'auQCGLlHYN4C7xAZiNFnUbtHyh5vFDN2JUv2BdqugsLOJHfpzIK1wP6UXFottaABoAaSE60a'
-    b'LwNr8W6pAUuerV06IjBzmXeM9J9R3A34TA1/yUbgF6bPi9QJzJ4BYRrwiHdLjTTD4st1n4ra'
-    b'0B/omiieDuzhXVEDi4D9A62neIfIwCT3i+fX1P78nm2g5aga/5oyBAKt/4bhOwAzvFtqZHdo'
-    b'/7Z3RBboJMBBMoqfAC7z7qiBl6CwR/KNQdLIIEDxT9RvGNW9AVLMmDYKXrsM7KPeLTVgYHsH'
-    b'2v7oHZJm2gEYBKPp3cDPvTtq4L/Azlr80674Weq7EzUOOs6q468vdRSYsQia9iUblwkGCBcl'
-    b'D1mTgdIOwAAlZ1mPvgfY0rtlkJ6F8gcC7a3eITJwRrEZuB8YVf9XC3sGWv9c/9eRekh2ilrO'
-    b'Afu8d0sNPAzjpiXDjfSXdgAGbPSPSf/i/zjwPi3+6WZMGAFcypAs/gD24+TJgpJGycO7Wo8F'
-    b'snCnx81hge4UOEAaAAagctw/7XemmgsNOwRK87xDZLBGfJyhfeDUJtC57xC+ntRYAAuUTiB5'
-    b'kFDafdZoOdg7Io00APSTMWkz4BfeHYPUBuWdArOe8g6Rmhjp8JojHF5TaixQOgPIwJP27GdG'
-    b'S5N3RdpoAOiHZNuz4RpgrHfLINxPsu3/jHeIiPgLlH4A9gXAvFsGYQzY75IrHaRaGgD6pfMn'
-    b'QNG7YhBmQ+dugdJL3iEiEo9A23lgX/LuGKQpsOBc74g00QBQJaN4IPAp745B+BeUdw3MedE7'
-    b'RETiE2g7C8Kp3h2DdLhR1PkpVdIAUAVj4vrAed4dg/BE5VI/bfuLSI8qdwE9w7tjkH5mFNf1'
-    b'jkgDDQB9SK6ZbbwAWNO7ZYCehsJOgfbHvUNEJA1KXwV+5l0xCGuT/hO1h4QGgD4VjwF2964Y'
-    b'oOeBDwZmP+odIiLpkNwnoPRZ4ELvlkH4iNGS9ku1604DQC8qz54+3btjgF6F8m6BUpt3iIik'
-    b'SzIENB8FXOHdMnB2jlGc4F0RMw0APTCmNwK/BcZ4twzAYmCPQPsD3iEikk6BqzqBTwK3O6cM'
-    b'1Gjg13p0cM80APTo+a+CbeddMQAG4YhA6S7vEBFJt0BpKSzZC0Jabxe+A7Sd6B0RKw0A3TCa'
-    b'3gN807tjYOzrgdbfeleISDYE5i2AwkeA57xbBug0Y/Jk74gYaQBYSbL1X7gAGObdMgAXBtq+'
-    b'7x0hItkSmPUYhD2Ahd4tAzAcyhfqUMCqNACs4oUvks6n/N0GHOMdISLZFGi9H8IBQKd3ywBs'
-    b'DW2f8Y6IjQaALozixmDf8u4YgBIM+1hyvE5EpD4CrX8GvuzdMUDfM6Zs6B0REw0AK/op6Tvr'
-    b'/z8Qdg889Ip3iIhkX6B0NvAT744BGAudelZAFxoAKozm/YAPe3f00zKwAwKtT3qHiEierPNF'
-    b'4A7vigHY22j6qHdELDQAAMaEcRD+z7uj/8KxgbY7vStEJF8Ct3dA+DjwlHdL/xV+akxd3bsi'
-    b'BhoAABhxOrCBd0X/hEsDrWm+X7eIpFig9TmwfYEl3i39tB4s+bZ3RAxyPwAYTdsBR3l39NOD'
-    b'MPYI7wgRybdA230QjvPu6D/7rNG8rXeFt1wPAAYFKPyUdP0cXoKGfQIzFnmHiIhUdiIv9u7o'
-    b'pwKEc5OnveZXmha+Oih+mnRd818GOzi5KYeISCwWHg3c713RT9tAy8HeEZ5yOwAYE8cCaTsO'
-    b'9K1A243eESIiXQXmL4bO/YCXvFv6x75vTBntXeEltwMANH4NWNe7onrh79Cs2/yKSJQCc+ZD'
-    b'ONy7o582gM603tho0HI5ABhTNgW+6N3RD6+AHVJ5PKeISJQCrX8ALvTu6KcvGU2beEd4yOUA'
-    b'AOUzgJHeFdULRwdKT3hXiIj0reFYYK53RT+MgsL3vCM85G4AMFq2r1y7mhL2q0DrFd4VIiLV'
-    b'CMxaCIWDgDQ9m+QTRnEH74ihlqsBILnsz35Eei79eBQ603SoQkSEwOyZEE7z7uiHAPzIcrYm'
-    b'5upfFooHA1t7V1SpA+zAwNzXvENERPqv6fTk5OXUmArF/b0jhlJuBgBj6jAgTY/6PTW5y5aI'
-    b'SPokJy0XDiJdlwaeZkxv9I4YKrkZAGDxocA7vSuq9BCsc7p3hIjIYARmPQV2ondHP7wbnj/I'
-    b'O2Ko5GIAMIrDga96d1SpA8qHJU/bEhFJt0Dbr4FbvDv64ZTKmpF5uRgAgCOB8d4R1bEfBNof'
-    b'8K4QEamdziOBhd4VVRoPdqh3xFDI/ABgjB8JnOTdUaV/werf8Y4QEamlyl0CT/HuqF442Zg2'
-    b'yrui3jI/AMDoY4ANvCuqYGCf0VP+RCSbmv6P9DwwaH14LfOPXM/0AFB5yENa7vP8y0Db37wj'
-    b'RETqIbkqIBwGLPNuqY591Zi6mndFPWV6AIDOzwPv8K6own9g2Fe8I0RE6inQOgs4y7ujSuvC'
-    b'4s95R9RTZgeAyrf/tFx+8oXAQ694R4iI1N+404B/e1dU6YQsnwuQ2QEAOj4NrOVdUYVbA6Wr'
-    b'vSNERIZCcp6TneDdUaW3w2uf8o6ol0wOAMZ+DRCO9e6oQieE47wjRESGUqDtj8DN3h3VsS8l'
-    b'a0r2ZHIAgLb9gHd5V1Th/MoxMRGRvDkOSMMNz94JbXt7R9RDRgcA0vCt+hVYdrJ3hIiIh0Cp'
-    b'Dfild0eV0nI1Wb9kbgAwijsD23h3VOHUwCMveEeIiDj6BvCid0QVtjYm7+gdUWuZGwCAL3kH'
-    b'VGEe8FPvCBERT4HSS0BK7n5aTsPa0i+ZGgCMyZOBXb07+lY+NlBa6l0hIuJvnR8DJe+KKnzI'
-    b'KG7uHVFLmRoAoHwiELwr+vC3QPsN3hEiIjGoPPk0DU9rDaTj/LKqZWYAMFreARzg3dG3wje9'
-    b'C0REYhIoXQfc591RhQOMzdb2jqiVzAwAUP40EPsznK8PzJ7hHSEiEp+QhquiRsDwzDwqOBMD'
-    b'gEGA8Gnvjj4YcKp3hIhIjAKtNwN3eHf0zY62jKydmfiXgOKuwATvij5cGyj90ztCRCRi3/AO'
-    b'qMI7oWUX74hayMgAEI7yLuhDGX37FxHpVaB0F5CCx6Lb0d4FtZD6AcD8oPvTAAAgAElEQVRo'
-    b'Wg/sw94dfbgyUHrYO0JEJH6pOFF6T2PzDbwjBiv1AwCEI4Fh3hW96IRwmneEiEgaVE6UvtG7'
-    b'ow+NsOxw74jBSvUAUHnq32HeHX24ItDa7h0hIpIeloJDpuFwY3qjd8VgpHoAgLYPAxt5V/Su'
-    b'fJZ3gYhImgTa7gPu9O7ow4bw3B7eEYOR8gGA2L/93xpof8A7QkQkhc70DuhbIdX3BEjtAGAU'
-    b'1wR28+7onaXgDSwiEqPSdUDsh093Myat5R0xUKkdACDsT9x3/psDbTd5R4iIpFEAAzvHu6MP'
-    b'w6FhH++IgUrxAGAHehf0LvwwJNf/i4jIgCy9CHjWu6J34SDvgoFK5QBgFDcG3uvd0Yv/wuuX'
-    b'eUeIiKRZYN4SsJ97d/TO3mdMGu9dMRCpHACAA4m6PZwbmL/Yu0JEJP3CecBC74peBGhIwZNo'
-    b'VxXxItqrmLf/F0FH5BOriEg6BEovAZd6d/QunYcBUjcAGC1TgMneHT2zqwNzXvSuEBHJjsL5'
-    b'3gW9s5bK2pQqqRsAwCKftOyX3gUiIlkSmD0TQuT3VIl9bVpVqgYAgwB83LujF3OhPfa7V4mI'
-    b'pFHsX65iXpu6laoBAJq2BDbxruiZ/TK5dlVERGprxOXEfTLgJkZxC++I/kjZANDwEe+CXiyF'
-    b'xku8I0REsigw81XgKu+OPsS8Rq0iZQOARfzDtWsDs/7rXSEikl0h9sMAEa9Rq0rNAGBsvgEQ'
-    b'8faKTv4TEamnQOs9QMm7oxfvMaZs6B1RrdQMANCxF8lJgDF6DNpv9Y4QEcmBC7wDehGgvKd3'
-    b'RLVSNABEvbXyW933X0RkKAy/FOjwruhZzIeqV5SKAcAojgGme3f0rHyld4GISB4EHnweuMO7'
-    b'oxc7GRPHekdUIxUDANjuwAjvih7MCbS3ekeIiORIzF+6RkDjrt4R1UjJABAiPqYSrvAuEBHJ'
-    b'l2XXEPVhgKgPWb8p+gGgcve/D3h39MxinkRFRDIn8MgLwN+8O3qxi8V70vqboh8AoKkIrOtd'
-    b'0YNZgVKbd4SISP6EmL98rQctk7wj+pKCASDs5F3Qs6jfgCIiGdZ4DbDUu6JntrN3QV80AAxK'
-    b'pwYAEREHgYdeAW7x7uhFxGtXIuoBwJK+Hb07evBwoP1f3hEiIjn2e++AXky3yNfYqOOgaQtg'
-    b'Te+K7tn13gUiIvk2/HrivQnbWtC8uXdEbyIfABpiPobyF+8AEZE8S24KFB7y7uhFzGtY7ANA'
-    b'tMdQFsCoe70jRETEbvQu6FnM57BFPAAY0xvBdvDu6MHNgZnLvCNERISIBwD+x5g6zDuiJ9EO'
-    b'APDcVsA474ruBW3/i4hEYZ37gJe9K3owFha9xzuiJxEPAIXtvAt6YNCgAUBEJAKB2zsg/NW7'
-    b'oxfbeAf0JOIBgK29A3owK/Dw094RIiKyXDniwwAh1rVMA8AA6Nu/iEhUwo2AeVf0QDsA/WFs'
-    b'sQYwwbujexbznadERHInUHoWiPWx7JtV1rToRDkAQMfWxPkkpQ4I93lHiIjIyuxu74IeBFiy'
-    b'lXdEdyIdAKLdMnkoUHrdO0JERFZWiHUAABqiXNMiHQAs1uP/Eb/BRETyLOYBIM5z2iIdAOL8'
-    b'YUW8xSQikmuBWY8BT3l3dM+29S7oTnQDgNG0HrC+d0f3Gmd4F4iISE9CrJ/R6xmbb+AdsbLo'
-    b'BgAoRHmyBPB4YFak06WIiBD1YdqO6O4IGOEAQLN3QPfCXd4FIiLSq4gHAJq8A1YW4wAQ3Q+p'
-    b'IuY3loiIsPZDQKxXakW3tmkAqFr4h3eBiIj0rPJcgAe8O3oQ3e52VAOAJTf/iXEA6IDXSt4R'
-    b'IiLSF5vlXdCDSRbZDe6iGgCgZUNgrHdFNx4JzF/sHSEiIn2a7R3Qg3EwJaorASIbACy6LZKK'
-    b'WCdKERFZQTniz+tyVDvckQ0A8R0jSYRYJ0oREVnBsNlA2buiB1GtcbENAFFNR11EPFGKiMhy'
-    b'gVkLgce8O3oQ1RqnAaAq0Z5UIiIiq4r1MzuqNS62AWAz74BuvAqlJ70jRESkapEetrWJ3gVd'
-    b'RTMAGNNGAet4d3RjVgDzjhARkarFugPwdmP8SO+I5aIZAOCVDYnsGslEaPMuEBGR/ijEet+W'
-    b'AKM39I5YLqIBIGzsXdA9e9S7QERE+uO1+cS7c7uRd8ByEQ0AxDoAzPcuEBGR6lVu3Pasd0cP'
-    b'olnrIhoAQjRT0YpCrJeTiIhIz2L97I5mrYtoAIjnh7Ki4fO9C0REpN/mewf0IJq1LqYBIJpt'
-    b'kS4WBh583jtCRET6LdYdgGjWupgGgGimordo+19EJKXmewf0QANAN6K5NOItOgFQRCSdyvO9'
-    b'C3qgAaArY+rqxPkY4PneASIiMhANse7gjjEmjPOOgEgGAFi2pndB97QDICKSTiOeINqnAjZG'
-    b'seZFMgBYFD+MVRWe8y4QEZH+C8xcBrzs3dG9EMWapwGgV+UXvQtERGTAXvAO6F54m3cBRDMA'
-    b'EOkAECJ984gkjMnTgBMcXvoko2W6w+uK9EesX+KiWPNiGQCimIZWVYj1zSM5Z4wfaRRPh/Kd'
-    b'+DxGe1OwW43iL4wpox1eX6QasX6GawDoIoofxqqGx/rmkRwzJq4Po+8BvgI0OKYE4EjovDNp'
-    b'EolNrLu4OgTQRTmKH8ZKlsHMBd4RIl0ZxWZovAfY0ruliy2h8Z9GcQvvEJEVRXseVxRrXiQD'
-    b'QBzT0EpeDPE+TlJyyChuA9wFbOLd0o31gduM5m29Q0TeEmIdAKLY9Y5kAIjjh7GSWN84kkNG'
-    b'y7uAPxHJN4cerAHhemPKRO8QkYpIDwHEsebFMgCs4R2wqmgnR8kZY7O1wW4A3uHdUoW1oPMG'
-    b'oyUNrZJ50X6OR7HmxTIAjPQOWJW95l0gYlCA4Vfjc6b/QL0T7AqL5/NFcqsc63lcUax5sfwB'
-    b'He4d0I0l3gEi0HI82P94VwzAjlD8oneE5N5S74AeRLHmaQDomQYAcWVMngR2mnfHIHzPaC56'
-    b'R0iehVg/x6NY8zQA9CzWyVFyo/wzYJR3xSCMgPBj7wjJtVg/x4d5B4AGgN7EOjlKDhjN7wem'
-    b'e3fUwHTdMlj8aAegNxoAehbr5Ci5UDjZu6B27DveBZJXGgB6E8sAEMV2yEo0AIgLY/KOKT3x'
-    b'ryfvNYo7eEdIHoVYP8c1AHQRxQ9jRdFOjpJ5nZ/0LqiDQ7wDJI8aYv0cj2LN0wDQs1gnR8kw'
-    b'ozgcwke9O+pgv+TfTWQoFWL9HI/iz0IsA0CMhwCWeQdIHtnuRHKb0Bp7G4QPeEdI3gzXANCL'
-    b'WAaA4B2wqnKjd4HkUfigd0H92C7eBZI3L+lzvBexDAAxHqeJYkKT3NnaO6COtvIOkLyxEd4F'
-    b'PYhizYtlAIhxm0YDgAypyjHyKd4ddfQeY7q+kckQCrF+jmsA6CKKH8ZKYn3jSGZZEYj1G0st'
-    b'rAbPp+mhRpJ6I2L98xTFl95YBoAofhgr0QAgQ21d74AhoMcEyxDSIYDeaADoUSHWN45kVxbP'
-    b'/l9JeJt3geSJxfpFLoo1L5YBIIppaCWxvnEks3KxOObh31GioR2A3sQyAEQxDa1EA4AMtTHe'
-    b'AfVnY70LJFdi/RyPYs3TANCjaCdHyaywyLtgCLzhHSC5EuvnuHYA3hLlffdHewdI7rzmHTAE'
-    b'FngHSK7E+jkexZfeSAaAOH4YK1nbO0DypvMl74L6Czn4d5R4WKyf41F86Y1kALAYtz7X8g6Q'
-    b'3JnnHVB/hX95F0iuxHplzWLvAIhmACDGbwWxTo6SWcv+BXR6V9TRYpj4hHeE5ElYx7uge/ai'
-    b'dwHEMwBE8cNYyUhjSqzHjySDAvOWAHO8O+poduCqLA84Ep9Id3JDFGteJANAHD+MVXVG+uaR'
-    b'DLvNO6CObvUOkLwJse7kRrHmRTIA2AveBd0zDQAyxEKWB4As/7tJlKL9DNcA0EUUP4xVFWKd'
-    b'HiWzCjcBr3tX1MHLsOR27wjJnUgHgHIUX3ojGQAKUfwwVhXt9CgZFZi1EPiDd0ft2RWVcxxE'
-    b'hlKkX+LiOOwdyQDQEcUPY1UW6RmkknG/9g6og4u8AyRfLFnfIn32hAaALmLdAWBj7wDJn0Dp'
-    b'NuCf3h01dHug7T7vCMmbKesDw7wrutcQxZoXyQAw8kXAvCtWFcY7B0hulb/nXVA79h3vAsmj'
-    b'jk29C3pgsGYU976JYgAIzFxGnPdBj/UNJJnX/kfgbu+KGrgp0PY37wjJo8J474IevBq4vcM7'
-    b'AiIZACqi2BJZyXjvAMmnAAblo4Fl3i2DsAQajvWOkLyy8d4FPYji+D9ENQCEp7wLurGWMWGc'
-    b'd4TkU6C9FTjLu2PgwmmBWXO9KySvQqw7uE96BywX0QBg870LujdyvHeB5Nk63ySdhwJug6Yz'
-    b'vCMkzyzSASA85l2wXEQDQDw/lBVFu40kOVA5Vngg8F/vln54CsIndN9/cTbeO6B78XzZjWgA'
-    b'iOeHsqJot5EkJwKlJyB8AHjFu6UKr0L4cKD1Oe8QyS9jeiOwoXdH9+L5shvRAFCI5oeyoli3'
-    b'kSRPAq2zwPYF3vBu6cUCCB9KWkU8vbQR0Ohd0b3yfO+C5SIaADrmexf0oMk7QASgcjndTsR5'
-    b'xcxzUN4p0HqPd4gIlJu9C3rWGM2X3YgGgJaniPOSp8neASLLBUr/AHYEHvFu6WI2FLYPtD/g'
-    b'HSKSKE/xLujBUpj1H++I5aIZAConDMV4KeB6xpS3e0eILBcotUHHVsBl3i3AJTByu8DsR71D'
-    b'RN4SYv3i9kSAsnfEctEMABXRbI2sqCPWN5PkVGDua4HSQWAfB552SHgMwp6B0icDM2M+L0Hy'
-    b'KdYdgKjWuMgGgGivBIj1zSQ5F2i7EjqagDOA14fgJV8BvgXjioHWPw/B64n0izFhBLCZd0cP'
-    b'NAD0LJ7LI1YU7XaSyPLdgJOgczxwGvBMHV7mSbCvwZJNAqXTAjMW1eE1RGpgxCSifQpgXF9y'
-    b'IxsALNLbhpoGAIleYM6LgdK3oHkjYHfgEuDZQfySTwEXAu+H0vhA2/cD8xbUolWkfmLesS3M'
-    b'8S7oKrLrJBtnQZQ3Dysa+zXozmaSBpX36V8qf2EUm4H3QpgINhHC+mBrAGNJHsP9OvAyyYI/'
-    b'F2wOlO8OzInpSgORKkX9hS2qe2RENgBMnAdti4BR3iUrGQVz3g1ENb2JVCO5aoA27w6RIRLr'
-    b'ALAQWqM6zB3VIYDKN5eSd0f3bGvvAhER6ZlBALby7uhBa0yXAEJkA0DCotoi6eK93gEiItKb'
-    b'lknA2t4VPYhubYtwAAizvQt6oAFARCRqFvHntEW3tkU4AMQ3JSWsaBTX9K4QEZEeRTwANES3'
-    b'tkU4ACyL7odUEcC29Y4QEZEeRTwALGv1LlhZdANA4JEXqM+NTGogRPzmEhHJL2PLdYAJ3h09'
-    b'eDow50XviJVFNwBUxLoLoAFARCRKy3YguQogRlGuaZEOAPGdLFGxjTE10ltMiojkWXl774Je'
-    b'RLmmRToA8E/vgB6sBou39I4QEZGVxXyI1u73LuhOpANA513eBb3Y2TtARETeYkwYR7w3AAIs'
-    b'yjUtygEgMPc/wOPeHd0Lu3sXiIhIVyM+QLRPAOTRQHuUJ7ZHOQBU3O0d0D3b3pi6uneFiIi8'
-    b'aTfvgF5EupZpABiIRljyfu8IERF50we9A3pmsa5lGgAGxnQYQEQkAsbkycDG3h090wAwAKXZ'
-    b'wKveFT3YzeK93lREJEfKMX8hewXao30Ud7QDQOWxifd5d/RgQ2gqekeIiEjMx//DPbE9Arir'
-    b'aAeAimi3TqAh5qlTRCTzjOIYIOYbAEW8hkU/AMR77ETnAYiIeCvvAozwrujFPd4BvYl8AAj3'
-    b'AR3eFT14nzHl7d4RIiL5FfbxLujFMhjxD++I3kQ9AARKrwP3enf0oBHKMb/5REQyyxg/EsJH'
-    b'vDt6cXdg5hveEb2JegBIhBu9C3pm+3sXiIjk05jdgXHeFb2IeO1KpGAAKMf8Q/wfY+L63hEi'
-    b'IvljH/cu6F34i3dBX1IwALQ9BER5H2WgAI0f844QEckTY+pqwIe9O3rxDLRG+QjgrqIfAAIY'
-    b'cLN3Ry90GEBEZEgt2gMY413Rixsqa1fUoh8AEjGfB8AORjHi21CKiGRNiP2LV/Tb/5CeAeBm'
-    b'4r0cMAA6DCAiMgSMKaOJ+u5/dMCwv3pHVCMVA0Bg9stAzNdTHugdICKSD+W9gdHeFb2YEXjo'
-    b'Fe+IaqRiAKiIeUtla6O4hXeEiEgOHOEd0Lv4z/5fLkUDQNTnAQAc5h0gIpJlxqTNwN7n3dG7'
-    b'qC9dX0GKBoDWB4D/eFf04mBj2ijvCBGR7Go4nLgfxf505dL1VEjNAJA8UtF+793RizXgtX29'
-    b'I0REssgoDgc+5d3RhyvTcPnfcqkZABLhSu+C3lnkx6ZERFLrI0DkD2ArR75GrShlA0DpHuBx'
-    b'74pevM8oNntHiIhkUOxfsJ6E9vu8I/ojVQNAZWvlau+O3oVPexeIiGRJ5WZr7/fu6MPv0rT9'
-    b'DykbABIW+RaLfdKYMMK7QkQkQ44AGrwj+nCVd0B/pW4ACLTdB/zbu6MX68DIg7wjRESywBg/'
-    b'kvi3/x+F0v3eEf2VugGgIvLDAPYlS+/PVkQkImP+F3iHd0XvwhVp2/6H1C5ShcgPAzAJmmK+'
-    b'V7WISPQsOfXrC94dfYv90HT3UjkABGbPBOZ5d/SucIJ3gYhIujXtBTR5V/ThkUApNTf/6SqV'
-    b'A0Ai+olrZ6N5S+8IEZH0KhzvXVCF2NeiHqV4ACj8iuiPuWgXQERkIIzi1kDk9/3HgIu9IwYq'
-    b'tQNAoPXfwO3eHb2zj1euXxURkf75sndAFW4NlCI/HN2z1A4AFb/0DuhDI4QUnMAiIhIPY/I7'
-    b'gb29O6pwgXfAYKR9ALgaeN47ond2tDEl8vtXi4jEpPw14r/xz4uw5A/eEYOR6gEgUFoKXOrd'
-    b'0YfR0PEl7wgRkTQwWt4FfNK7owq/Ccxb4h0xGKkeABKFXxD9yYDhc8bmG3hXiIjEz74FDPOu'
-    b'6Jtd6F0wWKkfAAKz5wAzvDv6MBKWpeGEFhERN8akzYBPeHdU4e5AW8k7YrBSPwBUxH4yIBCO'
-    b'Mlo28q4QEYlX4dtAo3dFFVJ98t9yGRkAxl0BvOJd0YcRwNe9I0REYmQ0tUDY17ujCq9CQ+qe'
-    b'/NedTAwAgRmLgMu8O/pmnzambOpdISISn8JppGNNuiwwa6F3RC2k4YddpcJ5QNm7og/DoPNk'
-    b'7wgRkZgYk6cCH/XuqIJBOM87olYyMwBUTga83rujCp+svNlFRASA8veB4F1RhT8HWtu9I2ol'
-    b'MwNAonCWd0EVClD+oXeEiEgMjOI+wAe8O6qTijWmammYuPrFKN4LbOvd0bewT6D1Gu8KEREv'
-    b'RnE4UAImeLdU4f5AaWvviFrK2A4AAD/yDqiOnWmMH+ldISLix04gHYs/EM70Lqi1DA4AzVcB'
-    b'j3pXVGFTGP1F7wgREQ9GyzsgnOTdUaX5sPbV3hG1lrkBIHBVJ5CWszS/bjSt5x0hIjL07HRg'
-    b'nHdFdcKPArd3eFfUWuYGgETHhcR/YyCAMdDwXe8IEZGhZDS9h3Q88Afg5Szc9787mRwAAnNf'
-    b'A8737qiOfcpo2cq7QkRkKBgEKJxLetaf8wOl170j6iEtvwED0HgukIZHNRbAzjemp+H+1yIi'
-    b'g1Q8Anivd0WVlkDHud4R9ZLZASDw8NNAWrZttoTnj/eOEBGpp8o5T6d7d/TDLwNz/+MdUS+Z'
-    b'uw9AV8mbrfBvYJR3SxUWAVMCpXneISIi9WAUrwH29u6o0mJonFD5MplJmd0BAAi0PwP83Luj'
-    b'SqOACyzjQ5mI5FPljn9pWfwBfprlxR9ysNgYm60Nwx4Fxnq3VCccHmhNy6ELEZE+GVNXh8Ul'
-    b'YAPvliothPCuQOtz3iH1lOkdAIDAIy8AP/XuqJ6dZWyelj8kIiJVWPxD0rP4A5yX9cUfcjAA'
-    b'JDp/CCzwrqjS6tD5f94RIiK1YEzeETjcu6MfXofhZ3tHDIVcDACBOS+SmmcEANh+RvN+3hUi'
-    b'IoNhFMdA+QLSdbj57MCDz3tHDIVcDACJkWcDL3lXVC+cbxQ39q4QERm4cC6pedgPAK9AIUVf'
-    b'FgcnNwNAYOarQJq21tcAfmvs1+AdIiLSX0bLx8AO9e7on/DDwOyXvSuGSpq2ZQYt2Y7iX8C6'
-    b'3i39cFKgdIZ3hIhItYyWjcAeBt7m3dIPzwLvzuptf7uTmx0AgOQ31r7m3dFP3zaK23hHiIhU'
-    b'w5Lbm19EuhZ/gK/mafGHnO0AwPI3Z/FeYGvvln6YB2yZtzeniKSPUTwJ+L53Rz89CKWtApS9'
-    b'Q4ZSrnYAAJLf4MKxgHm39MMECGd6R4iI9KbymN9TvTv6ycCOzdviDzkcAAACs2cAV3h39I8d'
-    b'VbmVpohIdIyJY6FwOTDcu6Wfrgi03ekd4SGXA0Ci4UvAQu+KfrrIKDZ7R4iIdJU8w6TxV8Bm'
-    b'3i39tAjKJ3lHeMntABCY9RRwlndHP40BrjEmjPMOERF5S/ErwL7eFf0XfhBof9y7wkvuTgLs'
-    b'ypg2ChbMAdJ2w50/QmnvkK7zGEQkg4zm90O4CUjbPUuegoZJgVlp2wmumdzuAAAEZixK4WWB'
-    b'AHtBy4neESKSb8ndSsPlpG/xB/hynhd/yPkOACw/dlW8C9jeu6WfOoBdA6VbvUNEJH+M8SNh'
-    b'9J3AVt4tA3A3lN6X913UXO8AACRvgMJhwBLvln5qBK4ypmzqHSIieTT6x6Rz8V8KdlTeF3/Q'
-    b'AABAYPYcII23210TOq8wpq7mHSIi+WG0HA0c5t0xQKcH2kreETHI/SGA5YzicOBBII2X2f0Z'
-    b'mj8auKrTO0REss0o7gZcR7ILmTZzYeEWgfmLvUNioB2AikBpKZQPI513g9oD2n7gHSEi2WY0'
-    b'F4Hfkc7FvwwcrsX/LRoAugi03wv83LtjgI43mj/vHSEi2WRMXB/CjcDq3i0D9LNA6S7viJjo'
-    b'EMBKkpvsjGgFNvJuGYBOsH0CbX/0DhGR7Ehu89v4d2AL75YB+g8MKwYeesU7JCbaAVhJYN4C'
-    b'KB/t3TFADRAu0+ODRaRWjP0aoPFS0rv4A3aMFv9VaQDoRqD9BrArvTsGaDXgWqNpE+8QEcmC'
-    b'tnOAPb0rBs6u1K5o9zQA9KjwBeBF74oBWg8KNxibre0dIiLpZRRPBj7r3TEIL0E41jsiVhoA'
-    b'ehBofQ7CEd4dg9AMw/5qFNf0DhGR9DFavgCc6t0xOOGYQOlZ74pYaQDoRaD1D8CF3h2DsDmE'
-    b'65MTeEREqmM0Hwr2I++OQbow0HqFd0TMdBVAH4wpo6FzJjDRu2UQboVxeyQPPxIR6ZlR3Jfk'
-    b'Wv80PuBnuX9Dx5aBua95h8RMOwB9SJ4WVTgIWOrdMgg7w4JrjQkjvENEJF5G815AWp/ut1wH'
-    b'2EFa/PumAaAKgdkzIaT8WBgfhBGXG9PTeAcvEakzo2kXCGm9y18X4VuBtvu8K9JAA0DVms6A'
-    b'8HfvikHaG57/VXJdr4hIwmiZDoU/AiO9WwYn/D35rJZq6ByAfjCmbAidDwMpP7PeroRRBwdm'
-    b'LvMuERFflYf7XAOM8m4ZpFegvEWg/XHvkLTQDkA/BGY9BRzp3TF4YX9Y/AdjWtr/wIvIIBjF'
-    b'PYE/kP7FH+AYLf79owGgnwKlqyH82rujBj4Mr/0pucpBRPLGaDmY5Jt/yrf9AcKvA6XLvSvS'
-    b'RgPAgLx+DHC/d8Xg2S7QeZtuFiSSL0bxSLCLSf0JfwA8DCM+5x2RRjoHYICM4sbATCADt9sN'
-    b'D8DSXQOPvOBdIiL1ZRQ/B5xLNj7/X4bCVoHZj3qHpJF2AAYoUHoCOBgoe7cMnr0Hht9mNK3n'
-    b'XSIi9WO0nAKcRzYW/zLwCS3+A6cBYBACpZsgnOzdURvWAoV/GsUUP/JTRLpjTG80mn8G9i3v'
-    b'ltoJJyefwTJQWZgCXRkEKF4F7OPdUiOvg+0faLvRO0REBs8ojgGuBHb3bqmh66D00ZCJHVg/'
-    b'2gEYpAAGHYcC7d4tNTIGwp+MlqO9Q0RkcIzNNwDuJFuL/79g2Ce1+A+edgBqxJg8Ccr3AeO8'
-    b'W2rHzoW24/QHTSR9jJYpYNcDG3q31NBCKG8XaG/1DskC7QDUSGD2HAhHAubdUjvhC1C8RA8R'
-    b'EkkXo2UPsLvJ1uJvwOFa/GtHA0ANJc+eDqd5d9TYgTDyZmPLdbxDRKRvRssXwK4Fxni31Ni3'
-    b'A6XfeUdkiQ4B1FjlpMBfA5/ybqmxp6G8b6D9Xu8QEVmVMX4krPYTCJ/2bqmD30HpwJCpHVZ/'
-    b'2gGoseQNOvII4G/eLTW2ARRuN1qO9Q4RkRUlNyYb/fdsLv7h77Dkf7X41552AOrEmDAORtwF'
-    b'TPZuqYNLYNxRgRmLvENE8s5o3h3Cb0n9U0q7NQcK2wdmv+wdkkUaAOrImDQeGu4F3uHdUgcP'
-    b'QsM+gVmPeYeI5FHlcOOXge+Rzd3cF4BpgdI875Cs0gBQZ8bkqVC+A8jiU/dehHBgoPVm7xCR'
-    b'PKnsMF4E7O3dUieLoPD+wOwZ3iFZlsWpMSqB2TOhnJFnBqxiLbAbjOJpxvQsPFVMJHpGy/Yw'
-    b'4iGyu/iXIRykxb/+NAAMgUD7tcAJ3h110gB8E56/y2h5l3eMSFYl9/NvOQXsDmBT7546OjHQ'
-    b'+gfviDzQIYAhZDR/F8LXvDvq6A0IXwu0nuMdIpIlRtMmULgEeJ93S539X6B0vHdEXmgAGGJG'
-    b'8w8hnOjdUWfXQOeRgTkveoeIpJ3RvB+E84E1vFvq7CeB0ue8I/JEA8AQq5y5+3PgSO+WOnsW'
-    b'ODRQ+ot3iEgaJSf6Df8JhIO9W4bAxVD6tJ47MrR0DsAQS25m0XwMcLl3S52tC1xvFM82pmTx'
-    b'CgiRukmu7R8xOyeL/xXQfJgW/6GnHQAnxn4N0H452H7eLUNgPnB0oHSTd4hIzIzJb4Py6WR/'
-    b'h3C5m2DJXoF5S7xD8kgDgCOjOBy4lmw9q7sX4SoY9tnAg897l4jEpnKs/ydAXh68dSss/HBg'
-    b'/mLvkLzSAODMmLoaLL4B2NG7ZYi8DJwUKJ3vHSISg8odQ38O7MIERC4AAAsESURBVOrdMnTC'
-    b'vWAfCJRe9y7JMw0AEajc1esWYBvvlqETbgD7TKD0hHeJiIfkMGDb54HvkM07hfbkfhi5S2Dm'
-    b'q94heacBIBJGcQzwR2Bn75Yh9AaEH8LYM/RgIckTo3lbCOcA23q3DLF/ArsFSi95h4gGgKhU'
-    b'DgdcQ662AgF4Cvg6lC7RIz8ly4wpG0Ln94CDyd/n7+3Q8ZHA3Ne8QySRtzdg9ConBl4OfMy7'
-    b'xcF9UP5ioP1e7xCRWkqG+yVfBvsyMMq7x8H1MG4/7fTFRQNAhCrHBi8EPuXd4qAMXAp8OVB6'
-    b'1jtGZDCSG3817wvhTGBj7x4nV8DIQwIzl3mHyIo0AESqMgT8AjjMu8XJAuD70HBeYNZC7xiR'
-    b'/jJapoOdQa5O7l2Z/QqKRwau6vQukVVpAIhY5bbBZwHHebc4egE4E8adq+1DSQOjaTsofB3Y'
-    b'w7vF2c+g9Dnd4S9eGgBSwCh+BTjdu8PZf4GzYeE5unGIxMhomQJ8Iyd39+zLGYHSSd4R0jsN'
-    b'AClhFL8InIWe3/A48B0YebGOKUoMjOLmwKnAR9Bnahk4IVD6kXeI9C3vb9ZUMZo+CoVLgdW8'
-    b'WyLwb5IbqFwWKC31jpH8SRb+8HWwfdFnKST39Tg40PoH7xCpjt60KWMUtwauA97h3RKJ5yD8'
-    b'HOxc3VxEhoJR3AH4CvBh9Bm63IvAXoHS3d4hUj29eVOocu/w64Fm75aIvA5cBp1nBeY84h0j'
-    b'2ZLcn8P2gvAlYGvvnsjMg/KHwv+3d/exdpcHHcA/z7m9rFTeRkvIQKDdC/X23kJdjcmgcc6R'
-    b'bCiNjslIBphNcVOXDgzGt/gHmmwGNZKRuAlDJTJRRKoJHeEPjcTRbnF2ttxeOly1zUbtjO1g'
-    b'pTDoy3384xwHewH6cnuf8/L9JDfnl3t6k++9Pec839/b89j+ldZB4tikAAyoatVZHFqPd7TO'
-    b'0mdm8TCdjxfTn28dJgZbd52OhR+k3oILWufpQxs59DPFf+xtHSSOXQrAAOvNGvhp/FzrLP2p'
-    b'/Av1Tp5bnzsH4lj0Luz7Rd331umN4/Sre3FjrsEZXCkAQ6Cauol6u/x/vpJv4n58qpjZ0jpM'
-    b'9Kdq+ekseA/lBuoVrfP0t3oHT9yctTsGWwaMIVFNXUu9G6e1ztLnPk+5m879mWEw+PbEPTfi'
-    b'Wnn/vJbndPf6/6Z1kDhxKQBDpJqYovMgLm6dZQDsp/w19V5mNmVPZrRUE29g7H3UX8DK1nkG'
-    b'xFeYvbrYvq11kJgbKQBDpncY8y/w3tZZBshT1PWUB5jZmDIwnKrJs3Wn570G78aCtokGymcZ'
-    b'v77Y8kzrIDF3UgCGUG8NgV/HxzDWOs+A+Sr1H1IGhkO18vXMrtUd9N+F8caRBk3FHzDz25nT'
-    b'f/ikAAyxavJduA9nt84yoHZ0i0D9LCu+kBXNBkN1yQ9y5Eq8B1fIoH+8voHriplHWgeJkyMF'
-    b'YMhVUxdQH5TJS07UATyKhxh7uHj8qcZ5oqe7dPaXV1HXUq/CW+Wz7URtofPeYvq/WgeJkydv'
-    b'khFQve1U9n8SH2idZUhUbKE8wpFHOHdT8ejh1qFGSTVxEWNXUt+Nd8rV+3PpHs74lSy/PfxS'
-    b'AEZINfmzuFNOCcy157AFj2EjnceK6acbZxoq1co3MrsGl2MNJuTza67tp3yk2PaZ1kFifuQN'
-    b'NGKqyQvxl3h76yxD7Aie9J2FIIdSj1K1epyDl1B7A379CSxunWu4lS9QrsvrdLSkAIyg7jnT'
-    b'7b9BvVUukJovu/H4S1+daU75crH5UONcTfXux1+JS6krde/Jn5TX5Xw5RLmVidtykevoSQEY'
-    b'Yb2lhf8Kb2mdZUQdxHbqNGW6+zi2k2d3DdvaBdXy8xhfiomXDfSXYEnTYKNth+5V/v/aOki0'
-    b'kQIw4qrJ03A7bmydJb7DHuyk7KTuwi7qTjq76Hy9n6Yxrn58AXsXUy+iLqUspS7rPlqGi7Cw'
-    b'Vb74fuqfU24qZg60ThLtpAAEqKaupt4l51oHxQvY99JX2Uvd+7LvPU/tXYhYXmT2+d72s4wd'
-    b'ZvYInf3U11EWdZ+rp3NkAZ0x6hm9f39q7/nF1CXdx7KYuri77RycOU+/c5y4b+DDxczftQ4S'
-    b'7aUAxLdVU+dS/xA3tM4SEXNuAwt+qdi6u3WQ6A8pAPE9qomfpPMpXNg6S0ScsD1YV8w82DpI'
-    b'9JdO6wDRf4rtD7NwArfp3tIWEYOn4l5MZfCP7ydHAOJVVVOXUT+NFa2zRMRR24EPFTP/3DpI'
-    b'9K8cAYhXVWzbxMJV+E282DpPRLyqQ7iNF6cy+MdryRGAOGrViknKXbisdZaI+B6bmP1wsX1b'
-    b'6yAxGFIA4phVk2txB5Y2jhIR/Dd+l5m7C7Otw8TgSAGI41KtXsQL6/A7shJbRAvfwh0c/ljx'
-    b'5LOtw8TgSQGIE1Jdej6Hfx/Xy+spYr5sYOyjxeM7WweJwZUP7JgTvXUFPoG3tc4SMbzKl5i9'
-    b'uXjic62TxODLXQAxJ4qZLzJzOfV9+FrrPBFDZi/lZiZ+NIN/zJUcAYg5111gqNxEvQWvb50n'
-    b'YoA9jT/m8Cdynj/mWgpAnDS9lQY/ojuHwFmN40QMkgP4Ezq3FdNPtw4TwykFIE66avJsykep'
-    b'v4ozWueJ6GPPUf+MzseLbf/TOkwMtxSAmDfVxUsY/zWsw6LWeSL6yEHcw+ytxfY9rcPEaEgB'
-    b'iHlX/fA5HLwFN2Fh6zwRDfUG/gW/l2V6Y76lAEQz1dS5+GXqOpzdOk/EPNpPvYfOHxXbctdM'
-    b'NJECEM31LhZ8P27BxY3jRJxMu/CnjN9ZbHmmdZgYbSkA0TcqHSZ/Cr8lEwrFcNmC2znnvuLR'
-    b'w63DRJACEH2qmlzTu3Pgaoy1zhNxHCrln6h3FDMPtQ4T8d1SAKKvVSt/iNl1uA5nts4TcRT2'
-    b'U++jc0exbXvrMBGvJAUgBkK1dCGL1tL5EPWd8tqN/rMZd+G+YuZA6zARryUfojFwqkuWc+SD'
-    b'+Hmc0zpPjLRn8Lf4ZDGztXWYiGORAhADq5o8hfrTOSoQDfT29hd+ptj8fOswEccjH5gxFKrJ'
-    b'N+MDuBZvbpsmhtQO3I97ipkdrcNEnKgUgBg61YpJOtdQ34+3tM4TA+1r1L+nPMDMxkJtHShi'
-    b'rqQAxFB7WRm4Hm9qnScGwlPU9Rn0Y9ilAMTI6JaBcgNuwHmt80Rf2Yv1uJeZTYXZ1oEiTrYU'
-    b'gBhJvTJwFeUK6tsx3jpTzKsjurPz/SM2ZNCPUZQCECOvtxbBO3AVrsQFbRPFSfK/lEepG+g8'
-    b'VEw/3TpQREspABHfpVr5RupaXEX9MZzSOlMcl95eftlAeYjpL+V8fsRLUgAiXkW1ehEvvBWX'
-    b'Yw0uk6WL+9UBbMVj2Mj457LiXsQrSwGIOEbdIwSza7xUClY0jjSq9lB6g315jOl/z3n8iKOX'
-    b'AhBxgqrl5zG2hvIjuBQr8YbGsYbNHkxjK/XfGN9YbN3dOlTEIEsBiDgJqlVncWgKK6iTlNVY'
-    b'hR9oHK3fHdSdcW8zZvAEvljMfL1pqoghlAIQMU8qHSbeROdSynLqUizDUlxodG5FPISvYhd2'
-    b'UnZRn2R2K9v/M4fxI+ZHCkBEH6iuGeOJ85ldSmcZZVm3IJRl1PN1Vz08o23Ko7Zf95a73dT/'
-    b'H+B3MruTzi5W7C4eONI4Y8TISwGIGBDV6nGeX4LFLFhMXUxdQlnS3dZ7rryO2sGZvR89FQt7'
-    b'22fpvu/HcVrvewd098qr7vK28AK+1dv+JmWW+iL2YS9lH3Uvpbd9eB+dvSzcV2w+dBL/DBEx'
-    b'R/4PBd6HdK05hbMAAAAASUVORK5CYII=')
+ICONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icons')
 
-RUN_ICON = PyEmbeddedImage(
-    b'iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAABHNCSVQICAgIfAhkiAAAIABJ'
-    b'REFUeJzs3Xl4nGXZ9/HvOUnTQkuL4AZlcwcqVSzQziSFiChUQURAUURfZBUXBFxwQ0BUUOAR'
-    b'UFEWRREQKrgCAgqVJpMWqApYBEU2AUHZ9y6Z8/1jUmhLlkkyk/O65/59joPjeVTofEmnc51z'
-    b'3ZshIvXjFKA0Heyt4NOBTYENgYnA2rFxmfEE8DRwH3AbcBMU/gSti7B5y2PTRJqHRQeINAUv'
-    b'bQ3sA+wFvCy4plk9Bn4x2E+hPB/Do4NEskwDgMhoePsc8C8CHdEpOfMX4OtQ/iVGJTpGJIs0'
-    b'AIiMhBdfC/ZdYMfolJxbBH4I1nNddIhI1mgAEBkOx6B4KNjxwPjoHAGgFzgOpn4Nm9sbHSOS'
-    b'FRoARGrlnZNg6c+AXaNTpF9Xg++J9TwSHSKSBRoARGrhxXXAfguUolNkUH+Hwk5Y1z3RISKp'
-    b'0wAgMhTveAlU/gRsEZ0iNbkLrB3rvj86RCRlhegAkaR5cQ3w36LFP0s2Af893qn7LogMQgOA'
-    b'yOBOA2+PjpBh2wKWnls9aVNE+qMBQGQgXvwA2H7RGTJiO0PpE9ERIqnSdCzSn+pJf7eiu/pl'
-    b'3TNQmYYtuCs6RCQ12gEQ6Zd9Ey3+zWBNKJwYHSGSIu0AiKzOOzaCyu3AuOgUqZfCVljXougK'
-    b'kZRoB0DkRSpHosW/yVSOjC4QSY12AERW5tMnwqT/AGtFp0hdLYdlG2LXPxAdIpIK7QCIrGLi'
-    b'7mjxb0at0PaB6AiRlGgAEFlF4T3RBdIo/t7oApGUaAAQWcEpgG8XnSENs031EI+IgAYAkZXM'
-    b'fCOwTnSFNEwbTJoZHSGSCg0AIs9r3Sy6QBrN9Xss0kcDgMgL3hAdIA23aXSASCo0AIg8r6I7'
-    b'/zU90++xSB8NACIv0OV/zU+/xyJ9NACIPM/aoguk4cZHB4ikQgOAyAuejg6QhnsqOkAkFRoA'
-    b'RF7wRHSANJx+j0X6aAAQeZ7fE10gDXd3dIBIKjQAiLzg1ugAabjbogNEUqEBQOR5y28EPLpC'
-    b'Guqv0QEiqdAAILKCXf8A+N+jM6Rh/gvlxdERIqnQACCyCrsqukAa5ipMOzwiK2gAEFlF4YLo'
-    b'AmkUOz+6QCQlGgBEVmZdCwEdBmg69gCMuzK6QiQlGgBEXsROji6Qequcgs1bHl0hkhKLDhBJ'
-    b'jk9rgym3AxtGp0hdPAq9m2ALdRMgkZVoB0BkdbZ4KfiR0RlSL3aUFn+RF9MAINIf6zkf+GN0'
-    b'hozaX2D906MjRFKkAUBkQK37Ag9FV8hI+dPQ8iFsbm90iUiKNACIDMSu/Tf4vkAlOkVG5BBs'
-    b'/i3RESKp0gAgMhjr+R3wiegMGbZjsJ6fRkeIpEwDgMhQrHw68JXoDKnZqVj56OgIkdTpMkCR'
-    b'WnnpEOA0NDin7ASsrCs4RGqgAUBkOLy0Pdh54K+MTpFVPAEchJV/Hh0ikhX6JiMyHFa+GpgB'
-    b'/tvoFFnB5wFv0eIvMjzaARAZKe/YBSrfAjaNTsmpu8G+BN3n6yl/IsOnAUBkNJwCtO8B/mmg'
-    b'GJ2TEzeCnwpLz8UWLYuOEckqDQAi9eIzXweFvcB2AGYBbdFJTWI5cAPwR+i9CFt4U3SQSDPQ'
-    b'ACDSCF5cA3wzKLwe2AiYDKwFTBjFr/o64K31yBsD5wBLh/+P+VLgSbDHgfuA26Dt79i8p+pa'
-    b'JyIaAEQyw0v7ABm5uU3vFD2ARyRtugpAREQkhzQAiIiI5JAGABERkRzSACAiIpJDGgBERERy'
-    b'SAOAiIhIDmkAEBERySENACIiIjmkAUBERCSHNACIiIjkkAYAERGRHNIAICIikkMaAERERHJI'
-    b'A4CIiEgOaQAQERHJIQ0AIiIiOaQBQEREJIcsOkBE+njn2rBkQ2BjsI3ANgTv+89sBL4u2MTg'
-    b'ylr1AHeA3wOFe4B7gLth3N3YvKeC20QEDQAiY8s7J8GyTcE3A9scfFPgdcCGwOTgurHyCHAP'
-    b'+B1gt4LdAr1/h2W3YoueiY4TyQsNACKN4NMnwsQ3QWHz6mLPNGBTYCP0524gDn4XcCsUFlf/'
-    b'L4uhciPW82xsmkjz0QeRyGh5ZyssewNUZoD1/eVbA23RaU2iF/w2sEXgi6BlEbTegM17LjpM'
-    b'JMs0AIgMlxc3hcJMYOu+hf5NwPjgqrxZAtwI3AB2HbRci117Z3SUSJZoABAZirevD5V2sB2A'
-    b'nahu40t6/gPWBf4HsG6se3F0kEjKNACIrM5LG4N1AtuDv5XqCXqSPfcC14D9CewarOuO6CCR'
-    b'lGgAEPFpbbD2duC7AO8EXhOdJA1xK3ApcBksmY8tWhYdJDXyGVNgwo7g04H1gZcDj4H/Fwp3'
-    b'wPIrsIX/DK7MHA0Akk8++2VQeSf4zsCOwFrRSTKmngCuBC6D3suwhQ9GB0k/vLQ9cCTQCYwb'
-    b'4u/+B3AG+Pd11UhtNABIfnj7NKjsArYLMBNoiU6SJDiwCPgV9F6kb5IJ8NmbQ+UU8B1G8E/f'
-    b'B3wZK59T56qmowFAmpuXNgZ/D9hHgC2jcyQL/BawuVA4H+v6R3RN7nj7HPALgCmj/JXOgsc/'
-    b'ji1eWo+sZqQBQJpP9az994F9ANgmOkcy7Xrwi8DmYuW7o2Oanpc+BnyX+j2nZj4s2QVb9Hid'
-    b'fr2mogFAmoMX1wHbHfgAsB160JXUlwMLgHNgyYVaUBrAizuCXUrdD835Qli6o37PXkwDgGSX'
-    b'U4BZ20PLgeC7ojvvydh4BrgYCj+Crj9heHRQ5nnpNcANwNoNegENAf3QACDZ41u/EsZ9BDgA'
-    b'XbInsf4NnA+VH2AL7oqOySwv/QLYvcGvsggKb8e6Hm3w62SGBgDJBqcAxXcAB/SdxT/UJUEi'
-    b'Y6kX7Cqo/BA2+C02tzc6KDO8fSvw6xiT9Ug7ASvTACBp89kvg94Dgf2BTYJrRGrgd4J9D9rO'
-    b'xuY9Fl2TPC9dAOw1hq+4AJbspCFAA4CkyouvBfsk1YV/zegckRF4DpgLfAsr/y06Jkk+YxyM'
-    b'/y8NO/Y/IB0OQAOApMbb3wp+ONVb8upMfmkGDlwFdgp0/x6jEh2UjOqf96uDXn0B9O6ILXwi'
-    b'6PXDaQCQeD5jHEx4X9/C/5boHJEGuhXseHjufD2LAPDSJ4FTAwtyPQToG5bE8Rlr4qXDYfwd'
-    b'4D9Di780v03Bz4Hx/8BLH8M7J0QHBXtl8OvPgpYr8JmTgztCaACQsVdd+I+A8XcCJwEbRCeJ'
-    b'jLFNgO/D0jvw0hF456TooCAvjQ6gOgT8Po9DgAYAGTs+feJKC/+JVB/pKZJn6wEnwtK78Paj'
-    b'8I6XRAeNLU/lTPxiHocADQDSeD5jTbx4KEz6J1r4RfqzLvgxULkHLx2fn4XIHoguWEnuhgCd'
-    b'BCiN48U1gI+DfRYt+iLDYA+Afw2WnNnUJwt6aVfgV9EZq+mB3p3ycGKgBgCpP8eguAdwAtir'
-    b'onNEMuwe4Osw9eymvLugd06CpQ8B46NTVpOLIUADgNSXl4pUT+wrRqeINA+/BTga65kbXVJ3'
-    b'XroCeEd0Rj+afgjQACD14bM2Azuh7z79ItIQPg8qh2ILb4ouqRsv7gZ2SXTGAMrQO6dZhwAN'
-    b'ADI6vs260HoUcAjQGp0jkgMV4DzgM1j5v9ExdeGlHmBWdMYAmnYnQAOAjIzPGAdth4IdBawV'
-    b'nSOSQ4+AHwXjf4jNWx4dMyrePhv8GqAlOmUAZbCdsO4no0PqSQOADJ93dEDl+8AW0Skiwq3g'
-    b'h2E9v48OGRUvHU71/KFUNd1OgAYAqV310bzfAj6C3jsiqfkFtB6OXfvv6JAR89KPgH2jMwbR'
-    b'VDsBuhGQDM0xvPhh6L0F+H9o8RdJ0R6w/Fa89Hl8z1S30ocw9QDg3OiKQZTAm+bZAfogl8F5'
-    b'6c3A99FlfSJZ0gN2ANa9ODpk2HzPFrj/R+Afjk4ZRFNcHaABQPrnnRNg2dfADyPdE3NEZGBL'
-    b'q5fmTv46dvmS6Jhh8T1b4L4fA/tEpwzMuoE5WT4coAFAXsw7ZkLlx8Bm0SkiMmq3Awdh5auj'
-    b'Q4bFKUDpbKqHHVOV6Z0ADQDyAp8zHh4/BvgM+tafJU8BDwP/A3sI/GHg6b7/fsV95B/t+7/L'
-    b'+v57gGeANav/r48D63skra8J1ndrVp8C1gas289feo9kh4P/EJ7+DHbT09ExNasOAWeR9ImB'
-    b'2d0J0AAgVd6+Ffg5wLToFHneEuBu4K7qX35n9T+3/Ad6H4bCwzD54bDtXS+uAy0vhcq64OuC'
-    b'bVR99oNvQvV595uQxvPe5QW3g+2DdS+IDqmZU4DiGWD7RacMLJtDgAaAvPNpbTDlKODz6E5+'
-    b'EXqpfijfBPwN/A6o3Aktd0L3fzA8OnBUvH0tqGwCLZtA5VXgm0FhC/A3AlOC6/JqOXA8LDk2'
-    b'M08a9BlTYPztJD1QZm8I0ACQZ156I3A+uqHPWHkIuBHsZqjcDIWboLIY63k2OiyEz9oEWqaD'
-    b'bwE+HWw68Dp0aGGsLILKPtiCv0eHDMpnToaW35ONK5G6wN6ZlSFAA0BeefvB4CcDa0SnNKll'
-    b'wCLwHih0AQuw7vujo5LnnRNg6ZZACejo+78vj41qas8Cn4fyd5PcbcrW4r9CZoYADQB5451r'
-    b'w9KzgN2jU5rMo1TvElYG7wK/Prff7OvNZ74OWtqBdvAS2Gbos6veroLefbCFD0aHPC+bi/8K'
-    b'XdA2B5v31NB/axz9IcoTL5bAzgc2jk5pAkvA5oNfDlwJ5cVJfoNqRtUnUHYCO/X9tUFsUNP4'
-    b'DxQ+iHXNiw7J+OK/wq+h/F6MSnTIQDQA5IFjUPwU2LeBcdE52eV3gl0F/geoXJHVa3+bjne8'
-    b'Gnp3gcLO4LOB8dFJGdYLHAflY8MWLp8+ESZdBmwb8vr1dRxW/kp0xEA0ADQ7n70e9J4LvC06'
-    b'JYOWA9eAXwotl2Nd/4gOkiFUrzp4GxR2AnYFf2V0UkZdAS37YPP/N6av2hzf/FfmUChiXQuj'
-    b'Q/qjAaCZVbf8fwGsF52SIRWwHqjMheUXYtc/EB0kI+QUoKMElT3B3qdhYNjug8JeWFfXmLxa'
-    b'c33zX9m1WHm76Ij+aABoVtWz/E8B2qJTMqACdAEXQu/FSZ0IJfXhna2w7K1QeT/YbsA60UkZ'
-    b'sRzsi9B9YkPPcWm+b/6rse2x7muiK1anAaDZVG/n+11g/+iUDFgE/BTsF7pEL0d8xjiYsAP4'
-    b'B4A90KWwtbgQlnwUW/RM3X/lpl/8ATgdKx8SHbE6DQDNxNvXB78YmBWdkrAngJ9D5YfYgj9H'
-    b'x0iw6uKzF3AQ8JbonMTdCOyKle+u26/YvNv+q/s3lDdO7UohDQDNQsf7h1IGzoKnLsrUw1Bk'
-    b'7Hhpa+AAYC9greCaVD0Ild2xBd2j/pXy8c1/ZZvUdXiqAw0AzcBLBwKnoeP9q3sEOBfsTKx7'
-    b'cXSMZIR3ToJle4EfAGwTnZOgJeCHYD0/GvGvkL/FH6CElXuiI1amASDLqo/K/BZwRHRKYm4H'
-    b'/w4s/XFDjllKfnj7LPAjgN3QMwpWdwq0fQabt3xY/1Q+F3/Adse6L4muWJkGgKzy4hpgP6V6'
-    b'EpNUlcFOgu5fpXz3Lcmg6s2GDgP2BZsYnZOQq6B3j5pvipXbxR/Ad8N6fhVdsTINAFnkxXXA'
-    b'fgXMjk5JQAW4DCrH1+W4pMhgfOZkKOwL9hl0C+IV/gat78Su/fegf1d+TvgbgM/Eeq6LrliZ'
-    b'BoCs8eJrwS4HXhudEmwJcDZwMlb+V3SM5IzPGQ+P7Q32eeD10TkJuAda5mDzb+n3f831N/8V'
-    b'ejfEFt4bXbEyDQBZUj0e+Wvy/XjUZcDPoXA01nVHdIzknFOA4u5g30BD+aPAe7Dytav8t7n/'
-    b'5g/AHVj5NdERqytEB0iNvLQH+DXkd/FfDpwDrW/Ayh/W4i9JMCpYz1xYsjn4wcDg2+DN7SXA'
-    b'FXjphUeN+8zJMOkqkln87avABQEv/NuA1xySdgCywIsHgX2ffA5sFbCfgx2jh/FI8qp34jwQ'
-    b'+AL5vSdHBTgMes9Ja9vfj8J6vobv2QL3/xT8g2P32lbEuheM3evVRgNA6rx0OHAiufy98kug'
-    b'cJSu4ZfM8RlrwviPUR0E1o3OCXIvyZwoaV/Fuo99/j/6ni1w30+AvcfgxX+HlXcZg9cZthwu'
-    b'KhnipaOBr0ZnBPgL+GFYz5+iQ0RGpXrFztHAwcC44JqcWm3xX6E6BJwDfKiBL94LviXWc3MD'
-    b'X2PE8rilnD7H8NKJ5G/xfxj80zB1ay3+0hSs5xGs/CkovBH4XXRODh3d7+IPYHN7Yer/A/9J'
-    b'417ePpvq4g/aAUiPY1A6BfhkdMoYWgacDkuOwhY9Hh0j0jA+awcofAeYFp2SA0dj5WOG/Luq'
-    b'V3L8COwj9X15+ynWXedfs740AKSk+szyn4ztySnhfg3+Gazn9ugQkTFRfRzxJ8CPAtaOzmlS'
-    b'tS3+K1Rvq/5N4HN1ev2z4PGPY4uX1unXawgNAKnwzlZYciHYe6NTxshd4AdjPVdEh4iE8Nkv'
-    b'g96Taewx6Dw6BisfPaJ/0tv3Bj8TWGOEr70M+AxWPnWE//yY0jkAKXAMlvwgJ4t/BTgDbLoW'
-    b'f8k1m/8/rLwP+BwgqcfEZtjRI178Aaz7POh9PXAG1XuP1MrB5kLhjVlZ/EE7AGnw4slgh0Vn'
-    b'jIGbwfdP7X7YIuG8cxIsPQ74BHrq4EiN/Jt/f7z0GqoPW9uZ6r0MVv99cWARcCnwC6z8t7q9'
-    b'9hjRABDNS18CjovOaLDngK/DkhOwRcuiY2Ql3r4WrP9M9YxoCecdM6FyJrBFdErG1HfxX53P'
-    b'GQ9PvgIqU6FSgNb/QO9/sJ5nG/aaY0ADQCRvPxj89OiMxrJu6D0AW/D36BLph5fOB3qw8mnR'
-    b'KdLHO1th6RHA0cCE4JosOAErHxkdkUUaAKJ4+3vBL6J5t/uWAd+A8rEYlegY6YeX9gF+CjwJ'
-    b'vhnWc190kqzEZ28OvecBb45OSZgW/1HQSYARfNYO4OfTvIv/rVCZhZWP1uKfKN92Q+CUvv+0'
-    b'Fth3InOkHzb/FmgrAieA/hz1Q4v/KGkHYKxVj/H9AZgUndIg58JTH8Nuejo6RAZQveb5amC7'
-    b'Vf8H2xXr/k1IkwyuegOhnwDrR6ck4ltY+fPREVmnAWAseemNwJ+AdaJTGuB/YPtrAckAbz8K'
-    b'vL+bpNwDbdOweU+NeZMMrXrfgLOAd0enBNPiXyc6BDBWvOPVwJU05+J/FdibtfhngLdvBf7l'
-    b'Af7XjWBZ3p4/kR3V+wbsCv4R8LzusGnxryPtAIwFn70e9HYBr45OqbPl4F+AnpMwPDpGhuDT'
-    b'J8KkPwOvH+TvWg6+Ddbzl7HKkhHw9mngFwNviE4ZQ8dh5a9ERzQT7QA0ms+YAr2X0XyL/0NQ'
-    b'mYP1nKjFPysmncbgiz9AK9gPq49KlWRZ92KwrYFfRKeMkW9p8a8/DQCN5DPWhPG/o/ku4/kz'
-    b'VLbGFvwhOkRq5MXdgH1r/Lu3hnsPbmSO1IF1Pwnl9wFHAk18Iyf/trb9G0OHABrFZ4yD8b8F'
-    b'doxOqbMzYconscuXRIdIjbw4FexGYN1h/FNPgG+uewNkhJfeAZzP8H6Ps+CfMHUz3amyMbQD'
-    b'0DBtp9Jci/8S4ECsfKAW/wxxCmA/YfgLw2Tg5AYUSSNY+Upo3RJotudsvA7u/XZ0RLPSANAI'
-    b'Xvw4WDNtod4L1oGVz4wOkeFqPwJ428j+WXsf3rFLXXOkcezaf0PbduA/iU6pLzsMb98vuqIZ'
-    b'6RBAvXlpW+AqoC06pU5uhtZ3VT9cJFO8uCXYAkb3XtS9AbLIi4eCnUzzfMlbBoV3YF3zokOa'
-    b'SbO8OdLg274KuJjmWfyvhN4OLf4Z5J0T+rb+R/te3AiW6uzrrLGeU8D3ovokzmYwDiq/6HtE'
-    b'r9SJBoB68fa1YPlvgJdGp9TJWbBkZ2zhE9EhMhJLT6J+j5Q9HC8125Uszc965gLbA/+LTqmT'
-    b'dcF/U720WupBA0A9OIW+h/u8MTqlDpzqs7UPwBYti46REfDiTsDH6vgrtgI/rL7PJVOs3AMU'
-    b'gX9Ep9SHbQ5tF+g+FfWhP9B1UTwe2Dm6og6eBd6HlY+ODpER8tkvg8KPqf/5PdtA6aA6/5oy'
-    b'Fqz8L2jpAHqiU+rD5sC9X4uuaAY6CXC0vPgBsPOjM+rgEWDnvm8MkkWOQek3NG4Y1b0BssyL'
-    b'a/R9Vr0nOqUOHNgNK/86OiTLtAMwGj7zdWA/iM6og/9CYXst/lnX/nEauxM1GeykBv760kjW'
-    b'8yxM3aNJLhM04Jy+h6zJCGkHYKS8cwIsLQNbRqeMjj0A/nas/LfoEhkFn7059N4ArDEGL7YL'
-    b'1vO7xr+ONER1p+gU4JPRKXVwI3ixOtzIcGkHYMSWfJfML/7cDZXZWvwzzueMh97zGJPFH8C+'
-    b'W32yoGSS4VA+lOa40+OboKA7BY6QBoCRqB73z/qdqW6rXuPfc3t0iIzWY+9nbB84tTGstccY'
-    b'vp7Um+FY+QiqDxLKOP84XvpQdEUWaQAYLu94PdgPozNGx2+BlrdiC++NLpF6sAlj/5o+fuxf'
-    b'U+rOyicAzfCkvdPxWZtFR2SNBoDh8OkToXIJsFZ0yijcAMzG5v8nOkREEmDlbwGfonpmfVZN'
-    b'gpafV690kFppABiWid8DpkVXjMLNsHwnrOeR6BARSYiVTwM+G50xOj4d7NToiizRAFArL34Q'
-    b'7CPRGaPwT2jZEbvu4egQEUmQlU8CjonOGKX98ZLOT6mRBoBaePv6YKdFZ4zCPcDbte0vIoOq'
-    b'3gX0hOiMUTod3/qV0RFZoAFgKI5B5SxgneiUEboPCm/FyndHh4hIFpS/AJweXTEKL4VxGT9R'
-    b'e2xoABhS8ZDqvacz6X/Q8g6s647oEBHJiOp9Aj4OfnZ0yii8G2/P+qXaDacBYDBeeg3Y8dEZ'
-    b'I/Q4VHbC5t8SHSIiGWM4bHAQcGF0yshVTsGLr42uSJkGgIF4ZyvwM2BSdMoIPAeFnbEFf44O'
-    b'EZGMsrm98PiHwedFp4yMTQT7sR4dPDANAANa8gVgVnTFCDhwANbVFR0iIhlni5dCZVcgq7cL'
-    b'74D7PhMdkSoNAP3xWW8B+0p0xsjYl7Dyz6IrRKRJ2MInoPXdwIPRKSN0LF7cIjoiRRoAVued'
-    b'rVA4CxgXnTJ8fjbW/c3oChFpMnbtnWA7gz8dnTICbWBn61DAi2kAeJElnyabT/m7Bp44JDpC'
-    b'RJqUdd8A7AX0RqeMwNZw/8eiI1KjAWBl3rER2FejM0ZgMbS9t3q8TkSkQaznd8DnojNGxr+B'
-    b'z9wguiIlGgBWUfk+2Tvr/35onYPNeyw6RERywMong30vOmME1oJWPStgJRoAVvDinsC7ojOG'
-    b'aRnYXti1/44OEZE8Gfdp4E/RFcPnu+HF90RXpEIDAIDPnAz2f9EZI3Ao1j0/OkJEcsbmLYfe'
-    b'9wP3RqcMn30fnzEluiIFGgAAaDkemBpdMUznYeUs369bRLLMFj4IhT2AJdEpw7QejP9adEQK'
-    b'NAB4+yzgoOiMYfoL+AHRESKSc9a1EDgsOmMEPo53zIyOiJbvAcApgH+fbP0cHoHW3bGeZ6ND'
-    b'RESqO5H+k+iMYSpA5dTq017zK0sLXwO0f5RsXfNfAftQ9aYcIiKpGH8wcEN0xTBtA6UPRUdE'
-    b'yu8A4O1rAVk7DvRVrPvy6AgRkVXYvOegsifwSHTKMH0Tnz4xOiJKfgcA+CL4K6MjhuFamKrb'
-    b'/IpImmzBXeD7R2cM01SYmNEbG41ePgcA3/ZV4J+OzhiGx6CwT/XxnCIiibKeX4KfHZ0xPPZZ'
-    b'vLRxdEWEfA4A9J4ATIiuqJ0djHXdE10hIjK0pw8FbouuGIY1wL4RHREhfwOAF0vge0RnDMOP'
-    b'sO4LoyNERGpiNz0Nhb2BDD2bxD+Ad3REV4y1fA0ATgHsO5CZSz/uAMvSoQoREbCuRcCx0RnD'
-    b'YFD5TnWNyI9c/ctC8UPA1tEVNVoOhQ9i3U9Gh4iIDN/U44FroyuGYQaU3hcdMZbyMwD4jHEZ'
-    b'e9TvMX132RIRyR6b2wu9e5OtSwOPxTtboyPGSn4GAMbvC7w6uqJGf4W246MjRERGxRbeC3wm'
-    b'OmMYXgfL9o6OGCv5GAB8WhvwheiMGi2Hyn7Vp22JiGSclX8MXBWdUTs/um/NaHr5GABY+0Bg'
-    b'k+iKGn0LW/Dn6AgRkfqpHAj+dHRFjTaByftGR4yF5h8AvHMC+JHRGTX6J/hx0REiInVlC+4C'
-    b'jg6uGAY7Ci+uEV3RaM0/ALD0EGBqdEUNHPxjesqfiDSnDf6P7DwwaH2wpn/kenMPANWHPGTl'
-    b'Ps9nYj1/jI4QEWmI6lUB+wHLolNqY1/AZ6wZXdFIzT0AMPGTwCuiK2pwP7R9PjpCRKShbOFN'
-    b'YCdFZ9TGXwnjPxFd0UjNOwD49IlgWbn85FPYvMeiI0REGq9yLPCv6IoaHdHM5wI07wDApI8C'
-    b'60ZX1OBqrHxxdISIyJionud0RHRGjV4OhY9ERzRKcw4AvmcLcGh0Rg16ofew6AgRkTFl5V8D'
-    b'V0Zn1MY/27emNJ3mHAC4b0/gNdEVNTijekxMRCRvWg4DsnDDs1fDfbtFRzRCkw4AZOFb9WPQ'
-    b'dlR0hIhICJt/C3BmdEaNsnI12bA03wDgpe2BbaIzhubHYPMeiq4QEYnjXwYejq6owdZ4cbvo'
-    b'iHprvgEA+2x0QQ1uhye+Hx0hIhLKeh7Jzt1PM7G2DEtzDQBe3AJ8x+iModmh2OKl0RUiIvHG'
-    b'fxdYHF1Rg3fiHW+Kjqin5hoAKHwGsOiKIfwR674sOkJEJAk2bzkUsvC0Vmu2q7aaZwDwma8A'
-    b'3ys6owZfiQ4QEUmKdf0WfGF0xtBsL7zzpdEV9dI8AwCtHwVSf4bzpVi5JzpCRCQ9loWrosbD'
-    b'sqZ5VHBzDACOgX80OmMIDhwTHSEikiQrXwn8KTpjaH4w3hxrZ1P8S0BxR+C10RWDs19h5euj'
-    b'K0RE0lX4cnRBDV4NpR2iI+qhSQYAOyi6YAgVMH37FxEZjHV1ARl4LLodHF1QD9kfAHz2esC7'
-    b'ojOGcBHWdWN0hIhIBmTgRGnfBS9Oja4YrewPAPQeCIyLrhhEb9/jL0VC4Ae5AAAgAElEQVRE'
-    b'ZChW7gG/PDpjCK1g+0dHjFa2B4DqE5r2i84YnF2ILfh7dIWISHa0ZOGQ6f54Z2t0xGhkewDg'
-    b'/ncBG0ZXDK73pOgCEZFMsa6FwPzojCFsAEt2jo4YjYwPAJ74t3+uxhb8OTpCRCR77MTogqFZ'
-    b'pu8JkN0BwIvrADtFZwwuC29gEZEUdf8WSP3w6U74NutGR4xUdgcACu8j7Tv/3QrdV0RHiIhk'
-    b'kuHgp0RnDKENWnePjhipDA8A/sHogsH5tzEq0RUiItm19jlgD0RXDGHv6ICRyuYA4B0bAe3R'
-    b'GYP4L4w/PzpCRCTT7PIl4D+IzhjCbHzWJtERI5HNAYDeD5J2+6nYvOeiI0REss9PA386umIQ'
-    b'BpaFJ9G+SMqL6CAs5e3/Z2F56hOriEg2WM8jYOdFZwzOMnkYIHsDgM+cDmwRnTGIi7HrHo6O'
-    b'EBFpHoUzoguG8Ma+tSlTsjcA0JL6pHVmdICISFOxrkVA4vdUSX5tepFsDQCOAe+PzhjEbVBO'
-    b'/e5VIiIZZKl/uUp5bepXtgYAZm0JbBxdMYgzq9euiohIfT13QeInA26Ml94cHTEcGRsACu+O'
-    b'LhjEUuDc6AgRkaZkix4HmxudMThLeY16kYwNACT8w/VfYeX/RleIiDQvT/wwgCe8Rr1YdgYA'
-    b'L04FEt5eSf2NKSKScdZTBhZHZwziLfjMDaIjapWdAQDbFbDoiv75nbDg6ugKEZHm52dFFwzC'
-    b'oGWX6IhaZWgASHn7v/Az3fdfRGQstJ4HLI+uGFh2zgPIxgDgnZOAzuiMgflF0QUiIrlg8/8H'
-    b'/Ck6Y2D+Vrx9reiKWmRjAGDJHGB8dMUAbsXKf4uOEBHJkZS/dI0H3zE6ohYZGQAs5WMqF0YH'
-    b'iIjkS9slJH0YIOVD1i9IfwBwDOzt0RkDa0l5EhURaT427yHgj9EZg9ih7861SUt/AKA0DfyV'
-    b'0RX9s5uw+bdEV4iI5E/S516tB7M2jY4YSgYGAN4aHTCwpN+AIiJNbPwlVO/AmijbPrpgKBkY'
-    b'ACzhAaBXA4CISASb9xhwVXTGwFJeu6rSHgCcAvh20RkDuBFb+M/oCBGRHPtFdMAgOqtrWLqS'
-    b'joNZbwbWia4YwKXRASIi+dZyKSR7E7Z1ofim6IjBJD4ApHwMxX4fXSAikmvVmwL9NTpjYCmv'
-    b'YekPAKkeQ3kCnlsQHSEiIlweHTCIVNcwIOUBwDtbgY7ojAFciS1aFh0hIiKVlAeAbfEZ46Ij'
-    b'BpLuAMCyrYDJ0RX90/a/iEgaJiwEHo2uGMBasMZboiMGkvAAUJkVXTAAh4oGABGRFNi85WB/'
-    b'iM4YWGWb6IKBJDwAFLaOLhjATVjPfdERIiKygqd8GCDVtSzlAcBT/aHp27+ISFKWXQ54dMUA'
-    b'tAMwLN65NvDa6Iz+ecJ3nhIRySG7/gEg1ceyv75vTUtOmgMAy7aGJJ+ktBzGL4yOEBGR1Xl3'
-    b'dMEADJ7bKjqiP4kOAJ7qlslfsXlPRUeIiMjqLNUBAGhJck1LdABI9qSJhN9gIiJ51prw53Oa'
-    b'57RpABiWZLeYRETyza69E7g3OmMAM6MD+pPeAOCz1wPWj87oX6UnukBERAZiqX5Gr4cXp0ZH'
-    b'rC69AQBP8mQJ4G5sYarTpYiIUEl4l7YluTsCJjgAVDaPLhhAV3SAiIgMppDwAFDZLLpgdQkO'
-    b'AJ7cD6lPwm8sERGBcX8FUr1SK7m1LcEBwJL7IVUVrosuEBGRQdi85cCfozMGkNzudloDgGMk'
-    b'OCUBy6F1cXSEiIgMxW+KLhjApn1rXDLSGgDYdgNgreiKF/N/YPOei64QEZGh2M3RBQOYDDOT'
-    b'uhIgsQFgWXJbJFWW6kQpIiKrSPnzujWpHe7EBoBCqgNAqhOliIis4smbgUp0Rf/SusotsQEg'
-    b'1SsAKglPlCIi8jy76WngzuiM/hWSWuMSGwCSPAEQaNEAICKSGakeBkjrS25qA8DrowP68Th0'
-    b'/Ts6QkREalVJ9bDtG6IDVpbOAODFNYCXRWf04yYMj44QEZFapboDwMvxzgnRESukMwBQ2QDS'
-    b'ukayym6JLhARkeHwVO/bYrBkg+iIFRIaAAobRRf0z++ILhARkeEYfxekunNb2DC6YIWEBgBL'
-    b'dACwu6ILRERkGKo3bnsgOmMAyax1KQ0AyUxFq/JELycREZFBJPrZ7cmsdQkNAOn8UFbVcld0'
-    b'gYiIDFeyu7fJrHUJDQDpbIu8wJ/G5v8vukJERIYr1d3bdA53pzQAJDMVvcASfQOJiMjgUt0B'
-    b'qGgA6Ecyl0as5K7oABERGYneu6IL+qcdgFX5jCmk+Rjgu6ILRERkJAqp7uBOwmdOjo6AVAYA'
-    b'Jq4TXdC/VLeQRERkcEvuIdmnAloSa14iA0AliR9GPx6MDhARkRGwRcuAR6MzBpDEmpfIAOBJ'
-    b'/DBezB6OLhARkRF7KDqgf/aS6AJIZgBIYxp6MU/0zSPSx0tF4IiAFz4S7+gc+9cVGZZUv8Ql'
-    b'sealMgAkMQ29WCHVN4/knXdOwEvHA/MJeYy2vQoqV+OlH+LTJ47964vUwlP9DNcAsJIkfhgv'
-    b'9myqbx7JM29fH5aWgc8DLYElBhwIk+ZXm0RSY6nu4ibxpTeVASCJH8ZqlsGiJ6IjRFbhszcH'
-    b'LwNbRqesZEvw6/HSm6NDRFaV6nlcOgdgJZUkfhirsoexVB8nKbnkxW2gtwvYODqlH+sD1+Ad'
-    b'M6NDRF5QSXQASGPXO5EBoJDED2NVyR47kjzy0mvAfkOau2UrrA2VS/H2N0SHiFQVEj0EkMaV'
-    b'b4kMAL52dEE/NABIGrzzpcBlwCuiU2qwLvhl+MwstErTS3UHwJJY8xIZAJgQHdCPJ6MDRHAK'
-    b'sPRiQs70H7FXQ8uF1XaRUKmex5XEmpfKH9C26IAX8yXRBSJQPBzYNrpiBLaD0qejIyTvCkuj'
-    b'CwaQxJqnAWBApgFAYnlxU7BjozNG4Rt4+7ToCMmzSqKf45bEmqcBYECe6uQo+XE6sEZ0xCiM'
-    b'h8p3oyMkzyzRz3EfF10AyQwAnuAAoB0ACeTFt4F1RmeMnnXqlsESJ9UdgDS+9CYyAKSxHbIq'
-    b'7QBIJDsquqB+/LjoAsmrVg0Ag0hkACCJ7ZBVpbp1JE3Pi9uRzRP/BuDteEdHdIXk0bJUP8c1'
-    b'AKwkiR/GqnQVgESxD0cX1F9ln+gCyaO2VD/Hk1jzNAAMSDsAEsCntQHvic5ogD37/t1ExtAz'
-    b'iX6Op3HeWyoDQIKHAFgWHSB5NGUOidwnvM5eAlPeHh0hedOW6ACQxnlvqQwAFh3Qj9boAMml'
-    b'd0QHNI7tEF0geVPQ5/ggEhkAkjzensSEJrmzdXRA4/hW0QWSN+PGRxcMIIk1L5EBIMXj7Wls'
-    b'0UiOVI+RT4/OaKC34J36RiZjaFmqn+MaAF6Q4k130jhJQ/Jk8jQg1W8s9bAm9GbpoUaSeS2p'
-    b'/nlK4ktvIgNAijfd0QAgY63wyuiCxqvoMcEyhpalOgAk8aU3kQEgjWloVZbqG0eaVzOe/b+6'
-    b'l0QHSJ5UUv0il8Sal8oAkMQ0tJpU3zjSvPKwOObh31GSkewhgCTWvFQGgCSmoVXpJEAZa5VJ'
-    b'0QWNV1krukDyRDsAg0lkAEjyHIBUJ0dpXs9GBzSePRNdIHlSSPVzXDsAL0jxKgAmRgdI7jwZ'
-    b'HTAGnogOkDwpJPo5nsaX3lQGgCR+GKt5aXSA5M4j0QFjIA//jpKMSqKf42l86U1kAKikuPW5'
-    b'bnSA5I3dHl3QeK3/jC6QXEn1yprnogMgmQEgyW8FiU6O0rym/BPoja5ooOfgFfdER0iuvCw6'
-    b'YAAPRwdAMgOAJfHDWM0EfHqix4+kKdnlS4BbozMa6GZsbjMPOJKeRHdyPYk1TwPAoCYn+uaR'
-    b'5uXXRBc00NXRAZI7ie7kprHmJTIA+EPRBf3r1QAgY6zQxANAUw83kqZEP8M1AKwsiR/GixUS'
-    b'nR6leT15BfBUdEUDPAprz4uOkLzxRAeAShJfehMZAFLdAUj1zSNNy256GvhldEb9+YV95ziI'
-    b'jCFL9EtcIYkvvYkMAGlsh/Qj1TNIpanZj6ML6q/lnOgCyRmnQLLPntAAsJJlie4A2EbRBZJD'
-    b'1n0NcH10Rv34PKxrYXSF5M3M9YFx0RX9601izUtkAKg8DHh0xYv5JtEFklf+jeiCOjouOkDy'
-    b'qPVV0QUDcGhL4t43aQwAtmgZad4HPdU3kDS9nl+DdUdX1MEVWM8foyMkj5L9Avc4Nm95dASk'
-    b'MgBUJbElsppNogMkpwwHPxhYFp0yCkvADo2OkLxKdgBI4vg/pDUA3Bsd0I918ZmToyMkp6z8'
-    b'N7CTojNGzo7Fum+LrpC8skR3cP3f0QUrJDQA2F3RBQPYJDpA8mzcVzJ6KOAaWP+E6AjJM090'
-    b'ALA7owtWSGgA8GR+KKtq3SS6QHLM5i0H+yDw3+iUYbgXej+g+/5LLNskOGAA6XzZTWgA4K7o'
-    b'gP5VEp0iJTes6x7ofTvwWHRKDR6H3ndhCx+MDpEc885WYIPojP6l82U3oQEgnR/KqlI9jiS5'
-    b'YgtvAt8DeCY6ZRBPgL+z2ioSqbIh0Bpd0T/tAPQjnR/KajaLDhABqF5O528lzStmHoTKW7Ge'
-    b'cnSICCzfPLpgYMuT+bKb0AAw9V7SvORpi+gAkedZz3XQsh3wj+iUldwMhRK24M/RISJVNj26'
-    b'YABLYeH90RErpDMA2Nxe8BQvBVwPL708OkLkeTb/FrCtwM6PTgHOhSWzsK47okNEXuCpfnG7'
-    b'B6MSHbFCOgMAkNLlEatK9s0keWXdT2Lde4O9H7hv7AP8TvBdsPKHsUUpn5cg+ZTqDkBSa1xi'
-    b'A0CqVwIUUn0zSd5Z90VgmwEnAE+NwSs+BvZVYBrW87sxeD2R4fE544HXR2cMQAPAIJL64bxA'
-    b'OwCSMOt+EisfCcs3AT8W+E8DXuXfYF+E3o2x7mOxnmcb8BoidfDkpiT7FMC0TnZP7DIJvw0s'
-    b'OqI/GgAkfXbdw8BX8T2PhXvfXr2BkL0d/JUj/BXvBb+ieq5BeV5Kxy5FBlZJeMe2cmt0wcoS'
-    b'GwAKNyX5VGCYhu/ZojubSSZU36e/7/sLfPbm0NsOvKHvr/WBtYG1qP6Bewp4lOrzOG4DboVC'
-    b'N9aV0pUGIjXyLRL9IglYUvfISGwAWP92uO9ZYI3oktWsAfe+DkhqehOpic2/BbglOkNkbBS2'
-    b'SPOLpD8NPUkd5k7rHIDqN5fF0Rn9s62jC0REZBCOgW8VnTGAv6V2GC2tAaAqqS2SF1h7dIGI'
-    b'iAxm1qbAS6Mr+pfW9j8kOQD4zdEF/XMNACIiSWtJ+XM6ubUtwQEgvSmpzzS8uE50hIiIDCTl'
-    b'L2qe3NqW4ADQltwPqY9BYWZ0hIiIDCjhAaD3b9EFq0tvALB5D9GYG5nUQcrTpYhIjvnslwGv'
-    b'jc4YwH199+lISnoDQFWiuwAaAERE0rS8g2RvAJDe9j8kOwBYcidLVNk2+IxEbzEpIpJnhVJ0'
-    b'wcDSXNMSHQC4PjpgAGtC25bRESIisrqUd2j9huiC/qQ6AHRFBwxi++gAERFZic+cDKR6AyCg'
-    b'Nck1Lc0BwLrvB+6OzuifzYkuEBGRlbW8nWSfAMgd2PwkT2xPcwAAwLqjCwZQwmdMiY4QEZHn'
-    b'7RQdMIhU17KUBwBP9YfWChPeFh0hIiLPe0d0wMCSXctSHgAKyf7QwHUYQEQkBV7cAtgoOmNg'
-    b'ye5mpzwAdN0MPB5dMYCdqk+dEhGRWEmfl/UYlJN9FHe6A0D1sYkLozMGsAGUpkVHiIhI0sf/'
-    b'y6k9Anhl6Q4AQMpbJ4lPnSIizc87JwEp3wAo4TUs+QGgkvAPT+cBiIjEWrIDMD66YmBWji4Y'
-    b'TOIDwPiFwPLoigHMxksvj44QEckv2z26YBDL4NnroiMGk/YAYPOeAhZEZwygFUj5zSci0ry8'
-    b'cwLw7uiMgXk3tuiZ6IrBpD0AAGCXRxcMzN8XXSAikk9L5gCToysGlvLaVZWBAaCS8A/RtsXb'
-    b'14+uEBHJH3t/dMHgen8fXTCUDAwAPX8FkryPMtWf33ujI0REcsVnrAm8KzpjEP+BhUk+Anhl'
-    b'6Q8AhoNfGZ0xMB0GEBEZWxN2BiZFVwzML6uuXWlLfwAAoJDwYQA68I6Eb0MpItJsUv/iZclv'
-    b'/0NmBgC7knQvBzTo1WEAEZGx4NMngqd897/l0PaH6IhaZGMAsK5HgYSvp7QPRheIiOTDpN3A'
-    b'JkZXDKIHm/dYdEQtsjEAAOApb6lsjZfeHB0hIpIDB0QHDC4b2/+QqQEg6fMAAN8vukBEpKl5'
-    b'x+uB2dEZg0v50vVVZWgA6P4zcH90xcDsQ3hxjegKEZHm1bs/JP0o9vv6Ll3PhOwMANVHKv4i'
-    b'OmMQa4PtER0hItKUfFob2EeiMwbnF2Xh8r8VsjMAAFC5KLpgCIkfmxIRyaop7wYSfwBbIfU1'
-    b'ahUZGwAWlIG7oysGMRufvXl0hIhIE0r9C9a/oXthdMRwZGsAqG6tXBydMbjej0YXiIg0lerN'
-    b'1t4WnTE4/3mWtv8hawMAkIEtlg/jc8ZHR4iINI/KAUBLdMXgbG50wXBlbwCwroXAv6IzBvEy'
-    b'eGzv6AgRkabgnRNIf/v/DijfEB0xXNkbAKoSPwxgn8Uz+7MVEUnIsv8HvCK6YnB+Yda2/yGz'
-    b'A0DyhwE2hfaU71UtIpI+x8A/FZ0xNEt9TepXNgcA61oE3B6dMTg/IrpARCTbirsCm0VXDOEf'
-    b'WDkzN/9ZWTYHgKrUJ67t8eKW0REiItllh0cX1CD1tWhAWR4AfgSpH3Mx7QKIiIyEl7Ym+fv+'
-    b'4+A/iY4YqewOAFb+FzAvOmMI7++7flVERIbnc9EBNbga60n8cPTAsjsAAOBnRhcMoRUqGTiB'
-    b'RUQkId7xamC36IwanBUdMBoZHwCeuBj4X3TF4PxgvJT4/atFRFLS+0WSv/EPD8OUX0ZHjEa2'
-    b'BwBbvBTsvOiMwdlEsM9GV4iIZIKXXgP24eiMoflPscuXRFeMRrYHAAAqPyT5kwH9E3hxanSF'
-    b'iEgGfBUYFx0xtMLZ0QWjlf0BwHpuBXqiM4YwASwLJ7SIiMTxjtcDH4jOGJp1Y92LoytGK/sD'
-    b'QFXqJwMCHIRvu2F0hIhIunq/BrRGVwzNM33y3wpNMgD4hcBj0RVDGA+9X4qOEBFJkpfeCLZH'
-    b'dEYNHoenMvfkv/40xwBgPc8C50dnDM0/im/7qugKEZH02LFkY006H7vp6eiIesjCD7tGfhpQ'
-    b'ia4YwjhYflR0hIhIUrxjBvh7ojNq4FA5LTqiXppnALCeW8Evjc6owYerb3YREamqfBOw6Iqh'
-    b'+e+wBX+PrqiX5hkAqk6KDqhBASrfjo4QEUmCl3YH3h6dUaMsrDE1y8DENUxeXAA2MzpjaLY7'
-    b'1n1JdIWISBif1gZTFgOvjU6pwQ1YeevoiHpqth0AwL4TXVCbyol454ToChGROGsfQTYWf8BO'
-    b'jC6otyYcAKbOBe6IrhiavQqWfDq6QkQkhM98BfiR0Rk1ugvGXRwdUW/NNwDY3N6+KwIywL6E'
-    b'z14vukJEZOy1HA9Mjq6ojX8Hm7c8uqLemm8AAPru0Zz6jYEAJkHv16MjRETGlM96C5CBB/4A'
-    b'8CiMz/x9//vTnAOAdT8JnBGdUaOP4O1bRUeIiIwJx6DlVLKz/pyBzXsqOqIRsvIbMAJ+KpCF'
-    b'RzUWwM/AOzNw/2sRkdEqHQDeHl1RoyVgp0ZHNErzDgDWcx+QlW2bLWHp4dERIiINVT3n6fjo'
-    b'jNr5mVj3/dEVjdK8AwAALccBz0ZX1OhovJiRy2FEREai8j3gJdEVNXqOTA0rw9fcA4DN/w/4'
-    b'D6IzarQG2FnV42MiIk3GS7uD7xadMQzf79tJblrNv9h450th6R3AWtEptbH9se6sHLoQERma'
-    b'z5gC4xcDU6NTauNPQ+U12MIHo0saqbl3AABs3kPA96Mzaucn4cWM/CEREanF+G+TmcUfoHBa'
-    b'sy/+kIcBAIDl3waeiK6o0RQo/F90hIhIXXhxO2D/6IxheAoKJ0dHjIV8DAB23cPgGXlGAIDv'
-    b'iRf3jK4QERkV75wEdhaZOtzsJ2Pz/xddMRbyMQAAsPRk4JHoitrZGXjHRtEVIiIjt/RUMvOw'
-    b'HwAeg5YMfVkcnfwMALbocSBLW+trQ+Vn+J4t0SEiIsPm7e8F9o3OGB77Ntb1aHTFWMnPAABA'
-    b'23fAHoiuGIbZcN9noiNERIbFt90Q/KzojOGxB2Bc0971rz/5GgBs3lPgX4zOGKav4cVtoiNE'
-    b'RGriFGD5OWTnhj99/AvNes//gWToxIw6cQpQWgBsHZ0yDLdD25Z5e3OKSAZ58Uiwb0ZnDNNf'
-    b'oLwVRiU6ZCzlawcA6PsNPhTw6JRheC0sOzE6QkRkUD7rLWDHRGcMk4MdmrfFH/I4AABYuQe4'
-    b'MDpjePyg6q00RUQS5O1rQeECoC06ZZguxLrnR0dEyOcAAEDvZ6u3e8yUc/DZm0dHiIiswjHw'
-    b'HwGvj04ZpmeBI6MjouR3ALCF9wInRWcM0yTovQSfOTk6RETkBcXPA3tEV4zAt7Dy3dERUfI7'
-    b'AFQdD9wTHTFMb4CWn+qpgSKSBC++Dey46IwRuBee+nZ0RKR8DwDW8yxY1i4LBNgV2nV/ABGJ'
-    b'5R0bgV0AZPCGZf457KasHQauK32LdAxKXUApOmWYlgM7YuWro0NEJIe8cwIsnQ9sFZ0yfNYN'
-    b'3bOxTF0NVnf53gEAqm8A3w9YEp0yTK3AXHzbV0WHiEgeLfkumVz8WQoclPfFHzQAVFnPreAn'
-    b'RGeMwDqw/EJ8xprRISKSI95+MNh+0Rkj48dj3YujK1KgQwAr+LQ2mPwXsCxeZvc7mPoebG5v'
-    b'dIiINDkv7gT2W6q7kFlzG7S9GZv3XHRICrQDsIItXgqF/SCTd4PaGe77VnSEiDQ5b58G9nOy'
-    b'ufhXoLC/Fv8XaABYmXUvAH4QnTFCh+OlT0ZHiEiT8vb1wS8HpkSnjIydjnV1RVekRIcAVucz'
-    b'J0PL34ANo1NGoBfYHSv/OjpERJqIt68Ffi3w5uiUEbof2qZh8x6LDkmJdgBWZwufADs4OmOE'
-    b'WoDz9fhgEakb37MFKueR3cUf4BAt/i+mAaA/1n0Z+EXRGSO0Jtiv8NLG0SEi0gzuPwVsl+iK'
-    b'kfOLtCvaPw0AA6p8Cng4umKE1gO/DO98aXSIiGSYtx8F/vHojFF4BJYfGh2RKg0AA7GFD4If'
-    b'EJ0xcrY5LP0DXlwnukREMshLnwI/JjpjdOwQ7PoHoitSpQFgMNbzS/CzozNG4U1gl1ZP4BER'
-    b'qZGX9gW+E50xOn421n1hdEXKNAAM6elDgduiK0ZhFviv8OIa0SEikgFe2gM4k2xfJfYvKBwW'
-    b'HZE6DQBDsZuehsLeVO8fnVXbV08MnDM+OkREEualXYGMPt3vecuhsDfW/WR0SOo0ANTCuhaB'
-    b'ZfxYGO+AJy7AO7N4By8RaTSftQOQ1bv8rcS+inUtjK7IAg0ANVv/BODa6IrR8d1g6Y+q1/WK'
-    b'iPTxjk4o/BqYEJ0yStf2fVZLDbJ8jGfs+cwNoOVGIONn1vtFsPRD2KJl0SUiEqz6cJ9LgKyf'
-    b'J/QY8GasfHd0SFZoB2A4bOG9wIHRGaNn74Pxv9SJgSI55x27gP2S7C/+gB+ixX94NAAMl5Uv'
-    b'Bn4cnVEH74LCb/DpE6NDRCSAlz4ElUvI/rY/wI+xnguiI7JGA8CItB0C3BBdMXq+A0y6RjcL'
-    b'EskZLx0I/ITMn/AHwI2w5BPREVmkcwBGyjs2gsoioBlut/tnaNsRm/dQdIiINJi3fwL8VJrj'
-    b'8/9RKGyFdd0RHZJF2gEYKeu6B/xDQCU6pQ7eAkuvwWevFx0iIg3kpaPBT6M5Fv8K+Ae0+I+c'
-    b'BoDRsJ4rgKOiM+rkjdB7PV7K8iM/RaQ/3tmKF08HvhqdUkdH9X0Gywg1wxQYyzEozQV2j06p'
-    b'k6fA3od1Xx4dIiJ14J2TYMlFYHOiU+rHfws978GaYgc2jHYARstwsH2Bv0en1Mkk8N/g7QdH'
-    b'h4jIKHlxKiyd31yLP/+E8R/W4j962gGoFy9uCrYQmBydUkenQvkw/UETySCfOR1aLgU2iE6p'
-    b'H38abBZW/lt0STPQDkC9WM+tYAcCHp1SR5+C9nP1ECGRjPHiztDSTVMt/jjY/lr860cDQD1V'
-    b'nz19bHRGffkH4fEr8dkviy4RkRp46VNgvwImRafUl38NK/88uqKZ6BBAvTkGxR+DfSQ6pc7u'
-    b'A9sD614QHSIi/fDOCbD0e8BHo1Ma4OdQ/mD1nCupF+0A1JvhsPQA4I/RKXU2FXweXjw0OkRE'
-    b'VuMdG8HSa2nOxf9amPL/tPjXn3YAGsVnToaWLmCL6JQGOBf8IKzn2egQkdzz9jngPyPzTynt'
-    b'161QKGFdj0aHNCPtADSKLXwCKu8GHoxOaYB9wLrxbV8VHSKSW47hpc+D/47mXPwfAt9Fi3/j'
-    b'aAeg0bxjBvT+CawZn7r3MPBBrHxldIhIrvjMydB6Dvhu0SkN8izwNqzcEx3SzLQD0GjWtQho'
-    b'lmcGrG5d4DK8/Vi8sxmeKiaSPi+WoPDXJl78K+B7a/FvPO0AjBUvfhrs/6IzGscXgu2Nlf8V'
-    b'XSLSlLyzFZZ+GfgSzfEY3wHY4Vh3E39WpkMDwFjy0teBL0ZnNNAz4F/Eek6JDhFpKl7aGDgX'
-    b'mB2d0lj+f1jP4dEVeaEBYKx5+7fBPxOd0Vh+CfQeiF33cHSJSOZ5cU+wM4C1o1May76HdX8i'
-    b'uiJPNACMterTA38AHBid0lj2AFT2xXp+H10ikknVS4m/R/UcoibnP4Gej+q5I2NLJwGONcNh'
-    b'6iHABdEpjeWvBLsUL56MT2/GKyBEGsfb50DLzeRi8edC2GA/Lf5jTzsAUXzPFrj/AvA9o1PG'
-    b'wF3gB2M9V0SHiCTNO14CleNp+h3C510BU3bFLl8SHZJHGgAi+bQ2mPyrJntW9yBsLhQ+js3/'
-    b'X3SJSHKqx/q/B+TlwVtXQ9u7sHnPRYfklQaAaD5jTRh/GbBddMoYeRQ4EiufER0ikgSftQkU'
-    b'fgDsGJ0yhhZA29uxeU9Fh+SZBoAUVE/2uQrYJjplDF0GhY9hXf2n0HAAAArxSURBVPdEh4iE'
-    b'8D1b4N5PAsc16Z1CB3IDLNkBW/R4dEjeaQBIhXdOgqW/BraPThlDzwDfBj9BDxaSXPGOmdB7'
-    b'CtjM6JQxdj34TljPI9EhogEgLdXDAZeQr61AgHvBvwQ95+qRn9LUfOYG0PINqmf35+zz1+dB'
-    b'4d1Y95PRJVKVszdgBlRPDLwA7L3RKWPPF0Lh01j3gugSkbqqDvefAz4HrBGdE+BS8D2105cW'
-    b'DQApqh4bPBvsI9EpASrAebDsc9j1D0THiIyKY1DcA+xEYKPonCAXwpJ9sEXLokNkVRoAUlUd'
-    b'An4Itl90SpAnwL8JT5+G3fR0dIzIsHlHJ1ROIF8n967uRzD1QGxub3SIvJgGgJRVvz2cBHZY'
-    b'dEqgh4ATwU/V9qFkgrfPqp7Tws7RKcFOh/IndIe/dGkAyAIvfR44Pjoj2H+Bk6HtFN04RJLk'
-    b'M6dD65dzcnfPoZyAlY+MjpDBaQDICi9+Guwk9PyGu8GOg+d+omOKkgTveBNUjgHejT5TK+BH'
-    b'YD3fiQ6RoeX9zZotXnwP2HnAmtEpCfgXcBw8fj62eGl0jOSQd7yputXve6DPUoBnwD+E9fwy'
-    b'OkRqozdt1nhpa+C3wCuiUxLxIPCDvnMEdHMRaTzv6IDK54F3oc/QFR6Gyq7Ygu7okP/f3r3H'
-    b'yFXWYRz//s5stxd7o1tCWihsuUovlFBN3Z0BFmnCxTZIoZIANWAqXkgpBu/xDzSCqYqERkEu'
-    b'amOxipVq0kv6h8YNzM62YrGlKCKr3QBlMWwplC2w2535+ccZLIK9bHd33jlnnk+yOWem283T'
-    b'7ZzzPnPOmfPK0dOLN4n8I41gG8FmhI5SRXqANRDdheX/ETqMpEx8f44rwL4EfDh0nCrTAcXL'
-    b'sa3PhQ4iA6MCkFTeMhH61gEXhY5SZUrAJuBOrNAeOowknM8bD9GNYLcB00LHqT7WBiM+jrV2'
-    b'h04iA6cCkGQ+sx4mPgj+ydBRqtRj4PfDyHX65IAMSHx+/9PlbWtc6DhVajW8vlTX4CSXCkAa'
-    b'eNNysLvR/+ehvA48AtyHFbaHDiNVyrPjoHQlREvA54eOU+VWQuFWzd2RbBow0sKz14A/BIwN'
-    b'HaXKtce/p/2P6A6DApRv3FNaCnYN2n6OwPeDLcUKvwqdRAZPBSBNvHkW8ChwZugoCbAP7JdQ'
-    b'XA1bCnonU2P8/CnQ/4nyrbZnh46TEM8Bi7DC06GDyNBQAUgbz44D/xlwVegoCfIisA6itZBv'
-    b'UxlIKW+aBCwAWwxcCtQFTpQkG6H+eqz1tdBBZOioAKSRY9D8ZeAOIBM6TsI8D/xOZSAlPHcc'
-    b'FBeWB/1LgBGhIyWMA9+Fwtd1T//0UQFIM2+6BGwNMCl0lITqAF8LvhGmbdGMZgnh806CzGXg'
-    b'V4LNR4P+sXoV/DqsfXPoIDI8VADSzi+YBv2PopuXDFYP0Aqsh+ImbOuLgfPIO3xxBrrOhdJC'
-    b'4hn4zkP7tsHaDtFVWP5foYPI8NFGUgu8aTTYvcANoaOkhAPbwTeDbYb6AtbaHzpUTfHmU8Au'
-    b'A78UuBhdvT+UVoF/XtNvp58KQC3x5quB+9EpgSHm+yHaDp6HqA3IY/m9oVOliudOhWIOLAue'
-    b'Azsb7b+G2j7gZqzwcOggUhnagGqN506G0s+BC0NHSbEi+LNgefA2yOR1KHUAfO4IGH1OPOBH'
-    b'WfCPAg2hY6XcFoiu0+u0tqgA1CJfnIGXvgJ+O7pAqlJ2gz8F9lS8ZCf0/R3bdiB0sKD8/ClQ'
-    b'nA02B3w28WfyZ6LXZaUcALsdpq7QRa61RwWglsVTC/8COCN0lBrVBzwD7Iy/bCeUdsHIztTN'
-    b'XeDZqVBqhOjsdw305wCTwwaraR3lq/z/FDqIhKECUOu8ZSz03Q0sDR1F/kcXsKv81QnWGZcD'
-    b'64Sel6vqNsbeUgdvNUB0CkSN4I3g08vr04FTgFFBM8p7/RTql2OtPaGDSDgqABLz7CLwB9C5'
-    b'1qR4G9gDtgd8D1g3eHf8nO8BexO8fCFi1AvFN+P1ujeAfigVIdoH/SOhbkz5Z46D/jqwDDC+'
-    b'/NxoiMaAN4BNjpc0lB83AMcDEyr2r5bBehX4DFb4TeggEp4KgBzk806AzPeAJaGjiMiQ2wD+'
-    b'Wax9d+ggUh1UAOT9PHs5+H3AyaGjiMigdQHLsMKjoYNIdYlCB5AqZG2boPdsYAWgK4NFksmB'
-    b'1eCzNPjL/6MjAHJ43tQMPAg2I3QUETlqHWA3YW1/DB1EqpeOAMjhWXsB+s4Fvgr0ho4jIod1'
-    b'AFgBE2Zp8Jcj0REAOXqenVn+pEBz6Cgi8j4F4iv8nw4dRJJBBUAGznMLobQSaAwdRUR4Cfgm'
-    b'FB7CKIUOI8mhAiDHxueOgZHLgG+gmdhEQngLWAl2B9b2RugwkjwqADI43nQi2HeA69HrSaRS'
-    b'NkDdLdhju0IHkeTSDluGRjyvwD1AU+goIin2JNitWNvjoYNI8qkAyNBxDJquBrsLmBY6jkiK'
-    b'dIN/G076oWbtk6GiAiBDL55gaDlwG3Bc6DgiCbYX+AHYPTrPL0NNBUCGT1wEbia+h8DE0HFE'
-    b'EqQH+BFEK7D83tBhJJ1UAGT4edMksFuAL3BwljkReR/fD/YTKN6Jbf136DSSbioAUjneMhn6'
-    b'vggsA8Yc6dtFakgfsAoyt2OPd4UOI7VBBUAqz88/Hoq3AcuBUaHjiARUHvj9W5qmVypNBUDC'
-    b'8XknQOZzxEcEJoWOI1JB+4BVUPd97LEXQoeR2qQCIOHFFwteS/ypgTNDxxEZRp3Aj6H+fqz1'
-    b'tdBhpLapAEj1cCLIfQxKX0M3FJJ02Q5+N4xcg7X2hw4jAioAUq08lwO/BXwRkAkdR+QYONgf'
-    b'wFZi+fWhw4i8lwqAVDdv+iDYMuA6YELoOCJHYR/4GvCV2JZnQocRORQVAEkGbxkFvQshugn8'
-    b'YvTaleqzDXgA6tdgrT2hw4gciXaikjyePQv8RuBTwPGh40hNew34NUT3YvkdocOIDIQKgCSX'
-    b'z6yH8VfoqIAEUH633/swtu3N0GFEjoV2mJIO3nQ62A3ANcDpgdNIOnUAj4Cvwto7QocRGSwV'
-    b'AEkfz84EXwxcC5wROo4k2gvAbyFaC/k2DA8dSGSoqABIuh0sA9cDp4WOI4nwIrBOg76knQqA'
-    b'1I64DCwBlgBTQ8eRqtJNPOivhnwBoxQ6kMhwUwGQ2hSXgQVg88EvBEaEjiQVVQS2A7+HaIMG'
-    b'falFKgAi3jIW+i+C0gLgMmBa6EgyLF4Ba4XSBsisx/J7QwcSCUkFQOS9PHcqFBdCtAD8AqA+'
-    b'dCQ5Ju+8y98A0XrIP6nz+SIHqQCIHI7PHQOjz4NSFsgBzWjq4mrVA7YDPA9RG9Q9rhn3RA5N'
-    b'BUBkoOIjBDmwLHgObEboSDWqCywPpTbI5CH/F53HFzl6KgAig+XZqUAOSh8CmwPMBqYETpU2'
-    b'XcBO8B0Q/RlKbVj77tChRJJMBUBkOHjLROifBaUZwEywuVA6F+wDoaNVuT7wDrBtwF8h+hv0'
-    b'PoE98XLoYCJpowIgUilOBPNOg8wc4CygEZheXp5M7XwU8QDwPNAJ7Covn4XiDtj6Tx3GF6kM'
-    b'FQCRauCLM9B1IpQawaaDTwcvr3Mi8ayH44NmPHr7gFeA3eC7wDrBdsXrUSdM2Y2tLYaNKCIq'
-    b'ACJJ4XNHwJjJUGwAb4CoAXwy2OT48X+XI8EjYEL5L44GG1X+KROJt/sRwNjycz3E78qdeHpb'
-    b'wN8Ge6v856+DlcB7wfaAd79r2Q2lPfHjA/G6bTtQiV+HiAzOfwCkfAbcT4aihwAAAABJRU5E'
-    b'rkJggg==')
+# Icon files for timer statuses
+ICON_FILES = {PomodoroTimer.TIMER_STATUS['T_STOP']: 'stop.png',
+              PomodoroTimer.TIMER_STATUS['T_PAUSE']: 'pause.png',
+              PomodoroTimer.TIMER_STATUS['T_RUN']: 'run.png'}
 
 
 class TimerTaskBarIcon(wx.adv.TaskBarIcon):
@@ -1125,41 +49,79 @@ class TimerTaskBarIcon(wx.adv.TaskBarIcon):
     TBMENU_TIMER_PAUSE = wx.NewId()
     TBMENU_TIMER_STOP = wx.NewId()
     TBMENU_CLOSE = wx.NewId()
+    ICON_SIZE = 32  # Fallback size when system doesn't report one
 
     def __init__(self, frame):
         super(TimerTaskBarIcon, self).__init__()
 
         self.frame = frame
-        self.stop_icon = wx.Icon(STOP_ICON.GetIcon())
-        self.pause_icon = wx.Icon(PAUSE_ICON.GetIcon())
-        self.run_icon = wx.Icon(RUN_ICON.GetIcon())
+        self.status = None  # Status that is shown now
+        self.icon_size = self._get_icon_size()
+        self.icons = {}  # Icons loaded on first use, keyed by timer status
+        self.plugin_ids = {}  # Menu item ids of plugins, keyed by label
 
         # Stop status by default
-        self.SetIcon(self.stop_icon)
+        self.set_status(PomodoroTimer.TIMER_STATUS['T_STOP'])
 
         self.Bind(wx.adv.EVT_TASKBAR_LEFT_DOWN, self.OnTaskBarLeftClick)
         self.Bind(wx.EVT_MENU, self.OnTaskBarClose, id=self.TBMENU_CLOSE)
 
+    def _get_icon_size(self):
+        """Returns the icon size requested by system"""
+        size = wx.SystemSettings.GetMetric(wx.SYS_ICON_X)
+        return size if size > 0 else self.ICON_SIZE
+
+    def _get_icon(self, status):
+        """Returns wx.Icon for timer status, loading it on first use
+
+        :type status: PomodoroTimer.TIMER_STATUS
+        """
+        icon = self.icons.get(status)
+        if icon is None:
+            img = wx.Image(os.path.join(ICONS_DIR, ICON_FILES[status]), wx.BITMAP_TYPE_PNG)
+            if img.GetWidth() != self.icon_size:
+                img = img.Scale(self.icon_size, self.icon_size, wx.IMAGE_QUALITY_HIGH)
+            icon = wx.Icon()
+            icon.CopyFromBitmap(wx.Bitmap(img))
+            self.icons[status] = icon
+        return icon
+
     def set_status(self, status):
         """Set icon for current timer status: Running/Paused/Stopped
 
+        Icon is uploaded to the tray only when status has changed.
+
         :type status: PomodoroTimer.TIMER_STATUS
         """
-        if status == PomodoroTimer.TIMER_STATUS['T_RUN']:
-            self.SetIcon(self.run_icon)
-        elif status == PomodoroTimer.TIMER_STATUS['T_PAUSE']:
-            self.SetIcon(self.pause_icon)
-        else:  # Stopped or finished
-            self.SetIcon(self.stop_icon)
+        if status not in ICON_FILES:  # Finished
+            status = PomodoroTimer.TIMER_STATUS['T_STOP']
+        if status == self.status:
+            return
+        self.status = status
+        self.SetIcon(self._get_icon(status))
 
     def CreatePopupMenu(self, event=None):
         """Popup menu for EVT_RIGHT_DOWN event"""
         menu = wx.Menu()
 
+        plugins = self.frame.controller.plugins
+        if plugins and plugins.menu:
+            for label, hook in plugins.menu:
+                menu.Append(self._get_plugin_id(label, hook), label)
+            menu.AppendSeparator()
+
         menu.Append(self.TBMENU_CLOSE, 'Exit')
 
         return menu
 
+    def _get_plugin_id(self, label, hook):
+        """Returns menu item id for plugin, binding it on first use"""
+        item_id = self.plugin_ids.get(label)
+        if item_id is None:
+            item_id = self.plugin_ids[label] = wx.NewId()
+            self.Bind(wx.EVT_MENU, lambda event: hook(self.frame), id=item_id)
+        return item_id
+
     def OnTaskBarLeftClick(self, event):
         """Toggle iconized mode for parent frame"""
         self.frame.Show()
@@ -25,74 +25,78 @@ OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
 import wx
-import wx.adv
-import datetime
+
+from Engine import MS, TIMER_STATUS, TickStats
 
 
 class PomodoroTimer(wx.Timer):
-    """Timer that includes desktop notifications on expire
+    """wx.Timer adapter that drives PomodoroCycle from the wx main loop
+
+    All timing logic lives in Engine module, this class only schedules ticks.
+    Instead of polling with a fixed period the timer is armed as one-shot for
+    the moment when something observable changes: the next displayed second
+    (or minute when only tray icon is visible) or the end of phase.
     """
 
     # Timer status with UI name representation
-    TIMER_STATUS = {'T_STOP': 'Stopped',
-                    'T_RUN': 'Running',
-                    'T_PAUSE': 'Paused',
-                    'T_FINISH': 'Stopped'}
-    TIMER_TICK = 1000  # Default tick interval == 1 second
+    TIMER_STATUS = TIMER_STATUS
+    TIMER_TICK = 1000  # Default display granularity == 1 second
+    TIMER_TICK_HIDDEN = 60000  # Granularity when the frame is hidden == 1 minute
+    TIMER_SLACK = 5  # Wake up a bit after deadline to be sure it has passed (ms)
 
-    def __init__(self, dur, parent, id):
+    def __init__(self, cycle, parent, id, stats=None):
         """
-        :param dur: Duration of timer (seconds)
+        :param cycle: Engine.PomodoroCycle object
+        :param stats: Engine.TickStats to fill, a new one if None
         """
         super(PomodoroTimer, self).__init__(parent, id)
 
         self.frame = parent
-        self.dur = dur
-        self.t_remain = self.t_start = self.t_stop = self.t_tick = datetime.timedelta()
-        self.status = self.TIMER_STATUS['T_STOP']
+        self.cycle = cycle
+        self.granularity = self.TIMER_TICK
+        self.stats = stats or TickStats()
+        self.expected = None  # Planned time of the next wakeup (cycle clock)
 
     def Notify(self):
-        self.t_remain = self.t_remain - (datetime.datetime.now() - self.t_tick)
-        self.t_tick = datetime.datetime.now()
-        if self.t_remain.total_seconds() <= 0:  # Finish current cycle
-            self.finish()
-
-        super(PomodoroTimer, self).Notify()
-
-    def start(self):
-        """Runs the timer"""
-        if self.status == self.TIMER_STATUS['T_STOP']:
-            self.t_start = datetime.datetime.now()
-            self.t_tick = self.t_start
-            self.t_stop = self.t_start + datetime.timedelta(seconds=self.dur)
-            self.t_remain = self.t_stop - self.t_start
-        else:  # Timer already has been installed and was paused
-            pass
-        self.status = self.TIMER_STATUS['T_RUN']
-        self.Start(self.TIMER_TICK)
-
-    def stop(self):
-        """Breaks existing timing data and stops the timer"""
-        self.status = self.TIMER_STATUS['T_STOP']
-        self.Stop()
-        self.t_remain = self.t_start = self.t_stop = self.t_tick = datetime.timedelta()
-
-    def pause(self):
-        """Pause the timer"""
-        self.status = self.TIMER_STATUS['T_PAUSE']
-        self.Stop()
-
-    def finish(self):
-        """Represent 'Finish' state: timer expires successfully"""
-        self.status = self.TIMER_STATUS['T_FINISH']
-        self.Stop()
-        self.t_remain = self.t_start = self.t_stop = self.t_tick = datetime.timedelta()
+        self.stats.tick(self.expected, self.cycle.clock())
+        super(PomodoroTimer, self).Notify()  # The frame ticks the cycle
+        if self.cycle.get_status() == self.TIMER_STATUS['T_RUN']:
+            self._schedule()
+
+    def _schedule(self):
+        """Arm one-shot wakeup at the next observable change"""
+        self._arm(self.cycle.next_change(self.granularity * MS) // MS)
+
+    def _arm(self, delay):
+        """Arm one-shot wakeup after delay (ms) and slack"""
+        delay += self.TIMER_SLACK
+        self.expected = self.cycle.clock() + delay * MS
+        self.StartOnce(delay)
+
+    def set_granularity(self, granularity):
+        """Change display granularity and reschedule the running timer
+
+        :param granularity: Interval in milliseconds, e.g. TIMER_TICK
+        """
+        self.granularity = granularity
+        self.update()
+
+    def update(self):
+        """Rearm the timer after the cycle has been changed by a command
+
+        The running cycle is ticked right away by the frame, so the next
+        wakeup is scheduled from the actual remain time. The cycle isn't
+        ticked here: a phase finished outside of the frame would be missed.
+        """
+        if self.cycle.get_status() == self.TIMER_STATUS['T_RUN']:
+            self._arm(0)
+        else:
+            self.Stop()
 
     def get_remain(self):
-        """Returns remain time in timedelta"""
-        return self.t_remain
+        """Returns remain time in nanoseconds"""
+        return self.cycle.get_remain()
 
     def get_status(self):
         """Returns a current status of timer"""
-        return self.status
-
+        return self.cycle.get_status()
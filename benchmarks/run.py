@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+wxPomodoro - Simple pomodoro timer based on wxPython Phoenix GUI
+
+The MIT License (MIT)
+Copyright (C) 2017 Georgy Komarov <jubnzv@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+# Benchmark suite: tick path, Refresh, queue construction, notification
+# dispatch and startup.
+#
+# Usage:
+#     python benchmarks/run.py [--only NAME ...] [--output FILE] [--compare FILE]
+#
+# GUI benchmarks need a display, use `xvfb-run python benchmarks/run.py` on
+# headless machines. Benchmarks whose dependencies are missing are reported
+# as skipped. Results are printed as JSON; --compare prints the ratio of
+# every metric to the results saved earlier, e.g. on another commit.
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from Engine import NS, PomodoroCycle, format_remain
+
+QUEUE_COUNTS = (4, 100, 1000)
+REPEAT = 5
+
+# Options that disable every optional subsystem of MainFrame
+QUIET_ARGS = {'show_icon': False, 'show_notify': False, 'control': False,
+              'history': False, 'resume': False, 'plugins': False}
+
+
+class SimulatedClock:
+    """Clock for PomodoroCycle that is moved forward by hand"""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+def measure(func, number):
+    """Returns median nanoseconds per call of func over REPEAT runs"""
+    runs = []
+    for i in range(REPEAT):
+        t_start = time.perf_counter_ns()
+        for j in range(number):
+            func()
+        runs.append((time.perf_counter_ns() - t_start) / number)
+    return statistics.median(runs)
+
+
+def bench_engine():
+    """PomodoroCycle tick and remain time formatting without GUI"""
+    clock = SimulatedClock()
+    cycle = PomodoroCycle(clock=clock)
+    cycle.load(10 ** 6, 1, 1, 1)
+    cycle.start()
+
+    def tick():
+        clock.now += NS
+        cycle.tick()
+        format_remain(cycle.get_remain())
+
+    return {'tick_ns': measure(tick, 100000)}
+
+
+def bench_queue():
+    """Cost of Start: loading phase plan and starting the first phase"""
+    results = {}
+    for count in QUEUE_COUNTS:
+        cycle = PomodoroCycle()
+
+        def start():
+            cycle.load(1500, 300, 1800, count)
+            cycle.next_phase()
+
+        results['start_{}_ns'.format(count)] = measure(start, 1000)
+    return results
+
+
+def _make_frame():
+    import wx
+    from MainFrame import MainFrame
+    from wxPomodoro import APP_NAME, APP_VERSION
+
+    app = wx.App()
+    frame = MainFrame(parent=None, app_creds=(APP_NAME, APP_VERSION), cl_args=QUIET_ARGS)
+    frame.Show()
+    return app, frame
+
+
+def bench_gui():
+    """PomodoroTimer.Notify with TimerLoop, Refresh and cycle start on a real frame"""
+    app, frame = _make_frame()
+    clock = SimulatedClock()
+    frame.cycle.clock = frame.cycle.countdown.clock = clock
+    results = {}
+
+    def queue_init():
+        frame.controller.start()
+        frame.timer.update()
+
+    for count in QUEUE_COUNTS:
+        frame.controller.durations = lambda: (1500, 300, 1800, count)
+        results['queue_init_{}_ns'.format(count)] = measure(queue_init, 100)
+
+    frame.controller.durations = lambda: (10 ** 6, 1, 1, 1)
+    queue_init()
+
+    def notify():
+        clock.now += NS
+        frame.timer.Notify()
+        app.ProcessPendingEvents()
+
+    results['notify_ns'] = measure(notify, 1000)
+    results['refresh_steady_ns'] = measure(frame.Refresh, 10000)
+
+    def refresh_second():
+        clock.now += NS
+        frame.cycle.tick()
+        frame.Refresh()
+
+    results['refresh_second_ns'] = measure(refresh_second, 1000)
+
+    frame.timer.Stop()
+    frame.Exit()
+    return results
+
+
+def bench_notify():
+    """Latency from show_action call to the worker thread, D-Bus excluded"""
+    from Notify import PomodoroNotify
+
+    notify = PomodoroNotify(app_name='benchmark')
+    shown = threading.Event()
+    latencies = []
+    t_queued = [0]
+
+    def show(kind, text='', urg=0):
+        latencies.append(time.perf_counter_ns() - t_queued[0])
+        shown.set()
+
+    notify._show_notify = show
+    calls = []
+    for i in range(200):
+        shown.clear()
+        t_queued[0] = time.perf_counter_ns()
+        notify.show_action('benchmark')
+        calls.append(time.perf_counter_ns() - t_queued[0])
+        shown.wait()
+    notify.close()
+    return {'call_ns': statistics.median(calls),
+            'dispatch_ns': statistics.median(latencies)}
+
+
+def bench_startup():
+    """Time-to-first-frame of a fresh interpreter"""
+    import wx  # noqa: F401, skip instead of failing in the child interpreter
+    from startup import first_frame_time
+    runs = [first_frame_time(QUIET_ARGS) for i in range(REPEAT)]
+    return {'first_frame_ns': statistics.median(runs) * NS}
+
+
+BENCHMARKS = {
+    'engine': bench_engine,
+    'queue': bench_queue,
+    'gui': bench_gui,
+    'notify': bench_notify,
+    'startup': bench_startup,
+}
+
+
+def run(names):
+    """Run benchmarks and returns results dict"""
+    results = {}
+    for name in names:
+        try:
+            results[name] = BENCHMARKS[name]()
+        except (ImportError, subprocess.CalledProcessError) as e:
+            results[name] = {'skipped': str(e)}
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline):
+    """Print ratio of every metric to baseline one"""
+    for name, metrics in sorted(results.items()):
+        for metric, value in sorted(metrics.items()):
+            old = baseline.get(name, {}).get(metric)
+            if isinstance(value, (int, float)) and isinstance(old, (int, float)) and old:
+                print('{:8} {:22} {:14.0f} {:6.2f}x'.format(name, metric, value, value / old),
+                      file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='wxPomodoro benchmarks')
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS),
+                        help='run only these benchmarks')
+    parser.add_argument('--output', help='write JSON results to file')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='print ratios to results saved by --output')
+    args = parser.parse_args()
+
+    report = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': run(args.only or sorted(BENCHMARKS)),
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report['results'], json.load(f)['results'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+wxPomodoro - Simple pomodoro timer based on wxPython Phoenix GUI
+
+The MIT License (MIT)
+Copyright (C) 2017 Georgy Komarov <jubnzv@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+# Startup benchmark: time-to-first-frame and import time breakdown.
+#
+# Usage:
+#     python benchmarks/startup.py [--runs N] [--no-icon] [--no-notify] [--output FILE]
+#
+# Results are printed as JSON, so they could be compared across commits.
+# Import time breakdown requires Python 3.7+ (`-X importtime`).
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Subsystems with persistent state are disabled, so the benchmark never
+# touches control socket, history or checkpoint of the running instance
+QUIET_ARGS = {'control': False, 'history': False, 'resume': False, 'plugins': False}
+
+# Script executed in a fresh interpreter: it builds MainFrame exactly as
+# wxPomodoro.start_app does and reports time when the first frame is shown.
+FIRST_FRAME_SCRIPT = '''
+import sys
+import time
+sys.path.insert(0, {root!r})
+import wx
+from MainFrame import MainFrame
+from wxPomodoro import APP_NAME, APP_VERSION
+
+def shown():
+    sys.stdout.write('%f\\n' % time.time())
+    sys.stdout.flush()
+    frame.Exit()
+
+app = wx.App()
+frame = MainFrame(parent=None, app_creds=(APP_NAME, APP_VERSION), cl_args={cl_args!r})
+frame.Show()
+wx.CallAfter(shown)
+app.MainLoop()
+'''
+
+
+def first_frame_time(cl_args):
+    """Returns seconds from interpreter launch to the first shown frame"""
+    script = FIRST_FRAME_SCRIPT.format(root=ROOT, cl_args=cl_args)
+    with tempfile.TemporaryDirectory() as tmp:
+        # User data is out of reach even if cl_args enable some subsystems
+        env = dict(os.environ, XDG_DATA_HOME=tmp, XDG_RUNTIME_DIR=tmp)
+        t_launch = time.time()
+        out = subprocess.check_output([sys.executable, '-c', script], cwd=ROOT, env=env)
+    return float(out.decode().split()[-1]) - t_launch
+
+
+def import_times(cl_args, top=15):
+    """Returns modules with the largest cumulative import time
+
+    Imports are measured with `python -X importtime`; optional subsystems
+    are imported the same way as MainFrame does when they are enabled.
+    """
+    modules = ['MainFrame']
+    if cl_args['show_icon']:
+        modules.append('TaskBarIcon')
+    if cl_args['show_notify']:
+        modules.append('Notify')
+    proc = subprocess.Popen([sys.executable, '-X', 'importtime', '-c',
+                             'import ' + ', '.join(modules)],
+                            cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    _, err = proc.communicate()
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args, stderr=err)
+
+    entries = []
+    for line in err.decode().splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        entries.append({'module': name.strip(),
+                        'self_us': int(self_us),
+                        'cumulative_us': int(cumulative_us)})
+    entries.sort(key=lambda e: e['cumulative_us'], reverse=True)
+    return entries[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='wxPomodoro startup benchmark')
+    parser.add_argument('--runs', type=int, default=5,
+                        help='number of launches to measure')
+    parser.add_argument('--no-icon', action='store_false', dest='show_icon')
+    parser.add_argument('--no-notify', action='store_false', dest='show_notify')
+    parser.add_argument('--output', help='write JSON results to file')
+    args = parser.parse_args()
+
+    cl_args = dict(QUIET_ARGS, show_icon=args.show_icon, show_notify=args.show_notify)
+    runs = [first_frame_time(cl_args) for i in range(args.runs)]
+    results = {
+        'cl_args': cl_args,
+        'first_frame_s': {'min': min(runs),
+                          'median': sorted(runs)[len(runs) // 2],
+                          'runs': runs},
+        'import_time': import_times(cl_args),
+    }
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    print(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Tests of the crash checkpoint"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from Checkpoint import Checkpoint
+from Engine import PHASE_POMODORO, PHASE_SHORT_BREAK, TIMER_STATUS, PomodoroCycle
+
+from tests.test_engine import SimulatedClock
+
+
+class CheckpointTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, 'app', 'checkpoint')
+        self.clock = SimulatedClock()
+        self.cycle = PomodoroCycle(clock=self.clock)
+        self.cycle.load(25, 5, 30, 2)
+        self.checkpoint = self.open()
+
+    def open(self):
+        checkpoint = Checkpoint(self.path, self.cycle)
+        self.addCleanup(checkpoint.close)
+        return checkpoint
+
+    def load(self):
+        """Returns state loaded by a new checkpoint, like on the next launch"""
+        return self.open().load()
+
+    def start(self):
+        self.cycle.next_phase()
+        self.checkpoint.record('start', self.cycle.current_task, self.cycle.get_duration())
+
+    def test_empty(self):
+        self.assertEqual(os.path.getsize(self.path), Checkpoint.SIZE)
+        self.assertIsNone(self.load())
+
+    def test_running(self):
+        self.start()
+        state = self.load()
+        self.assertEqual(state['durations'], (25, 5, 30, 2))
+        self.assertEqual(state['index'], 1)
+        self.assertTrue(state['running'])
+        self.assertAlmostEqual(state['remain'], 25, delta=1)
+        self.assertAlmostEqual(state['started'], time.time(), delta=1)
+
+    def test_paused(self):
+        self.start()
+        self.cycle.next_phase()
+        self.clock.advance(2)
+        self.cycle.pause()
+        self.checkpoint.record('pause', PHASE_SHORT_BREAK, 3)
+        state = self.load()
+        self.assertFalse(state['running'])
+        self.assertEqual(state['index'], 2)
+        self.assertEqual(state['remain'], 3)
+
+        cycle = PomodoroCycle(clock=self.clock)
+        cycle.load(*state['durations'])
+        cycle.restore(state['index'], state['remain'], state['running'])
+        self.assertEqual(cycle.current_task, PHASE_SHORT_BREAK)
+        self.assertEqual(cycle.get_status(), TIMER_STATUS['T_PAUSE'])
+
+    def test_paused_phase_never_expires(self):
+        self.start()
+        self.cycle.pause()
+        self.checkpoint.record('pause', PHASE_POMODORO, 25)
+        with mock.patch('Checkpoint.time.time', return_value=time.time() + 3600):
+            self.assertEqual(self.load()['remain'], 25)
+
+    def test_stale_deadline(self):
+        self.start()
+        with mock.patch('Checkpoint.time.time', return_value=time.time() + 26):
+            self.assertIsNone(self.load())
+        self.assertIsNone(self.load())  # Cleared, not resumed later either
+
+    def test_corrupted_crc(self):
+        self.start()
+        with open(self.path, 'r+b') as f:
+            f.seek(8)
+            byte = f.read(1)
+            f.seek(8)
+            f.write(bytes([byte[0] ^ 1]))
+        self.assertIsNone(self.load())
+
+    def test_torn_write(self):
+        self.start()
+        with open(self.path, 'r+b') as f:
+            f.seek(Checkpoint.FORMAT.size)
+            f.write(bytes(Checkpoint.CRC.size))
+        self.assertIsNone(self.load())
+
+    def test_clear_on_stop(self):
+        self.start()
+        self.cycle.stop()
+        self.checkpoint.record('stop', PHASE_POMODORO, 25)
+        self.assertIsNone(self.load())
+
+    def test_clear_on_last_finish(self):
+        self.start()
+        self.checkpoint.record('finish', PHASE_POMODORO, 25)
+        self.assertIsNotNone(self.load())  # The plan goes on
+        for i in range(3):
+            self.cycle.next_phase()
+        self.assertFalse(self.cycle.has_next())
+        self.checkpoint.record('finish', self.cycle.current_task, 30)
+        self.assertIsNone(self.load())
+
+    def test_started_kept_on_pause(self):
+        with mock.patch('Checkpoint.time.time', return_value=1000.0):
+            self.start()
+        self.cycle.pause()
+        self.checkpoint.record('pause', PHASE_POMODORO, 25)
+        self.assertEqual(self.load()['started'], 1000.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
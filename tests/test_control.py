@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""Tests of the control socket"""
+
+import errno
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import unittest
+
+from Control import ControlServer, send_command
+from Engine import NS, PHASE_POMODORO, PHASE_SHORT_BREAK, TIMER_STATUS, TickStats
+
+from tests.test_engine import SimulatedClock
+
+
+def wait_for(predicate, timeout=5):
+    """Wait until predicate becomes true, returns its last value"""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class ControlTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, 'test.sock')
+        self.clock = SimulatedClock()
+        self.commands = []
+        self.server = self.serve()
+
+    def serve(self):
+        server = ControlServer(self.path, dispatch=self.commands.append,
+                               tick_stats=TickStats(), clock=self.clock)
+        server.start()
+        self.addCleanup(server.close)
+        return server
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.addCleanup(sock.close)
+        sock.settimeout(5)
+        sock.connect(self.path)
+        return sock
+
+
+class CommandTest(ControlTestCase):
+
+    def test_status_is_extrapolated(self):
+        self.assertEqual(send_command(self.path, 'status'),
+                         {'status': None, 'task': None, 'remain': 0})
+        self.server.publish(TIMER_STATUS['T_RUN'], PHASE_POMODORO, 10 * NS)
+        self.clock.advance(3)
+        self.assertEqual(send_command(self.path, 'status'),
+                         {'status': 'Running', 'task': PHASE_POMODORO, 'remain': 7})
+        self.clock.advance(30)
+        self.assertEqual(send_command(self.path, 'status')['remain'], 0)
+
+    def test_paused_status(self):
+        self.server.publish(TIMER_STATUS['T_PAUSE'], PHASE_POMODORO, 10 * NS)
+        self.clock.advance(3)
+        self.assertEqual(send_command(self.path, 'status')['remain'], 10)
+
+    def test_dispatch(self):
+        self.assertEqual(send_command(self.path, 'pause'), {'ok': True})
+        self.assertEqual(send_command(self.path, 'show'), {'ok': True})
+        self.assertEqual(self.commands, ['pause', 'show'])
+
+    def test_unknown_command(self):
+        self.assertEqual(send_command(self.path, 'bogus'), {'error': 'unknown command: bogus'})
+        self.assertEqual(self.commands, [])
+
+    def test_debug(self):
+        self.assertEqual(send_command(self.path, 'debug')['ticks'], 0)
+
+    def test_pipelined_commands(self):
+        sock = self.connect()
+        sock.sendall(b'start\nstatus\n')
+        replies = sock.makefile('rb')
+        self.assertEqual(json.loads(replies.readline()), {'ok': True})
+        self.assertEqual(json.loads(replies.readline())['status'], None)
+        self.assertEqual(self.commands, ['start'])
+
+    def test_long_line_drops_client(self):
+        sock = self.connect()
+        sock.sendall(b'x' * (ControlServer.MAX_LINE + 1))
+        self.assertEqual(sock.recv(100), b'')
+
+    def test_already_running(self):
+        with self.assertRaises(OSError) as cm:
+            ControlServer(self.path, dispatch=self.commands.append).start()
+        self.assertEqual(cm.exception.errno, errno.EADDRINUSE)
+
+    def test_stale_socket_is_replaced(self):
+        self.server.close()
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(self.path)  # Left by crashed instance: nobody listens
+        stale.close()
+        self.serve()
+        self.assertEqual(send_command(self.path, 'pause'), {'ok': True})
+
+    def test_silent_owner_is_replaced(self):
+        self.server.close()
+        owner = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.addCleanup(owner.close)
+        owner.bind(self.path)
+        owner.listen(1)
+
+        def close_connection():
+            conn, _ = owner.accept()
+            conn.close()
+
+        thread = threading.Thread(target=close_connection)
+        thread.start()
+        self.serve()
+        thread.join()
+        self.assertEqual(send_command(self.path, 'status')['status'], None)
+
+
+class SubscribeTest(ControlTestCase):
+
+    def subscribe(self):
+        """Returns reader of events after the initial status line"""
+        sock = self.connect()
+        sock.sendall(b'subscribe\n')
+        events = sock.makefile('rb')
+        self.assertNotIn('event', json.loads(events.readline()))
+        self.assertTrue(wait_for(lambda: self.server.subscribers))
+        return sock, events
+
+    def test_event_kinds(self):
+        sock, events = self.subscribe()
+        publish = self.server.publish
+        publish(TIMER_STATUS['T_RUN'], PHASE_POMODORO, 10 * NS)
+        publish(TIMER_STATUS['T_RUN'], PHASE_POMODORO, 10 * NS - 1)  # Same second
+        publish(TIMER_STATUS['T_RUN'], PHASE_POMODORO, 9 * NS)
+        publish(TIMER_STATUS['T_PAUSE'], PHASE_POMODORO, 9 * NS)
+        publish(TIMER_STATUS['T_RUN'], PHASE_SHORT_BREAK, 5 * NS)
+        received = [json.loads(events.readline()) for i in range(4)]
+        self.assertEqual([(e['event'], e['status'], e['remain']) for e in received],
+                         [('phase', 'Running', 10), ('tick', 'Running', 9),
+                          ('status', 'Paused', 9), ('phase', 'Running', 5)])
+        self.assertEqual(received[-1]['task'], PHASE_SHORT_BREAK)
+        self.assertEqual(self.commands, ['subscribe'])
+
+    def test_fan_out(self):
+        subscribers = [self.subscribe() for i in range(3)]
+        self.server.publish(TIMER_STATUS['T_RUN'], PHASE_POMODORO, 10 * NS)
+        for sock, events in subscribers:
+            self.assertEqual(json.loads(events.readline())['event'], 'phase')
+
+    def test_nothing_sent_without_subscribers(self):
+        self.server.publish(TIMER_STATUS['T_RUN'], PHASE_POMODORO, 10 * NS)
+        self.assertFalse(self.server.outbox)
+
+    def test_closed_subscriber_is_removed(self):
+        sock, events = self.subscribe()
+        events.close()
+        sock.close()
+        self.assertTrue(wait_for(lambda: not self.server.subscribers))
+
+    def test_slow_subscriber_is_dropped(self):
+        self.subscribe()  # Never reads
+        for i in range(100000):
+            if not self.server.subscribers:
+                break
+            self.server.publish(TIMER_STATUS['T_RUN'], PHASE_POMODORO, i * NS)
+        self.assertTrue(wait_for(lambda: not self.server.subscribers))
+        self.assertEqual(send_command(self.path, 'status')['task'], PHASE_POMODORO)
+
+
+if __name__ == '__main__':
+    unittest.main()
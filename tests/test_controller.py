@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Tests of the controller shared by GUI and daemon"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from Controller import PomodoroController
+from Engine import NS, PHASE_LONG_BREAK, PHASE_POMODORO, PHASE_SHORT_BREAK, TIMER_STATUS
+from Events import Paused, PhaseFinished, PhaseStarted, Stopped, Tick
+
+from tests.test_engine import SimulatedClock
+
+
+class ControllerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = SimulatedClock()
+        self.controller = PomodoroController('test', durations=lambda: (10, 5, 30, 1),
+                                             clock=self.clock)
+        self.events = []
+        self.controller.bus.subscribe(self.events.append)
+
+    def transitions(self):
+        """Returns (event class, phase) of published transitions and clears them"""
+        events = [(type(e), e.phase) for e in self.events if type(e) is not Tick]
+        self.events[:] = []
+        return events
+
+    def test_tick_starts_next_phase(self):
+        self.controller.start()
+        self.clock.advance(10)
+        self.controller.tick()
+        self.assertEqual(self.transitions(), [(PhaseStarted, PHASE_POMODORO),
+                                              (PhaseFinished, PHASE_POMODORO),
+                                              (PhaseStarted, PHASE_LONG_BREAK)])
+        self.assertEqual(self.controller.cycle.get_status(), TIMER_STATUS['T_RUN'])
+
+    def test_end_of_cycle_stops(self):
+        self.controller.start()
+        self.clock.advance(10)
+        self.controller.tick()
+        self.clock.advance(30)
+        self.controller.tick()
+        self.controller.tick()  # Finish isn't published twice
+        self.assertEqual(self.transitions()[-1], (PhaseFinished, PHASE_LONG_BREAK))
+        self.assertEqual(self.controller.cycle.get_status(), TIMER_STATUS['T_STOP'])
+        self.assertFalse(self.controller.cycle.has_next())
+        self.assertEqual(self.controller.current_task, PHASE_LONG_BREAK)
+
+    def test_idle_tick(self):
+        self.controller.tick()
+        self.assertEqual([type(e) for e in self.events], [Tick])
+
+    def test_pause(self):
+        self.controller.start()
+        self.clock.advance(3)
+        self.controller.pause()
+        self.assertEqual(self.transitions()[-1], (Paused, PHASE_POMODORO))
+        self.assertEqual(self.controller.cycle.get_remain(), 7 * NS)
+
+    def test_pause_past_deadline(self):
+        self.controller.start()
+        self.clock.advance(60)  # Wakeup hasn't come yet, e.g. after suspend
+        self.controller.pause()
+        self.assertEqual(self.transitions(), [(PhaseStarted, PHASE_POMODORO),
+                                              (PhaseFinished, PHASE_POMODORO),
+                                              (PhaseStarted, PHASE_LONG_BREAK)])
+        self.assertEqual(self.controller.cycle.get_status(), TIMER_STATUS['T_RUN'])
+        self.assertEqual(self.controller.cycle.index, 2)
+
+    def test_skip_last_phase_stops(self):
+        self.controller.start()
+        self.controller.skip()
+        self.controller.skip()
+        self.assertEqual(self.transitions()[-1], (Stopped, PHASE_LONG_BREAK))
+
+    def test_command_ignored_in_wrong_status(self):
+        self.controller.command('pause')
+        self.controller.command('stop')
+        self.controller.command('skip')
+        self.assertEqual(self.transitions(), [])
+        self.controller.command('start')
+        self.controller.command('start')
+        self.assertEqual(self.transitions(), [(PhaseStarted, PHASE_POMODORO)])
+
+    def test_command_resumes_paused_phase(self):
+        self.controller.durations = lambda: (10, 5, 30, 2)
+        self.controller.command('start')
+        self.controller.command('skip')
+        self.controller.command('pause')
+        self.controller.command('start')
+        self.assertEqual(self.controller.current_task, PHASE_SHORT_BREAK)
+        self.assertEqual(self.controller.cycle.get_status(), TIMER_STATUS['T_RUN'])
+
+
+class DaemonTest(unittest.TestCase):
+
+    ARGS = {'pomodoro': 25, 'short_break': 5, 'long_break': 30, 'count': 4,
+            'show_notify': False, 'history': False, 'resume': False, 'plugins': False}
+
+    def setUp(self):
+        from Daemon import PomodoroDaemon
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        with mock.patch.dict(os.environ, XDG_RUNTIME_DIR=self.dir):
+            self.daemon = PomodoroDaemon('test', self.ARGS, self.loop)
+        self.addCleanup(self.daemon.close)
+        self.daemon.start()
+
+    def test_pause_past_deadline(self):
+        self.daemon.on_control('start')
+        countdown = self.daemon.cycle.countdown
+        countdown.deadline = self.daemon.cycle.clock() - 1  # Wakeup is late
+        self.daemon.on_control('pause')
+        self.assertEqual(self.daemon.controller.current_task, PHASE_SHORT_BREAK)
+        self.assertEqual(self.daemon.cycle.get_status(), TIMER_STATUS['T_RUN'])
+        self.assertIsNotNone(self.daemon.wakeup)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""Tests of the timer engine driven by a simulated clock"""
+
+import unittest
+
+from Engine import (MS, NS, PHASE_LONG_BREAK, PHASE_POMODORO, PHASE_SHORT_BREAK, TIMER_STATUS,
+                    Countdown, PomodoroCycle, TickStats, ceil_seconds, format_remain, phase_plan)
+
+
+class SimulatedClock:
+    """Clock that moves only when told to"""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += int(seconds * NS)
+
+
+class FormatTest(unittest.TestCase):
+
+    def test_ceil_seconds(self):
+        self.assertEqual(ceil_seconds(0), 0)
+        self.assertEqual(ceil_seconds(1), 1)
+        self.assertEqual(ceil_seconds(NS), 1)
+        self.assertEqual(ceil_seconds(NS + 1), 2)
+
+    def test_format_remain(self):
+        self.assertEqual(format_remain(0), '00:00:00')
+        self.assertEqual(format_remain(1), '00:00:01')
+        self.assertEqual(format_remain(1500 * NS), '00:25:00')
+        self.assertEqual(format_remain(3600 * NS), '01:00:00')
+        self.assertEqual(format_remain(25 * 3600 * NS + 61 * NS), '25:01:01')
+
+
+class PhasePlanTest(unittest.TestCase):
+
+    def test_plan(self):
+        self.assertEqual(list(phase_plan(25, 5, 30, 2)),
+                         [(PHASE_POMODORO, 25), (PHASE_SHORT_BREAK, 5),
+                          (PHASE_POMODORO, 25), (PHASE_LONG_BREAK, 30)])
+
+    def test_single_pomodoro(self):
+        self.assertEqual(list(phase_plan(25, 5, 30, 1)),
+                         [(PHASE_POMODORO, 25), (PHASE_LONG_BREAK, 30)])
+
+
+class CountdownTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = SimulatedClock()
+        self.countdown = Countdown(10, clock=self.clock)
+
+    def test_runs_to_finish(self):
+        self.countdown.start()
+        self.clock.advance(9.5)
+        self.assertEqual(self.countdown.tick(), TIMER_STATUS['T_RUN'])
+        self.assertEqual(self.countdown.get_remain(), NS // 2)
+        self.clock.advance(0.5)
+        self.countdown.tick()
+        self.assertIs(self.countdown.status, TIMER_STATUS['T_FINISH'])
+        self.assertEqual(self.countdown.get_remain(), 0)
+
+    def test_pause_keeps_remain(self):
+        self.countdown.start()
+        self.clock.advance(4)
+        self.countdown.pause()
+        self.assertEqual(self.countdown.get_status(), TIMER_STATUS['T_PAUSE'])
+        self.clock.advance(100)  # Time spent in pause doesn't count
+        self.countdown.start()
+        self.clock.advance(5)
+        self.countdown.tick()
+        self.assertEqual(self.countdown.get_remain(), 1 * NS)
+
+    def test_stop(self):
+        self.countdown.start()
+        self.clock.advance(3)
+        self.countdown.stop()
+        self.assertEqual(self.countdown.get_status(), TIMER_STATUS['T_STOP'])
+        self.countdown.start()  # Starts over
+        self.assertEqual(self.countdown.get_remain(), 10 * NS)
+
+    def test_next_change(self):
+        self.countdown.start()
+        self.clock.advance(0.25)
+        self.countdown.tick()
+        self.assertEqual(self.countdown.next_change(NS), 750 * MS)
+        self.assertEqual(self.countdown.next_change(60 * NS), 9750 * MS)
+        self.assertEqual(self.countdown.next_change(None), 9750 * MS)
+        self.clock.advance(0.75)
+        self.countdown.tick()
+        self.assertEqual(self.countdown.next_change(NS), NS)
+
+    def test_restore(self):
+        self.countdown.restore(2.5, running=False)
+        self.assertEqual(self.countdown.get_status(), TIMER_STATUS['T_PAUSE'])
+        self.assertEqual(self.countdown.get_remain(), 2500 * MS)
+        self.countdown.restore(2.5, running=True)
+        self.clock.advance(2.5)
+        self.countdown.tick()
+        self.assertIs(self.countdown.status, TIMER_STATUS['T_FINISH'])
+
+
+class PomodoroCycleTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = SimulatedClock()
+        self.cycle = PomodoroCycle(clock=self.clock)
+        self.cycle.load(25, 5, 30, 2)
+
+    def run_phase(self):
+        """Tick every second until the current phase ends"""
+        while self.cycle.tick() == TIMER_STATUS['T_RUN']:
+            self.clock.advance(1)
+
+    def test_walks_through_plan(self):
+        phases = [self.cycle.start()]
+        self.run_phase()
+        while self.cycle.has_next():
+            phases.append(self.cycle.next_phase())
+            self.run_phase()
+        self.assertEqual(phases, [PHASE_POMODORO, PHASE_SHORT_BREAK,
+                                  PHASE_POMODORO, PHASE_LONG_BREAK])
+        self.assertEqual(self.cycle.index, 4)
+        self.assertEqual(self.clock.now, (25 + 5 + 25 + 30) * NS)
+
+    def test_start_resumes_paused_phase(self):
+        self.cycle.start()
+        self.clock.advance(10)
+        self.cycle.pause()
+        self.assertEqual(self.cycle.start(), PHASE_POMODORO)
+        self.assertEqual(self.cycle.index, 1)
+        self.assertEqual(self.cycle.get_remain(), 15 * NS)
+
+    def test_stop_drops_plan(self):
+        self.cycle.start()
+        self.cycle.stop()
+        self.assertFalse(self.cycle.has_next())
+        self.assertIsNone(self.cycle.current_task)
+        self.assertEqual(self.cycle.get_status(), TIMER_STATUS['T_STOP'])
+
+    def test_restore(self):
+        self.cycle.restore(2, 3, running=True)
+        self.assertEqual(self.cycle.current_task, PHASE_SHORT_BREAK)
+        self.assertEqual(self.cycle.get_duration(), 5)
+        self.assertEqual(self.cycle.get_status(), TIMER_STATUS['T_RUN'])
+        self.clock.advance(3)
+        self.run_phase()
+        self.assertEqual(self.cycle.next_phase(), PHASE_POMODORO)
+        self.assertEqual(self.cycle.index, 3)
+
+    def test_restore_nothing_started(self):
+        self.cycle.restore(0, 0, running=False)
+        self.assertIsNone(self.cycle.current_task)
+        self.assertEqual(self.cycle.start(), PHASE_POMODORO)
+
+    def test_many_ticks(self):
+        self.cycle.load(10 ** 6, 1, 1, 1)
+        self.cycle.start()
+        for i in range(100000):
+            self.clock.advance(1)
+            self.assertEqual(self.cycle.tick(), TIMER_STATUS['T_RUN'])
+        self.assertEqual(self.cycle.get_remain(), (10 ** 6 - 100000) * NS)
+
+
+class TickStatsTest(unittest.TestCase):
+
+    def test_lateness(self):
+        stats = TickStats()
+        stats.tick(expected=NS, now=NS + 3 * MS)
+        stats.tick(expected=2 * NS, now=2 * NS + 1 * MS)
+        counters = stats.as_dict()
+        self.assertEqual(counters['ticks'], 2)
+        self.assertEqual(stats.late, 1 * MS)
+        self.assertAlmostEqual(counters['late_max'], 0.003)
+        self.assertAlmostEqual(counters['late_mean'], 0.002)
+
+
+if __name__ == '__main__':
+    unittest.main()
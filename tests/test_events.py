@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Tests of the timer event bus"""
+
+import unittest
+
+from Engine import NS, PHASE_POMODORO, TIMER_STATUS
+from Events import TRANSITIONS, EventBus, Paused, PhaseFinished, PhaseStarted, Resumed, Tick
+
+from tests.test_engine import SimulatedClock
+
+
+def event(cls):
+    return cls(PHASE_POMODORO, TIMER_STATUS['T_RUN'], 10 * NS, 10)
+
+
+class EventBusTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = SimulatedClock()
+        self.bus = EventBus(clock=self.clock)
+        self.received = {}
+
+    def subscribe(self, name, *types, **kwargs):
+        received = self.received[name] = []
+        self.bus.subscribe(lambda e: received.append(type(e)), *types, **kwargs)
+
+    def test_routing(self):
+        self.subscribe('all')
+        self.subscribe('start', PhaseStarted)
+        self.subscribe('pause', Paused, Resumed)
+        for cls in (PhaseStarted, Paused, Resumed, PhaseFinished, Tick):
+            self.bus.publish(event(cls))
+        self.assertEqual(self.received['all'],
+                         [PhaseStarted, Paused, Resumed, PhaseFinished, Tick])
+        self.assertEqual(self.received['start'], [PhaseStarted])
+        self.assertEqual(self.received['pause'], [Paused, Resumed])
+
+    def test_wants(self):
+        self.assertFalse(self.bus.wants(Tick))
+        self.subscribe('start', PhaseStarted)
+        self.assertTrue(self.bus.wants(PhaseStarted))
+        self.assertFalse(self.bus.wants(Tick))
+        self.subscribe('all')
+        self.assertTrue(all(self.bus.wants(cls) for cls in TRANSITIONS + (Tick,)))
+
+    def test_unsubscribe(self):
+        received = []
+        self.bus.subscribe(received.append, PhaseStarted)
+        self.bus.subscribe(received.append, Tick)
+        self.bus.unsubscribe(received.append)
+        self.bus.publish(event(PhaseStarted))
+        self.bus.publish(event(Tick))
+        self.assertEqual(received, [])
+        self.assertFalse(self.bus.wants(Tick))
+
+    def test_tick_throttling(self):
+        self.subscribe('every', Tick)
+        self.subscribe('minute', Tick, interval=60 * NS)
+        for i in range(121):
+            self.bus.publish(event(Tick))
+            self.clock.advance(1)
+        self.assertEqual(len(self.received['every']), 121)
+        self.assertEqual(len(self.received['minute']), 3)  # 0, 60 and 120 seconds
+
+    def test_transition_resets_throttling(self):
+        self.subscribe('minute', Tick, interval=60 * NS)
+        self.bus.publish(event(Tick))
+        self.clock.advance(10)
+        self.bus.publish(event(Tick))
+        self.bus.publish(event(Paused))  # Not subscribed, resets all the same
+        self.bus.publish(event(Tick))
+        self.assertEqual(self.received['minute'], [Tick, Tick])
+
+    def test_handlers_called_in_order(self):
+        order = []
+        self.bus.subscribe(lambda e: order.append(1), PhaseStarted)
+        self.bus.subscribe(lambda e: order.append(2))
+        self.bus.subscribe(lambda e: order.append(3), PhaseStarted, Tick)
+        self.bus.publish(event(PhaseStarted))
+        self.assertEqual(order, [1, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
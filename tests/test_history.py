@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Tests of the history database"""
+
+import io
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from Engine import PHASE_POMODORO, PHASE_SHORT_BREAK
+from History import SCHEMA, HistoryStore, day_of, pomodoros_per_label
+
+
+class HistoryStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, 'app', 'history.sqlite')
+
+    def store(self, label=''):
+        return HistoryStore(self.path, label=label, flush_interval=0)
+
+    def query(self, sql, *args):
+        conn = sqlite3.connect(self.path)
+        try:
+            return conn.execute(sql, args).fetchall()
+        finally:
+            conn.close()
+
+    def sessions(self):
+        return self.query('SELECT phase, label, duration, completed FROM sessions ORDER BY rowid')
+
+    def test_completed_session(self):
+        store = self.store(label='work')
+        store.record('start', PHASE_POMODORO, 1500)
+        store.record('finish', PHASE_POMODORO, 1500)
+        store.close()
+        self.assertEqual(self.sessions(), [(PHASE_POMODORO, 'work', 1500, 1)])
+        self.assertEqual(self.query('SELECT * FROM daily'), [(day_of(time.time()), 1, 1500)])
+
+    def test_interrupted_session(self):
+        store = self.store()
+        store.record('start', PHASE_POMODORO, 1500)
+        store.record('pause', PHASE_POMODORO, 1000)
+        store.record('stop', PHASE_POMODORO, 900)
+        store.record('start', PHASE_SHORT_BREAK, 300)
+        store.record('skip', PHASE_SHORT_BREAK, 300)
+        store.close()
+        self.assertEqual(self.sessions(), [(PHASE_POMODORO, '', 600, 0),
+                                           (PHASE_SHORT_BREAK, '', 0, 0)])
+        self.assertEqual(self.query('SELECT * FROM daily'), [])
+
+    def test_breaks_are_not_counted_daily(self):
+        store = self.store()
+        for phase, duration in ((PHASE_POMODORO, 1500), (PHASE_SHORT_BREAK, 300),
+                                (PHASE_POMODORO, 1500)):
+            store.record('start', phase, duration)
+            store.record('finish', phase, duration)
+        store.close()
+        self.assertEqual(self.query('SELECT pomodoros, seconds FROM daily'), [(2, 3000)])
+
+    def test_finish_without_start(self):
+        store = self.store()
+        store.record('finish', PHASE_POMODORO, 1500)
+        store.close()
+        self.assertEqual(self.sessions(), [])
+
+    def test_restore_continues_session(self):
+        store = self.store()
+        store.record('restore', PHASE_POMODORO, 1500, started=1000.0)
+        store.record('finish', PHASE_POMODORO, 1500)
+        store.close()
+        self.assertEqual(self.query('SELECT started, completed FROM sessions'), [(1000.0, 1)])
+
+    def test_daily_backfill(self):
+        os.makedirs(os.path.dirname(self.path))
+        conn = sqlite3.connect(self.path)
+        with conn:
+            for statement in SCHEMA:
+                conn.execute(statement)
+            day = time.mktime((2020, 5, 1, 12, 0, 0, 0, 0, -1))
+            conn.executemany('INSERT INTO sessions VALUES (?, ?, ?, ?, ?, ?)',
+                             [(day, day + 1500, PHASE_POMODORO, '', 1500, 1),
+                              (day, day + 1500, PHASE_POMODORO, '', 1500, 1),
+                              (day, day + 300, PHASE_SHORT_BREAK, '', 300, 1),
+                              (day, day + 100, PHASE_POMODORO, '', 100, 0)])
+        conn.close()
+        self.store().close()  # Tables are ready when the constructor returns
+        self.assertEqual(self.query('SELECT * FROM daily'), [('2020-05-01', 2, 3000)])
+
+    def test_pomodoros_per_label(self):
+        store = self.store(label='a')
+        store.record('start', PHASE_POMODORO, 10)
+        store.record('finish', PHASE_POMODORO, 10)
+        store.label = 'b'
+        for i in range(2):
+            store.record('start', PHASE_POMODORO, 20)
+            store.record('finish', PHASE_POMODORO, 20)
+        store.close()
+        self.assertEqual(pomodoros_per_label(self.path, since=0),
+                         [('a', 1, 10), ('b', 2, 40)])
+        self.assertEqual(pomodoros_per_label(self.path, since=time.time() + 1), [])
+
+    def test_failed_batch_is_dropped(self):
+        store = self.store()
+        os.unlink(self.path)
+        os.mkdir(self.path)  # Can't be opened as database
+        with mock.patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            store.record('start', PHASE_POMODORO, 10)
+            store.record('finish', PHASE_POMODORO, 10)
+            deadline = time.monotonic() + 5
+            while not store.lost and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertTrue(store.worker.is_alive())
+            store.close()
+        self.assertEqual(store.lost, 1)
+        self.assertIn('1 sessions are lost', stderr.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Tests of pomodoro statistics"""
+
+import datetime
+import os
+import shutil
+import tempfile
+import unittest
+
+from Engine import PHASE_POMODORO, PHASE_SHORT_BREAK
+from History import HistoryStore
+from Stats import PomodoroStats
+
+
+def days_ago(count):
+    return datetime.date.today() - datetime.timedelta(days=count)
+
+
+class PomodoroStatsTest(unittest.TestCase):
+
+    def test_empty(self):
+        stats = PomodoroStats()
+        self.assertEqual(stats.today(), (0, 0))
+        self.assertEqual(stats.streak(), 0)
+        self.assertEqual(stats.chart(3), [(days_ago(2), 0), (days_ago(1), 0), (days_ago(0), 0)])
+
+    def test_streak_up_to_today(self):
+        stats = PomodoroStats({days_ago(2): [1, 60], days_ago(1): [2, 120], days_ago(0): [3, 180]})
+        self.assertEqual(stats.streak(), 3)
+        self.assertEqual(stats.today(), (3, 180))
+
+    def test_streak_includes_today_before_first_pomodoro(self):
+        stats = PomodoroStats({days_ago(2): [1, 60], days_ago(1): [1, 60]})
+        self.assertEqual(stats.streak(), 2)
+
+    def test_streak_broken(self):
+        self.assertEqual(PomodoroStats({days_ago(2): [1, 60]}).streak(), 0)
+        stats = PomodoroStats({days_ago(5): [1, 60], days_ago(4): [1, 60], days_ago(1): [1, 60]})
+        self.assertEqual(stats.streak(), 1)
+
+    def test_record(self):
+        stats = PomodoroStats({days_ago(1): [1, 60]})
+        stats.record('finish', PHASE_POMODORO, 1500)
+        stats.record('finish', PHASE_SHORT_BREAK, 300)
+        stats.record('stop', PHASE_POMODORO, 100)
+        stats.record('finish', PHASE_POMODORO, 1500)
+        self.assertEqual(stats.today(), (2, 3000))
+        self.assertEqual(stats.streak(), 2)
+        self.assertEqual(stats.chart(2), [(days_ago(1), 1), (days_ago(0), 2)])
+
+
+class LoadTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, 'history.sqlite')
+
+    def test_missing_database(self):
+        self.assertEqual(PomodoroStats.load(self.path).today(), (0, 0))
+
+    def test_load_from_store(self):
+        store = HistoryStore(self.path, flush_interval=0)
+        for i in range(2):
+            store.record('start', PHASE_POMODORO, 1500)
+            store.record('finish', PHASE_POMODORO, 1500)
+        store.close()
+        stats = PomodoroStats.load(self.path)
+        self.assertEqual(stats.today(), (2, 3000))
+        self.assertEqual(stats.streak(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -25,6 +25,10 @@ OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
 import argparse
+import json
+import sys
+
+from Control import COMMANDS, instance_lock, send_command, socket_path, subscribe
 
 APP_VERSION = '0.1'
 APP_NAME = 'wxPomodoro'
@@ -33,30 +37,131 @@ def get_args():
     """Parse and returns command line arguments"""
     parser = argparse.ArgumentParser(description=APP_NAME+': Simple pomodoro timer')
 
+    parser.add_argument('command', nargs='?', choices=COMMANDS,
+                        help='send command to running instance and exit')
+
     parser.add_argument('--no-icon', action='store_false',
                         dest='show_icon', help='disable tray icon')
     parser.add_argument('--no-notify', action='store_false',
                         dest='show_notify', help='mute desktop notifications')
+    parser.add_argument('--notify-remain', type=int, default=0, metavar='MIN',
+                        dest='notify_remain',
+                        help='update "time remaining" notification every MIN minutes')
+    parser.add_argument('--no-ipc', action='store_false', dest='control',
+                        help='disable control socket')
+    parser.add_argument('--no-history', action='store_false', dest='history',
+                        help="don't record timer events to history log")
+    parser.add_argument('--no-plugins', action='store_false', dest='plugins',
+                        help="don't load installed plugins")
+    parser.add_argument('--no-resume', action='store_false', dest='resume',
+                        help="don't resume the cycle interrupted by crash")
+    parser.add_argument('--label', default='', help='task label stored in history')
+    parser.add_argument('--hook-start', action='append', default=[], metavar='CMD',
+                        dest='hook_start', help='run shell command when a phase starts')
+    parser.add_argument('--hook-finish', action='append', default=[], metavar='CMD',
+                        dest='hook_finish', help='run shell command when a phase finishes')
+    parser.add_argument('--hook-timeout', type=int, default=30, metavar='SEC',
+                        dest='hook_timeout',
+                        help='kill hook commands after SEC seconds (default: %(default)s)')
+    parser.add_argument('--metrics-port', type=int, metavar='PORT', dest='metrics_port',
+                        help='serve Prometheus metrics on localhost:PORT')
+    parser.add_argument('--metrics-file', metavar='FILE', dest='metrics_file',
+                        help='rewrite FILE with Prometheus metrics periodically')
+    parser.add_argument('--profile', nargs='?', const='-', metavar='FILE',
+                        help='profile the main loop and write report to FILE on exit '
+                             '(default: stderr)')
     parser.add_argument('-v', '--version', action='version',
                         version=APP_VERSION)
 
+    daemon = parser.add_argument_group('daemon mode')
+    daemon.add_argument('--daemon', action='store_true',
+                        help='run without GUI, control it via commands')
+    daemon.add_argument('--pomodoro', type=int, default=25, metavar='MIN',
+                        help='pomodoro duration (default: %(default)s)')
+    daemon.add_argument('--short-break', type=int, default=5, metavar='MIN',
+                        dest='short_break', help='short break duration (default: %(default)s)')
+    daemon.add_argument('--long-break', type=int, default=30, metavar='MIN',
+                        dest='long_break', help='long break duration (default: %(default)s)')
+    daemon.add_argument('--count', type=int, default=4, metavar='N',
+                        help='pomodoros to long break (default: %(default)s)')
+
     args = parser.parse_args()
+    if args.daemon and not args.control:
+        parser.error('--no-ipc: the daemon is controlled via its socket only')
     return vars(args)
 
+def run_command(command):
+    """Send command to running instance and print reply
+
+    It doesn't import wx, so scripts from WM keybindings return fast.
+
+    :returns: Exit code
+    """
+    path = socket_path(APP_NAME)
+    try:
+        if command == 'subscribe':
+            for event in subscribe(path):
+                print(json.dumps(event), flush=True)
+        else:
+            print(json.dumps(send_command(path, command)))
+    except OSError:
+        sys.stderr.write(APP_NAME + ' is not running\n')
+        return 1
+    except ValueError:
+        sys.stderr.write(APP_NAME + ' sent an invalid reply\n')
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
 def start_app(cl_args):
-    """Execute GUI application
+    """Execute GUI application or headless daemon
+
+    Only one instance could be running: the second one shows the frame of
+    the first one and exits.
 
     :param cl_args: Dict with command-line arguments
+    :returns: Exit code
     """
+    path = socket_path(APP_NAME)
+    try:
+        lock = instance_lock(path)
+    except OSError as e:
+        sys.stderr.write('Can\'t lock {}: {}\n'.format(APP_NAME, e))
+        return 1
+    if lock is None:
+        try:
+            send_command(path, 'show')
+        except (OSError, ValueError):
+            pass  # Owner is busy or its socket is disabled
+        sys.stderr.write(APP_NAME + ' is already running\n')
+        return 1
+
+    if cl_args['daemon']:
+        import Daemon
+        code = Daemon.run(APP_NAME, cl_args)
+        lock.close()
+        return code
+
     import wx
     from MainFrame import MainFrame
 
     app = wx.App()
     frame = MainFrame(parent=None, app_creds=(APP_NAME, APP_VERSION), cl_args=cl_args)
     frame.Show()
-    app.MainLoop()
+    if cl_args['profile']:
+        from Profile import Profiler
+        profiler = Profiler(cl_args['profile'])
+        frame.setProfiler(profiler)
+        profiler.run(app.MainLoop)
+    else:
+        app.MainLoop()
+    lock.close()
+    return 0
 
 
 if __name__ == '__main__':
     args = get_args()
-    start_app(cl_args=args)
+    if args['command']:
+        sys.exit(run_command(args['command']))
+    sys.exit(start_app(cl_args=args))